@@ -8,14 +8,25 @@
 #
 # Nome do grupo no Canvas: RA2_1
 
+import argparse
 import sys
 from pathlib import Path
 
-from src.RA1.functions.python.io_utils import lerArquivo
-from src.RA1.functions.python.exibirResultados import exibirResultados
+from src.RA1.functions.python.io_utils import iterarArquivo
+from src.RA1.functions.python.lexico_paralelo import tokenizarArquivoParalelo
+from src.RA1.functions.python.analisador_lexico import serializar_tokens
+from src.RA1.functions.python.tokens import Token, Tipo_de_Token, NAO_PARENTESE, juntar_listas_tokens, pares_de
+from src.RA1.functions.python.exibirResultados import exibirResultados, OpcoesExecucao
+from src.RA1.functions.python.memoria import PROFUNDIDADE_HISTORICO
+from src.RA1.functions.python.orcamento import Orcamento, MAX_ITERACOES
+from src.RA1.functions.python.incremental import EstadoIncremental
+from src.RA1.functions.python.subexpressoes import TabelaSubexpressoes
+from src.RA1.functions.python.pontos_controle import PontosDeControle, PontoDeControleInvalido
+from src.RA1.functions.python.semantica_avr import executarProgramaAVR, saidaSerialAVR
+from src.RA1.functions.python.perfil import PerfilExecucao
 from src.RA1.functions.assembly import gerarAssemblyMultiple, save_assembly, save_registers_inc
 from src.RA2.functions.python.gerarArvore import gerar_e_salvar_todas_arvores
-from src.RA2.functions.python.lerTokens import lerTokens, validarTokens, reconhecerToken
+from src.RA2.functions.python.lerTokens import validarTokens
 from src.RA2.functions.python.construirGramatica import imprimir_gramatica_completa
 from src.RA2.functions.python.construirTabelaLL1 import construirTabelaLL1
 from src.RA2.functions.python.parsear import parsear_todas_linhas
@@ -25,18 +36,62 @@ BASE_DIR    = Path(__file__).resolve().parent        # raiz do repo
 INPUTS_DIR  = BASE_DIR / "inputs" / "RA1"                       # raiz/inputs
 OUT_TOKENS  = BASE_DIR / "outputs" / "RA1" / "tokens" / "tokens_gerados.txt"
 OUT_ASM_DIR = BASE_DIR / "outputs" / "RA1" / "assembly"          # raiz/outputs/assembly
+OUT_ESTADO_DIR = BASE_DIR / "outputs" / "RA1" / "incremental"    # estado da execução incremental
+OUT_PONTOS_DIR = BASE_DIR / "outputs" / "RA1" / "pontos"         # pontos de controle da execução
+OUT_PERFIL_DIR = BASE_DIR / "outputs" / "RA1" / "perfil"         # perfis de execução (JSON)
 
 # garante pastas de saída
 OUT_ASM_DIR.mkdir(parents=True, exist_ok=True)
 OUT_TOKENS.parent.mkdir(parents=True, exist_ok=True)
 
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
+    parser = argparse.ArgumentParser(description="Analisa, executa e gera Assembly e árvores sintáticas de um arquivo RPN.")
+    parser.add_argument("arquivo", nargs="?", help="arquivo de teste (ex.: int/teste1.txt ou float/teste2.txt)")
+    parser.add_argument("-j", "--processos", type=int, default=1,
+                        help="processos para a análise léxica e a execução em paralelo (0 = todos os núcleos; padrão: 1)")
+    parser.add_argument("--otimizacoes", action="store_true",
+                        help="mostra as constantes dobradas e os ramos eliminados em cada linha")
+    parser.add_argument("--historico", type=int, default=PROFUNDIDADE_HISTORICO,
+                        help=f"resultados guardados para RES (0 = sem limite; padrão: {PROFUNDIDADE_HISTORICO})")
+    parser.add_argument("--nativo", action="store_true",
+                        help="traduz cada linha para uma função Python em vez de executar o bytecode "
+                             "(mais rápido em laços longos)")
+    parser.add_argument("--curto-circuito", action="store_true",
+                        help="não avalia o operando direito (entre parênteses) de && e || quando o esquerdo "
+                             "já decide o resultado")
+    parser.add_argument("--incremental", action="store_true",
+                        help="reaproveita os resultados da execução anterior do mesmo arquivo nas linhas "
+                             "cujo texto e entradas não mudaram")
+    parser.add_argument("--memoizar", action="store_true",
+                        help="compartilha as subexpressões repetidas entre as linhas e memoriza o valor das "
+                             "puras até uma de suas variáveis mudar")
+    parser.add_argument("--perfil", action="store_true",
+                        help="mede o tempo de execução de cada linha e conta as entradas e voltas de cada laço e "
+                             "os operadores executados; salva o JSON em outputs/RA1/perfil")
+    parser.add_argument("--avr", action="store_true",
+                        help="prevê a saída serial do Assembly gerado com a aritmética de 16 bits da placa "
+                             "e a salva em outputs/RA1/assembly/saida_prevista.txt")
+    parser.add_argument("--pontos-controle", type=int, metavar="N",
+                        help="grava o estado da execução (variáveis, histórico de RES, linha) a cada N linhas")
+    parser.add_argument("--retomar", type=int, metavar="LINHA",
+                        help="retoma a execução do último ponto de controle antes da linha LINHA "
+                             "(as linhas anteriores não são executadas nem geram tokens e Assembly)")
+    grupo_orcamento = parser.add_argument_group(
+        "orçamento de execução", "limites que interrompem a linha (ou a execução) com ERRO DE ORÇAMENTO")
+    grupo_orcamento.add_argument("--max-iteracoes", type=int, default=MAX_ITERACOES,
+                                 help=f"voltas de cada WHILE/FOR (0 = sem limite; padrão: {MAX_ITERACOES})")
+    grupo_orcamento.add_argument("--operacoes-linha", type=int, help="instruções executadas por linha")
+    grupo_orcamento.add_argument("--tempo-linha", type=float, help="segundos por linha")
+    grupo_orcamento.add_argument("--operacoes-total", type=int, help="instruções executadas no arquivo inteiro")
+    grupo_orcamento.add_argument("--tempo-total", type=float, help="segundos para o arquivo inteiro")
+    args = parser.parse_args()
+
+    if args.arquivo is None:
         print("ERRO -> Especificar caminho do arquivo de teste (ex.: int/teste1.txt ou float/teste2.txt)")
         sys.exit(1)
 
     # --- resolve caminho da entrada ---
-    arg = Path(sys.argv[1])
+    arg = Path(args.arquivo)
 
     # Ordem de prioridade para localizar arquivo:
     # 1. Caminho absoluto (se fornecido)
@@ -67,7 +122,13 @@ if __name__ == "__main__":
             print(f"  {i}. {caminho}")
         sys.exit(1)
 
-    operacoes_lidas = lerArquivo(str(entrada))
+    # Leitura em fluxo: as linhas são analisadas e executadas à medida que são lidas.
+    # Com mais de um processo, a tokenização é feita em blocos paralelos.
+    paralelo = args.processos != 1
+    if paralelo:
+        operacoes_lidas = tokenizarArquivoParalelo(entrada, args.processos or None)
+    else:
+        operacoes_lidas = iterarArquivo(str(entrada))
 
     # Exibe caminho relativo à raiz se possível (evita ValueError do relative_to)
     try:
@@ -79,8 +140,85 @@ if __name__ == "__main__":
     print(f"\nArquivo de teste: {mostrar}\n")
 
     # Executa a análise das expressões RPN
-    sucesso, linhas_processadas, linhas_com_erro = exibirResultados(operacoes_lidas, OUT_TOKENS)
+    # Os tokens classificados pelo RA1 são reaproveitados pelo Assembly e pelo RA2
+    tokens_ra1 = []
+    otimizacoes = [] if args.otimizacoes else None
+    try:
+        orcamento = Orcamento(args.max_iteracoes or None, args.operacoes_linha, args.tempo_linha,
+                              args.operacoes_total, args.tempo_total)
+    except ValueError as e:
+        print(e)
+        sys.exit(1)
+    estado = None
+    if args.incremental:
+        arquivo_estado = OUT_ESTADO_DIR / f"{entrada.stem}.estado"
+        estado = EstadoIncremental.carregar(arquivo_estado, (args.historico, orcamento.max_iteracoes,
+                                                             orcamento.operacoes_linha, orcamento.tempo_linha,
+                                                             args.curto_circuito))
+    pontos = retomada = None
+    if args.pontos_controle is not None or args.retomar is not None:
+        try:
+            pontos = PontosDeControle(OUT_PONTOS_DIR / f"{entrada.stem}.pontos",
+                                      args.pontos_controle or 1,
+                                      (args.historico, orcamento.max_iteracoes, orcamento.operacoes_linha,
+                                       orcamento.tempo_linha, orcamento.operacoes_execucao, orcamento.tempo_execucao,
+                                       args.curto_circuito))
+        except ValueError as e:
+            print(e)
+            sys.exit(1)
+        if args.retomar is not None:
+            retomada = pontos.anterior(args.retomar)
+            if retomada is None:
+                print(f"AVISO -> Nenhum ponto de controle antes da linha {args.retomar}. Executando desde o início.")
+            else:
+                print(f"Retomando depois da linha {retomada.linha}.")
+        if args.pontos_controle is None:
+            # Só retomada: os pontos de controle gravados ficam como estão
+            pontos = None
+    opcoes = OpcoesExecucao(profundidade_historico=args.historico or None, orcamento=orcamento, estado=estado,
+                            processos=args.processos or None, nativo=args.nativo,
+                            subexpressoes=TabelaSubexpressoes() if args.memoizar else None,
+                            pontos=pontos, retomada=retomada,
+                            perfil=PerfilExecucao() if args.perfil else None,
+                            curto_circuito=args.curto_circuito)
+    while True:
+        try:
+            sucesso, linhas_processadas, linhas_com_erro = exibirResultados(operacoes_lidas, OUT_TOKENS, tokens_ra1,
+                                                                            pre_tokenizado=paralelo,
+                                                                            otimizacoes=otimizacoes, opcoes=opcoes)
+            break
+        except PontoDeControleInvalido as e:
+            # Arquivo alterado antes do ponto de controle: executa desde o início (nenhuma
+            # linha foi executada, então só a leitura do arquivo é refeita)
+            print(e)
+            print("AVISO -> Executando desde o início.\n")
+            opcoes.retomada = None
+            operacoes_lidas = tokenizarArquivoParalelo(entrada, args.processos or None) if paralelo \
+                else iterarArquivo(str(entrada))
     print("\n--- FIM DOS TESTES ---\n")
+
+    if estado is not None:
+        estado.salvar(arquivo_estado)
+        print(f"Execução incremental: {estado.reaproveitadas} linha(s) reaproveitada(s), "
+              f"{estado.executadas} executada(s)\n")
+
+    if opcoes.subexpressoes is not None:
+        print(opcoes.subexpressoes.relatorio() + "\n")
+
+    if opcoes.perfil is not None:
+        print(opcoes.perfil.relatorio() + "\n")
+        arquivo_perfil = OUT_PERFIL_DIR / f"{entrada.stem}.json"
+        opcoes.perfil.salvarJSON(arquivo_perfil)
+        print(f"Perfil salvo em {arquivo_perfil}\n")
+
+    if otimizacoes is not None:
+        print("--- OTIMIZAÇÕES ---")
+        for numero, linha, simplificacoes in otimizacoes:
+            print(f"Linha {numero:02d}: {linha}")
+            for descricao in simplificacoes:
+                print(f"    {descricao}")
+        total = sum(len(simplificacoes) for _, _, simplificacoes in otimizacoes)
+        print(f"{total} simplificação(ões) em {len(otimizacoes)} linha(s)\n")
     
     # Se houve erros, interrompe a execução
     if not sucesso:
@@ -92,8 +230,9 @@ if __name__ == "__main__":
     # --- Geração de código assembly para todas as operações em um único arquivo ---
     codigo_assembly = []
 
-    # tokens foram salvos em raiz/outputs/tokens/tokens_gerados.txt
-    linhas = lerArquivo(str(OUT_TOKENS))
+    # Mesmos tokens salvos em raiz/outputs/tokens/tokens_gerados.txt, sem reler o arquivo
+    linhas_serializadas = [serializar_tokens(tokens) for tokens in tokens_ra1]
+    linhas_serializadas = [tokens for tokens in linhas_serializadas if tokens]
 
     # Salvar registers.inc em ambos os locais
     save_registers_inc(str(OUT_ASM_DIR / "registers.inc"))  # Em RA1
@@ -101,10 +240,9 @@ if __name__ == "__main__":
 
     # Preparar lista de todas as operações (filtrar parênteses para assembly)
     all_tokens = []
-    for linha in linhas:
-        tokens = linha.split()
+    for tokens in linhas_serializadas:
         # Filtrar parênteses apenas para geração de assembly (RA1 compatibility)
-        tokens_sem_parenteses = [token for token in tokens if token not in ['(', ')']]
+        tokens_sem_parenteses = [token.valor for token in tokens if token.tipo not in Tipo_de_Token.PARENTESES]
         all_tokens.append(tokens_sem_parenteses)
 
     # Gerar um único arquivo com todas as operações
@@ -126,6 +264,19 @@ if __name__ == "__main__":
     print("- Monitore a saída serial em 9600 baud para ver os resultados!")
     print("- Todas as operações serão executadas sequencialmente")
 
+    if args.avr:
+        # Mesmas operações do Assembly, com a aritmética de 16 bits sem sinal da placa
+        print("\n--- SAÍDA PREVISTA NO ARDUINO ---")
+        for numero, resultado in enumerate(executarProgramaAVR(all_tokens), 1):
+            if resultado is None:
+                print(f"Operação {numero:02d}: a placa trava (contador de power_int nunca zera)")
+            else:
+                print(f"Operação {numero:02d}: {resultado}")
+        arquivo_previsto = OUT_ASM_DIR / "saida_prevista.txt"
+        with open(arquivo_previsto, "w", encoding="utf-8", newline="") as f:
+            f.write(saidaSerialAVR(all_tokens))
+        print(f"Texto esperado na serial salvo em {arquivo_previsto}")
+
 
     ##################################################################
     # COMEÇO RA2
@@ -134,7 +285,9 @@ if __name__ == "__main__":
     # Leitura e validação dos tokens para análise sintática
     try:
         print("\n--- PROCESSAMENTO DE TOKENS PARA RA2 ---")
-        tokens_para_ra2 = lerTokens(str(OUT_TOKENS))
+        tokens_para_ra2 = juntar_listas_tokens(linhas_serializadas)
+        tokens_para_ra2.append(Token(Tipo_de_Token.FIM, "$"))
+        tokens_para_ra2.pares.append(NAO_PARENTESE)
         tokens_sao_validos = validarTokens(tokens_para_ra2)
         print(f"Tokens processados: {len(tokens_para_ra2)} tokens")
         print(f"Validação dos tokens: {'SUCESSO' if tokens_sao_validos else 'FALHOU'}")
@@ -169,63 +322,31 @@ if __name__ == "__main__":
     try:
         print("\n--- ANÁLISE SINTÁTICA COM PARSEAR ---")
         
-        # Lê linha por linha do arquivo tokens_gerados.txt
+        # Segmenta os tokens de cada linha em instruções (sem reclassificar os lexemas)
         tokens_por_linha = []
-        linhas_arquivo = lerArquivo(str(OUT_TOKENS))
         
-        def segmentar_linha_em_instrucoes(linha_texto):
+        def segmentar_linha_em_instrucoes(tokens_linha):
             """Segmenta uma linha em múltiplas instruções baseado em parênteses balanceados"""
             instrucoes = []
-            elementos = linha_texto.split()
+            pares = pares_de(tokens_linha)
+            fim = len(tokens_linha)
             i = 0
             
-            while i < len(elementos):
-                if elementos[i] == '(':
-                    # Encontra expressão balanceada
-                    instrucao_elementos = []
-                    nivel_parenteses = 0
-                    
-                    while i < len(elementos):
-                        elemento = elementos[i]
-                        instrucao_elementos.append(elemento)
-                        
-                        if elemento == '(':
-                            nivel_parenteses += 1
-                        elif elemento == ')':
-                            nivel_parenteses -= 1
-                            
-                        i += 1
-                        
-                        # Quando parênteses estão balanceados, temos uma instrução completa
-                        if nivel_parenteses == 0:
-                            break
-                    
-                    if instrucao_elementos:
-                        instrucoes.append(' '.join(instrucao_elementos))
+            while i < fim:
+                if tokens_linha[i].tipo == Tipo_de_Token.ABRE_PARENTESES:
+                    # Fechamento da expressão pela tabela de pares do analisador léxico
+                    fecha = pares[i]
+                    proximo = fecha + 1 if fecha >= 0 else fim
+                    instrucoes.append(tokens_linha[i:proximo])
+                    i = proximo
                 else:
                     i += 1
             
             return instrucoes
 
-        for linha_texto in linhas_arquivo:
-            linha_texto = linha_texto.strip()
-            if linha_texto and not linha_texto.startswith('#'):
-                # Segmenta linha em múltiplas instruções se necessário
-                instrucoes = segmentar_linha_em_instrucoes(linha_texto)
-                
-                for instrucao in instrucoes:
-                    # Processa cada instrução individualmente usando lerTokens
-                    tokens_linha = []
-                    elementos = instrucao.split()
-                    
-                    for elemento in elementos: 
-                        # Usa o reconhecerToken do lerTokens.py
-                        token = reconhecerToken(elemento, 1, 1)  # linha e coluna fictícias
-                        if token:
-                            tokens_linha.append(token)
-                    
-                    if tokens_linha:
-                        tokens_por_linha.append(tokens_linha)
+        for tokens_linha in linhas_serializadas:
+            # Segmenta linha em múltiplas instruções se necessário
+            tokens_por_linha.extend(segmentar_linha_em_instrucoes(tokens_linha))
         
         print(f"Analisando {len(tokens_por_linha)} linha(s) de tokens")
         
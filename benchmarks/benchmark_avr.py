@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+
+# Integrantes do grupo (ordem alfabética):
+# Nome Completo 1 - Breno Rossi Duarte
+# Nome Completo 2 - Francisco Bley Ruthes
+# Nome Completo 3 - Rafael Olivare Piveta
+# Nome Completo 4 - Stefan Benjamim Seixas Lourenço Rodrigues
+#
+# Nome do grupo no Canvas: RA2_1
+
+# Compara a previsão da saída da placa (semantica_avr.executarProgramaAVR) com uma
+# execução literal das rotinas do Assembly gerado, registrador por registrador
+# (divisão e resto por subtração repetida, multiplicação por produtos parciais de 8
+# bits, contador de power_int com dec/sbc e o carry deixado por multiply_int), em
+# programas aleatórios com números até 65535.
+# Uso: python benchmarks/benchmark_avr.py [programas]
+
+import sys
+import time
+import random
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from src.RA1.functions.python.semantica_avr import executarProgramaAVR
+
+class Literal:
+    # Registradores de 8 bits e a pilha na SRAM, como no código gerado
+    def __init__(self):
+        self.sram = bytearray(256)
+        self.stack_ptr = 0
+        self.carry = 0
+
+    def push(self, valor):
+        endereco = (self.stack_ptr << 1) & 0xFF
+        self.sram[endereco], self.sram[endereco + 1] = valor & 0xFF, valor >> 8
+        self.stack_ptr = (self.stack_ptr + 1) & 0xFF
+
+    def pop(self):
+        self.stack_ptr = (self.stack_ptr - 1) & 0xFF
+        endereco = (self.stack_ptr << 1) & 0xFF
+        return self.sram[endereco] | (self.sram[endereco + 1] << 8)
+
+    def multiply_int(self, a, b):
+        al, ah, bl, bh = a & 0xFF, a >> 8, b & 0xFF, b >> 8
+        produto = al * bl
+        r20, r21, r22 = produto & 0xFF, produto >> 8, 0
+        for produto in (al * bh, ah * bl):
+            soma = r21 + (produto & 0xFF)                       # add r21, r0
+            r21 = soma & 0xFF
+            r22 = (r22 + (produto >> 8) + (soma >> 8)) & 0xFF   # adc r22, r1
+        soma = r22 + ((ah * bh) & 0xFF)                         # add r22, r0
+        self.carry = soma >> 8
+        return r20 | (r21 << 8)
+
+    def divide_int(self, a, b):
+        if b == 0:
+            return 0xFFFF
+        quociente = 0
+        while a >= b:
+            a -= b
+            quociente += 1
+        return quociente
+
+    def modulo_int(self, a, b):
+        if b == 0:
+            return a
+        while a >= b:
+            a -= b
+        return a
+
+    def power_int(self, base, expoente):
+        if expoente == 0:
+            return 1
+        if expoente == 1:
+            return base
+        r22, r23 = (expoente - 1) & 0xFF, expoente >> 8      # dec r22 / sbc r23 (carry 0)
+        valor = base
+        vistos = set()
+        while r22 or r23:
+            if r22 == 0:
+                # Mesmo estado em que o contador já esteve: a placa trava
+                if (valor, r23) in vistos:
+                    return None
+                vistos.add((valor, r23))
+            valor = self.multiply_int(valor, base)
+            r22 = (r22 - 1) & 0xFF
+            r23 = (r23 - self.carry) & 0xFF
+        return valor
+
+    def executar(self, tokens):
+        sinal = lambda v: v - 0x10000 if v & 0x8000 else v
+        for token in tokens:
+            if token[0].isdigit():
+                self.push(int(float(token)) & 0xFFFF)
+                continue
+            b = self.pop()
+            if token == '!':
+                self.push(int(b == 0))
+                continue
+            a = self.pop()
+            if token == '+':
+                valor = (a + b) & 0xFFFF
+            elif token == '-':
+                valor = (a - b) & 0xFFFF
+            elif token == '*':
+                valor = self.multiply_int(a, b)
+            elif token in ('/', '|'):
+                valor = self.divide_int(a, b)
+            elif token == '%':
+                valor = self.modulo_int(a, b)
+            elif token == '^':
+                valor = self.power_int(a, b)
+                if valor is None:
+                    return None
+            elif token == '<':
+                valor = int(sinal(a) < sinal(b))
+            elif token == '>=':
+                valor = int(sinal(a) >= sinal(b))
+            elif token == '==':
+                valor = int(a == b)
+            else:
+                valor = int(a != 0 and b != 0)
+            self.push(valor)
+        return self.pop()
+
+def literal(operacoes):
+    maquina = Literal()
+    resultados = []
+    for tokens in operacoes:
+        resultados.append(maquina.executar(tokens))
+        if resultados[-1] is None:
+            break
+    return resultados
+
+def operacao_aleatoria(gerador):
+    # Expressão RPN válida ou com operandos a menos (a placa lê as sobras da pilha)
+    tokens = []
+    profundidade = 0
+    for _ in range(gerador.randint(1, 9)):
+        if profundidade < 2 or gerador.random() < 0.45:
+            tokens.append(str(gerador.choice([gerador.randint(0, 9), gerador.randint(0, 65535),
+                                              gerador.randint(0, 300)])))
+            profundidade += 1
+        else:
+            # Potências são raras: boa parte delas trava a placa
+            tokens.append('^' if gerador.random() < 0.02 else
+                          gerador.choice(['+', '-', '*', '/', '|', '%', '<', '>=', '==', '&&', '!']))
+            profundidade -= 0 if tokens[-1] == '!' else 1
+    if gerador.random() < 0.1:
+        tokens.append(gerador.choice(['+', '*']))
+    return tokens
+
+if __name__ == "__main__":
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    gerador = random.Random(16)
+    # Programas de 40 operações: depois de uma trava, a placa não executa mais nada
+    programas = [[operacao_aleatoria(gerador) for _ in range(40)] for _ in range(total)]
+
+    inicio = time.perf_counter()
+    esperados = [literal(operacoes) for operacoes in programas]
+    t_literal = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    previstos = [executarProgramaAVR(operacoes) for operacoes in programas]
+    t_previsto = time.perf_counter() - inicio
+    for operacoes, previsto, esperado in zip(programas, previstos, esperados):
+        if previsto != esperado:
+            posicao = next(i for i, (a, b) in enumerate(zip(previsto + [0], esperado + [0])) if a != b)
+            print(f"DIVERGÊNCIA na operação {posicao + 1} de {operacoes[:posicao + 1]}: "
+                  f"{previsto[posicao:posicao + 1]} (esperado {esperado[posicao:posicao + 1]})")
+            sys.exit(1)
+
+    executadas = sum(len(resultados) for resultados in esperados)
+    travados = sum(resultados[-1] is None for resultados in esperados)
+    print(f"{total} programas, {executadas} operações executadas, {travados} programa(s) travado(s):")
+    print(f"  rotinas literais:    {t_literal * 1000:9.2f} ms")
+    print(f"  executarProgramaAVR: {t_previsto * 1000:9.2f} ms   ganho {t_literal / t_previsto:.1f}x")
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+
+# Integrantes do grupo (ordem alfabética):
+# Nome Completo 1 - Breno Rossi Duarte
+# Nome Completo 2 - Francisco Bley Ruthes
+# Nome Completo 3 - Rafael Olivare Piveta
+# Nome Completo 4 - Stefan Benjamim Seixas Lourenço Rodrigues
+#
+# Nome do grupo no Canvas: RA2_1
+
+# Compara o interpretador por tokens (rpn_calc), o bytecode (compilarLinha) e as
+# funções nativas (compilarLinhaNativa) com e sem curto-circuito de && e || em
+# condições de IFELSE e WHILE cujo operando direito é uma subexpressão cara. Confere
+# que a memória e os resultados são os mesmos nos dois modos.
+# Uso: python benchmarks/benchmark_curto_circuito.py [repeticoes]
+
+import io
+import sys
+import time
+import contextlib
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from src.RA1.functions.python.analisador_lexico import analisar_linha
+from src.RA1.functions.python.rpn_calc import executarExpressao
+from src.RA1.functions.python.compilador import compilarLinha
+from src.RA1.functions.python.codigo_nativo import compilarLinhaNativa
+from src.RA1.functions.python.maquina_virtual import executarCodigo
+from src.RA1.functions.python.memoria import Memoria
+
+# Subexpressão cara usada como operando direito
+CARA = "((((A 2 ^) (A 3 ^) +) (A 7 *) /) (((A 1 +) 2 ^) (A 5 %) -) >)"
+
+# Cada programa começa com memória vazia; o operando esquerdo decide na maioria das voltas
+PROGRAMAS = {
+    "IFELSE com &&": ["(0 A)", f"(WHILE (A 1000 <)(((A 1 +) A)((IFELSE (((A 10 %) 0 ==) {CARA} &&)(1)(0)))))"],
+    "IFELSE com ||": ["(0 A)", f"(WHILE (A 1000 <)(((A 1 +) A)((IFELSE (((A 10 %) 0 !=) {CARA} ||)(1)(0)))))"],
+    "WHILE com ||": ["(0 A)", f"(WHILE ((A 990 <) {CARA} ||)(((A 1 +) A)))"],
+}
+
+def interpretar(curto_circuito, linhas):
+    memoria = Memoria()
+    saida = io.StringIO()
+    with contextlib.redirect_stdout(saida):
+        for tokens in linhas:
+            memoria.historico.adicionar(executarExpressao(tokens, memoria, curto_circuito=curto_circuito))
+    return memoria.como_dicionario(), list(memoria.historico), saida.getvalue()
+
+def compilado(compilar):
+    def rodar(curto_circuito, linhas):
+        memoria = Memoria()
+        for tokens in linhas:
+            codigo = compilar(tokens, simbolos=memoria.simbolos, curto_circuito=curto_circuito)
+            memoria.historico.adicionar(executarCodigo(codigo, memoria))
+        return memoria.como_dicionario(), list(memoria.historico)
+    return rodar
+
+MODOS = {
+    "interpretador": interpretar,
+    "bytecode": compilado(compilarLinha),
+    "--nativo": compilado(compilarLinhaNativa),
+}
+
+def medir(rodar, curto_circuito, linhas, repeticoes):
+    melhor = float('inf')
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        rodar(curto_circuito, linhas)
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor
+
+if __name__ == "__main__":
+    repeticoes = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    for nome, programa in PROGRAMAS.items():
+        linhas = [analisar_linha(linha) for linha in programa]
+
+        print(f"{nome}:")
+        for modo, rodar in MODOS.items():
+            # Sem atribuições nos operandos pulados, os dois modos deixam a mesma memória
+            if rodar(False, linhas) != rodar(True, linhas):
+                print(f"DIVERGÊNCIA ({modo}) no programa {nome}: {programa}")
+                sys.exit(1)
+
+            t_completo = medir(rodar, False, linhas, repeticoes)
+            t_curto = medir(rodar, True, linhas, repeticoes)
+            print(f"  {modo:<13} avaliação completa: {t_completo * 1000:8.2f} ms   curto-circuito: "
+                  f"{t_curto * 1000:8.2f} ms   ganho {t_completo / t_curto:.1f}x")
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+
+# Integrantes do grupo (ordem alfabética):
+# Nome Completo 1 - Breno Rossi Duarte
+# Nome Completo 2 - Francisco Bley Ruthes
+# Nome Completo 3 - Rafael Olivare Piveta
+# Nome Completo 4 - Stefan Benjamim Seixas Lourenço Rodrigues
+#
+# Nome do grupo no Canvas: RA2_1
+
+# Mede exibirResultados com execução paralela das linhas independentes em um programa
+# largo (muitos blocos com variáveis próprias) para diferentes números de processos.
+# Uso: python benchmarks/benchmark_execucao_paralela.py [quantidade_de_blocos]
+
+import io
+import os
+import sys
+import time
+import tempfile
+import contextlib
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from src.RA1.functions.python.exibirResultados import exibirResultados, OpcoesExecucao
+
+# Cada bloco só usa as próprias variáveis; o último lê o resultado da linha anterior
+BLOCO = [
+    "({n} A{n})",
+    "(FOR (1)(900)(1)(((A{n} 1.0001 *) A{n})((A{n} 3 %) B{n})))",
+    "(0 C{n})",
+    "(WHILE (C{n} 900 <)(((C{n} 1 +) C{n})((IFELSE ((C{n} 2 %) 0 ==)(B{n} C{n} +)(B{n} C{n} -)) D{n})))",
+    "((D{n} (1 RES) +) E{n})",
+]
+
+def gerar_programa(blocos: int) -> list[str]:
+    return [linha.format(n=n) for n in range(blocos) for linha in BLOCO]
+
+def rodar(linhas, arquivo_tokens, processos):
+    saida = io.StringIO()
+    inicio = time.perf_counter()
+    with contextlib.redirect_stdout(saida):
+        exibirResultados(linhas, arquivo_tokens, opcoes=OpcoesExecucao(processos=processos))
+    return time.perf_counter() - inicio, saida.getvalue()
+
+if __name__ == "__main__":
+    blocos = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    linhas = gerar_programa(blocos)
+
+    with tempfile.TemporaryDirectory() as pasta:
+        arquivo_tokens = Path(pasta) / "tokens.txt"
+        print(f"{len(linhas)} linhas em {blocos} blocos independentes ({os.cpu_count()} núcleo(s)):")
+        t_base, esperado = rodar(linhas, arquivo_tokens, 1)
+        print(f"  sequencial:      {t_base:7.2f}s")
+        processos = 2
+        while processos <= max(2, os.cpu_count() or 1):
+            tempo, obtido = rodar(linhas, arquivo_tokens, processos)
+            if obtido != esperado:
+                print("DIVERGÊNCIA entre a execução paralela e a sequencial")
+                sys.exit(1)
+            print(f"  {processos:2d} processo(s):  {tempo:7.2f}s  ganho {t_base / tempo:.1f}x")
+            processos *= 2
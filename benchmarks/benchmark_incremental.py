@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+
+# Integrantes do grupo (ordem alfabética):
+# Nome Completo 1 - Breno Rossi Duarte
+# Nome Completo 2 - Francisco Bley Ruthes
+# Nome Completo 3 - Rafael Olivare Piveta
+# Nome Completo 4 - Stefan Benjamim Seixas Lourenço Rodrigues
+#
+# Nome do grupo no Canvas: RA2_1
+
+# Ciclo editar e reexecutar: um programa grande é executado uma vez, uma linha é
+# alterada e o programa roda de novo do zero e com incremental.EstadoIncremental
+# (estado da primeira execução gravado em disco e lido de volta).
+# Uso: python benchmarks/benchmark_incremental.py [quantidade_de_linhas]
+
+import io
+import sys
+import time
+import random
+import tempfile
+import contextlib
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from src.RA1.functions.python.exibirResultados import exibirResultados, OpcoesExecucao
+from src.RA1.functions.python.incremental import EstadoIncremental
+
+# Cada bloco usa as próprias variáveis e o resultado da linha anterior
+BLOCO = [
+    "({valor} A{n})",
+    "(FOR (0)(40)(1)(((A{n} 1.5 +) A{n})((A{n} 2 *) B{n})))",
+    "(0 C{n})",
+    "(WHILE (C{n} 25 <)(((C{n} 1 +) C{n})((IFELSE ((C{n} 2 %) 0 ==)(B{n} C{n} +)(B{n} C{n} -)) D{n})))",
+    "((D{n} (1 RES) +) E{n})",
+]
+
+def gerar_programa(quantidade: int) -> list[str]:
+    sorteio = random.Random(0)
+    linhas = []
+    n = 0
+    while len(linhas) < quantidade:
+        valor = sorteio.randint(1, 100)
+        linhas.extend(linha.format(n=n, valor=valor) for linha in BLOCO)
+        n += 1
+    return linhas[:quantidade]
+
+def rodar(linhas, arquivo_tokens, estado=None):
+    saida = io.StringIO()
+    inicio = time.perf_counter()
+    with contextlib.redirect_stdout(saida):
+        exibirResultados(linhas, arquivo_tokens, opcoes=OpcoesExecucao(estado=estado))
+    return time.perf_counter() - inicio, saida.getvalue()
+
+if __name__ == "__main__":
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    linhas = gerar_programa(quantidade)
+
+    with tempfile.TemporaryDirectory() as pasta:
+        arquivo_tokens = Path(pasta) / "tokens.txt"
+        arquivo_estado = Path(pasta) / "programa.estado"
+
+        estado = EstadoIncremental()
+        t_primeira, _ = rodar(linhas, arquivo_tokens, estado)
+        estado.salvar(arquivo_estado)
+
+        # Altera o valor inicial de um bloco no meio do programa
+        meio = (len(linhas) // 2) // len(BLOCO) * len(BLOCO)
+        linhas[meio] = "(7 A{})".format(meio // len(BLOCO))
+
+        t_completa, esperado = rodar(linhas, arquivo_tokens)
+        inicio = time.perf_counter()
+        estado = EstadoIncremental.carregar(arquivo_estado)
+        t_carregar = time.perf_counter() - inicio
+        t_incremental, obtido = rodar(linhas, arquivo_tokens, estado)
+
+    if obtido != esperado:
+        print("DIVERGÊNCIA entre a execução incremental e a completa")
+        sys.exit(1)
+
+    print(f"{quantidade} linhas, 1 alterada:")
+    print(f"  primeira execução (gravando o estado): {t_primeira * 1000:9.2f} ms")
+    print(f"  reexecução completa:                   {t_completa * 1000:9.2f} ms")
+    print(f"  reexecução incremental:                {(t_carregar + t_incremental) * 1000:9.2f} ms "
+          f"(leitura do estado: {t_carregar * 1000:.2f} ms)")
+    print(f"  linhas reaproveitadas: {estado.reaproveitadas}, executadas: {estado.executadas}")
+    print(f"  ganho:                                 {t_completa / (t_carregar + t_incremental):9.1f}x")
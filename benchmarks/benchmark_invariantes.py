@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+
+# Integrantes do grupo (ordem alfabética):
+# Nome Completo 1 - Breno Rossi Duarte
+# Nome Completo 2 - Francisco Bley Ruthes
+# Nome Completo 3 - Rafael Olivare Piveta
+# Nome Completo 4 - Stefan Benjamim Seixas Lourenço Rodrigues
+#
+# Nome do grupo no Canvas: RA2_1
+
+# Compara WHILE e FOR compilados com as subexpressões invariantes calculadas antes do
+# laço (compilarLinha, com icarInvariantes) e o mesmo bytecode sem esse passo, que
+# avalia tudo de novo a cada volta, na máquina virtual e com --nativo. Confere que
+# resultados, variáveis e operações gastas do orçamento são os mesmos.
+# Uso: python benchmarks/benchmark_invariantes.py [voltas]
+
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from src.RA1.functions.python.compilador import compilarLinha, construirArvore, otimizarArvore, gerarBytecode
+from src.RA1.functions.python.codigo_nativo import compilarLinhaNativa, fonteNativa, funcaoNativa
+from src.RA1.functions.python.maquina_virtual import executarCodigo
+from src.RA1.functions.python.memoria import Memoria
+from src.RA1.functions.python.orcamento import Orcamento
+from src.RA1.functions.python.validarExpressao import analisarEValidar
+
+def lacos(voltas):
+    return [
+        # Condição com limite invariante; corpo com produto e quociente de variáveis fixas
+        f"(WHILE (I ((N {voltas} *) 1 -) <)(((I 1 +) I)((((X Y *) (X Y -) |) (I 2 %) +) Z)))",
+        # Corpo com potências e somas que só dependem de A, B, C e D
+        f"(FOR (0)({voltas})(1)(((K ((A B *) (C D +) |) +) K)(((((A 2 ^) (B 3 ^) +) (C D *) -) K *) S)))",
+        # Laço sem nada invariante: só o contador do FOR muda
+        f"(FOR (0)({voltas})(1)(((P 3 +) P)(((P Q +) 7 %) Q)))",
+    ]
+
+VALORES = {'I': 0.0, 'N': 1.0, 'X': 7.5, 'Y': 2.5, 'K': 0.0, 'A': 1.5, 'B': 2.0, 'C': 3.25, 'D': 0.75,
+           'P': 0.0, 'Q': 1.0}
+
+def semInvariantes(tokens, simbolos, nativo):
+    # O mesmo caminho de compilarLinha/compilarLinhaNativa, sem icarInvariantes
+    arvore = otimizarArvore(construirArvore(tokens))
+    codigo = gerarBytecode(arvore, simbolos)
+    if nativo:
+        codigo.nativo = funcaoNativa(fonteNativa(arvore, codigo))
+    return codigo
+
+def medir(compilar, programa):
+    memoria = Memoria()
+    for nome, valor in VALORES.items():
+        memoria[nome] = valor
+    orcamento = Orcamento()
+    codigos = [compilar(tokens, memoria.simbolos) for tokens in programa]
+    inicio = time.perf_counter()
+    resultados = [executarCodigo(codigo, memoria, orcamento) for codigo in codigos]
+    return time.perf_counter() - inicio, (resultados, memoria.como_dicionario(), orcamento.operacoes_usadas)
+
+if __name__ == "__main__":
+    voltas = int(sys.argv[1]) if len(sys.argv) > 1 else 900
+    linhas = lacos(voltas)
+    programa = [analisarEValidar(linha)[1] for linha in linhas]
+
+    print(f"{len(linhas)} laços de {voltas} voltas:")
+    for rotulo, nativo, com in (("bytecode", False, lambda t, s: compilarLinha(t, simbolos=s)),
+                                ("--nativo", True, lambda t, s: compilarLinhaNativa(t, simbolos=s))):
+        t_sem, esperado = medir(lambda t, s: semInvariantes(t, s, nativo), programa)
+        t_com, obtido = medir(com, programa)
+        if obtido != esperado:
+            print(f"DIVERGÊNCIA ({rotulo}): {obtido} (esperado {esperado})")
+            sys.exit(1)
+        print(f"  {rotulo:<9} sem pré-cálculo: {t_sem * 1000:9.2f} ms   com pré-cálculo: {t_com * 1000:9.2f} ms"
+              f"   ganho {t_sem / t_com:.1f}x")
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+
+# Integrantes do grupo (ordem alfabética):
+# Nome Completo 1 - Breno Rossi Duarte
+# Nome Completo 2 - Francisco Bley Ruthes
+# Nome Completo 3 - Rafael Olivare Piveta
+# Nome Completo 4 - Stefan Benjamim Seixas Lourenço Rodrigues
+#
+# Nome do grupo no Canvas: RA2_1
+
+# Compara o analisador léxico por estados (caractere a caractere) com o modo tabela.
+# Uso: python benchmarks/benchmark_lexico.py [arquivo_de_entrada] [repeticoes]
+
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from src.RA1.functions.python.io_utils import lerArquivo
+from src.RA1.functions.python.analisador_lexico import Analisador_Lexico, analisar_linha
+
+def medir(funcao, linhas, repeticoes):
+    melhor = float('inf')
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        for linha in linhas:
+            funcao(linha)
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor
+
+def por_estados(linha):
+    return Analisador_Lexico(linha).analise()
+
+if __name__ == "__main__":
+    arquivo = Path(sys.argv[1]) if len(sys.argv) > 1 else BASE_DIR / "teste1.txt"
+    repeticoes = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    # Replica o arquivo até ~1 MB para simular entradas grandes
+    base = [linha for linha in lerArquivo(str(arquivo)) if not linha.startswith('#')]
+    tamanho = sum(len(linha) + 1 for linha in base) or 1
+    linhas = base * max(1, (1 << 20) // tamanho)
+
+    # Os dois modos precisam produzir exatamente a mesma sequência de tokens
+    for linha in base:
+        try:
+            esperado = [(t.tipo, t.valor) for t in por_estados(linha)]
+        except ValueError as e:
+            esperado = str(e)
+        try:
+            obtido = [(t.tipo, t.valor) for t in analisar_linha(linha)]
+        except ValueError as e:
+            obtido = str(e)
+        if esperado != obtido:
+            print(f"DIVERGÊNCIA na linha '{linha}':\n  estados: {esperado}\n  tabela:  {obtido}")
+            sys.exit(1)
+
+    # Linhas inválidas não entram na medição
+    validas = []
+    for linha in linhas:
+        try:
+            por_estados(linha)
+            validas.append(linha)
+        except ValueError:
+            pass
+
+    total_bytes = sum(len(linha) + 1 for linha in validas)
+    t_estados = medir(por_estados, validas, repeticoes)
+    t_tabela = medir(analisar_linha, validas, repeticoes)
+
+    print(f"Entrada: {arquivo.name} replicada em {len(validas)} linhas ({total_bytes / 1024:.0f} KiB)")
+    print(f"  estados: {t_estados:.3f}s ({total_bytes / t_estados / 1e6:.2f} MB/s)")
+    print(f"  tabela:  {t_tabela:.3f}s ({total_bytes / t_tabela / 1e6:.2f} MB/s)")
+    print(f"  ganho:   {t_estados / t_tabela:.1f}x")
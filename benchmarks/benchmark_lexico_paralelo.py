@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+
+# Integrantes do grupo (ordem alfabética):
+# Nome Completo 1 - Breno Rossi Duarte
+# Nome Completo 2 - Francisco Bley Ruthes
+# Nome Completo 3 - Rafael Olivare Piveta
+# Nome Completo 4 - Stefan Benjamim Seixas Lourenço Rodrigues
+#
+# Nome do grupo no Canvas: RA2_1
+
+# Mede a análise léxica paralela por blocos com diferentes números de processos.
+# Uso: python benchmarks/benchmark_lexico_paralelo.py [arquivo_de_entrada] [linhas]
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from src.RA1.functions.python.io_utils import lerArquivo
+from src.RA1.functions.python.lexico_paralelo import tokenizarArquivoParalelo, TAMANHO_BLOCO_PADRAO
+
+def medir(caminho, processos):
+    inicio = time.perf_counter()
+    total = sum(1 for _ in tokenizarArquivoParalelo(caminho, processos))
+    return time.perf_counter() - inicio, total
+
+if __name__ == "__main__":
+    arquivo = Path(sys.argv[1]) if len(sys.argv) > 1 else BASE_DIR / "teste1.txt"
+    num_linhas = int(sys.argv[2]) if len(sys.argv) > 2 else 300_000
+
+    # Gera um arquivo grande replicando as linhas da entrada
+    base = lerArquivo(str(arquivo))
+    with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False, encoding='utf-8') as tmp:
+        for i in range(num_linhas):
+            tmp.write(base[i % len(base)] + '\n')
+        caminho = tmp.name
+
+    try:
+        tamanho = os.path.getsize(caminho)
+        print(f"Entrada: {num_linhas} linhas ({tamanho / (1 << 20):.1f} MiB, blocos de {TAMANHO_BLOCO_PADRAO >> 10} KiB)")
+
+        # A ordem e o conteúdo das linhas não podem depender do número de processos
+        esperado = [(linha, valida, erro) for linha, valida, _, erro in tokenizarArquivoParalelo(caminho, 1)]
+        paralelo = [(linha, valida, erro) for linha, valida, _, erro in tokenizarArquivoParalelo(caminho, os.cpu_count())]
+        if esperado != paralelo:
+            print("DIVERGÊNCIA entre a análise sequencial e a paralela")
+            sys.exit(1)
+
+        t_base, _ = medir(caminho, 1)
+        processos = 1
+        while processos <= (os.cpu_count() or 1):
+            tempo, total = medir(caminho, processos)
+            print(f"  {processos:2d} processo(s): {tempo:.2f}s  {total} linhas  ganho {t_base / tempo:.1f}x")
+            processos *= 2
+    finally:
+        os.unlink(caminho)
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+
+# Integrantes do grupo (ordem alfabética):
+# Nome Completo 1 - Breno Rossi Duarte
+# Nome Completo 2 - Francisco Bley Ruthes
+# Nome Completo 3 - Rafael Olivare Piveta
+# Nome Completo 4 - Stefan Benjamim Seixas Lourenço Rodrigues
+#
+# Nome do grupo no Canvas: RA2_1
+
+# Compara uma varredura de parâmetros feita com executarExpressao (uma memória por
+# conjunto de valores) com avaliacao_lote.avaliarEmLote (colunas NumPy).
+# Uso: python benchmarks/benchmark_lote.py [quantidade_de_valores]
+
+import random
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from src.RA1.functions.python.analisador_lexico import analisar_linha
+from src.RA1.functions.python.rpn_calc import executarExpressao
+from src.RA1.functions.python.avaliacao_lote import avaliarEmLote, np
+
+EXPRESSOES = {
+    "aritmética": "(((A B *) (C 2 ^) +) (A 3 /) -)",
+    "divisões": "((A B |) (C 7 %) +)",
+    "comparação e lógica": "(((A B <) (C 0 >=) &&) ((A C ==) !) ||)",
+    "IFELSE": "(IFELSE ((A B >))((A B -) C *)((B A |) 2 ^))",
+}
+
+def varrer(tokens, colunas, quantidade):
+    resultados = []
+    for i in range(quantidade):
+        memoria = {nome: valores[i] for nome, valores in colunas.items()}
+        resultados.append(executarExpressao(tokens, memoria))
+    return resultados
+
+if __name__ == "__main__":
+    if np is None:
+        print("NumPy não está instalado: avaliarEmLote executa posição a posição")
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    sorteio = random.Random(0)
+    colunas = {nome: [round(sorteio.uniform(-50, 50), 2) for _ in range(quantidade)] for nome in "ABC"}
+
+    for nome, linha in EXPRESSOES.items():
+        tokens = analisar_linha(linha)
+
+        inicio = time.perf_counter()
+        esperado = varrer(tokens, colunas, quantidade)
+        t_laco = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        obtido = avaliarEmLote(tokens, colunas)
+        t_lote = time.perf_counter() - inicio
+
+        if [repr(float(v)) for v in obtido] != [repr(float(v)) for v in esperado]:
+            print(f"DIVERGÊNCIA na expressão {nome}: {linha}")
+            sys.exit(1)
+
+        print(f"{nome} ({quantidade} valores):")
+        print(f"  executarExpressao: {t_laco * 1000:9.2f} ms")
+        print(f"  avaliarEmLote:     {t_lote * 1000:9.2f} ms")
+        print(f"  ganho:             {t_laco / t_lote:9.1f}x")
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+
+# Integrantes do grupo (ordem alfabética):
+# Nome Completo 1 - Breno Rossi Duarte
+# Nome Completo 2 - Francisco Bley Ruthes
+# Nome Completo 3 - Rafael Olivare Piveta
+# Nome Completo 4 - Stefan Benjamim Seixas Lourenço Rodrigues
+#
+# Nome do grupo no Canvas: RA2_1
+
+# Mede com tracemalloc o pico de memória de exibirResultados sequencial lendo o
+# arquivo em fluxo (io_utils.iterarArquivo) e com a lista de linhas (lerArquivo), para
+# arquivos de tamanhos diferentes. Em fluxo, só a linha atual, o histórico de RES e as
+# variáveis ficam em memória: o pico não cresce com o arquivo. Confere também que o
+# arquivo de tokens é o mesmo nos dois modos.
+# Uso: python benchmarks/benchmark_memoria.py [linhas]
+
+import os
+import sys
+import tempfile
+import contextlib
+import tracemalloc
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from src.RA1.functions.python.io_utils import lerArquivo, iterarArquivo
+from src.RA1.functions.python.exibirResultados import exibirResultados
+
+MODELOS = [
+    "(({i} 2.5 *) A)",
+    "((A 3 +) (A 2 ^) /)",
+    "(FOR (1)(5)(1)(((A 1 +) A)))",
+    "((1 RES) (2 RES) +)",
+]
+
+def gerar_arquivo(caminho: Path, linhas: int):
+    with caminho.open("w", encoding="utf-8") as f:
+        for i in range(linhas):
+            f.write(MODELOS[i % len(MODELOS)].format(i=i % 97) + "\n")
+
+def pico(leitura, caminho: Path, arquivo_tokens: Path) -> int:
+    with open(os.devnull, "w") as nulo, contextlib.redirect_stdout(nulo):
+        tracemalloc.start()
+        exibirResultados(leitura(str(caminho)), arquivo_tokens)
+        _, maximo = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return maximo
+
+if __name__ == "__main__":
+    linhas = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+
+    with tempfile.TemporaryDirectory() as pasta:
+        pasta = Path(pasta)
+        for total in (linhas // 10, linhas):
+            caminho = pasta / f"programa_{total}.txt"
+            gerar_arquivo(caminho, total)
+            tokens_fluxo, tokens_lista = pasta / "fluxo.txt", pasta / "lista.txt"
+            em_fluxo = pico(iterarArquivo, caminho, tokens_fluxo)
+            em_lista = pico(lerArquivo, caminho, tokens_lista)
+            if tokens_fluxo.read_bytes() != tokens_lista.read_bytes():
+                print("DIVERGÊNCIA entre os arquivos de tokens")
+                sys.exit(1)
+            print(f"{total:7d} linhas ({caminho.stat().st_size / 1024:8.1f} KB):   "
+                  f"pico em fluxo {em_fluxo / 1024:8.1f} KB   com a lista de linhas {em_lista / 1024:8.1f} KB")
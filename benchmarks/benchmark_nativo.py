@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+
+# Integrantes do grupo (ordem alfabética):
+# Nome Completo 1 - Breno Rossi Duarte
+# Nome Completo 2 - Francisco Bley Ruthes
+# Nome Completo 3 - Rafael Olivare Piveta
+# Nome Completo 4 - Stefan Benjamim Seixas Lourenço Rodrigues
+#
+# Nome do grupo no Canvas: RA2_1
+
+# Compara a máquina virtual com as funções Python geradas por codigo_nativo.py em
+# laços longos (compilação fora da medida) e no programa inteiro de exibirResultados.
+# Uso: python benchmarks/benchmark_nativo.py [voltas_por_laco]
+
+import io
+import sys
+import time
+import tempfile
+import contextlib
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from src.RA1.functions.python.analisador_lexico import analisar_linha
+from src.RA1.functions.python.compilador import compilarLinha
+from src.RA1.functions.python.codigo_nativo import compilarLinhaNativa
+from src.RA1.functions.python.maquina_virtual import executarCodigo
+from src.RA1.functions.python.memoria import Memoria
+from src.RA1.functions.python.orcamento import Orcamento
+from src.RA1.functions.python.exibirResultados import exibirResultados, OpcoesExecucao
+
+LACOS = {
+    "FOR aritmético": "(FOR (1)({n})(1)(((A 1.0001 *) A)((A 3 %) B)))",
+    "WHILE com IFELSE": "(WHILE (C {n} <)(((C 1 +) C)((IFELSE ((C 2 %) 0 ==)(B C +)(B C -)) D)))",
+    "FOR com comparações": "(FOR (0)({n})(1)((((A B <) (B C >) &&) E)((E A +) A)))",
+}
+
+def medir(compilar, linha: str):
+    memoria = Memoria()
+    codigo = compilar(analisar_linha(linha), simbolos=memoria.simbolos)
+    memoria['A'], memoria['B'], memoria['C'] = 1.0, 2.0, 0.0
+    inicio = time.perf_counter()
+    resultado = executarCodigo(codigo, memoria, Orcamento(max_iteracoes=None))
+    return time.perf_counter() - inicio, (resultado, memoria.como_dicionario())
+
+def rodar_programa(linhas, arquivo_tokens, nativo):
+    saida = io.StringIO()
+    inicio = time.perf_counter()
+    with contextlib.redirect_stdout(saida):
+        exibirResultados(linhas, arquivo_tokens,
+                         opcoes=OpcoesExecucao(orcamento=Orcamento(max_iteracoes=None), nativo=nativo))
+    return time.perf_counter() - inicio, saida.getvalue()
+
+if __name__ == "__main__":
+    voltas = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+
+    print(f"Laços com {voltas} voltas:")
+    for nome, modelo in LACOS.items():
+        linha = modelo.format(n=voltas)
+        t_vm, esperado = medir(compilarLinha, linha)
+        t_nativo, obtido = medir(compilarLinhaNativa, linha)
+        if obtido != esperado:
+            print(f"DIVERGÊNCIA entre a função nativa e a máquina virtual em {nome}")
+            sys.exit(1)
+        print(f"  {nome:<20} vm {t_vm * 1000:9.2f} ms   nativo {t_nativo * 1000:9.2f} ms   "
+              f"ganho {t_vm / t_nativo:.1f}x")
+
+    # Programa com laços curtos e linhas simples: inclui o custo de compile()
+    linhas = [modelo.format(n=voltas // 100) for modelo in LACOS.values()] * 20
+    linhas += [f"(({k} A +) {k} *)" for k in range(200)]
+    with tempfile.TemporaryDirectory() as pasta:
+        arquivo_tokens = Path(pasta) / "tokens.txt"
+        t_vm, esperado = rodar_programa(linhas, arquivo_tokens, False)
+        t_nativo, obtido = rodar_programa(linhas, arquivo_tokens, True)
+    if obtido != esperado:
+        print("DIVERGÊNCIA entre exibirResultados com e sem nativo")
+        sys.exit(1)
+    print(f"Programa de {len(linhas)} linhas (com compilação): vm {t_vm * 1000:.2f} ms   "
+          f"nativo {t_nativo * 1000:.2f} ms   ganho {t_vm / t_nativo:.1f}x")
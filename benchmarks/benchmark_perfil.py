@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+
+# Integrantes do grupo (ordem alfabética):
+# Nome Completo 1 - Breno Rossi Duarte
+# Nome Completo 2 - Francisco Bley Ruthes
+# Nome Completo 3 - Rafael Olivare Piveta
+# Nome Completo 4 - Stefan Benjamim Seixas Lourenço Rodrigues
+#
+# Nome do grupo no Canvas: RA2_1
+
+# Mede o custo do perfil no código que roda com --perfil: o mesmo programa com laços
+# no bytecode e no bytecode instrumentado (perfil.instrumentarBytecode), e nas funções
+# nativas geradas sem e com contadores. Confere que resultados, variáveis e operações
+# gastas são os mesmos, que os contadores do bytecode e da função nativa batem e que as
+# voltas contadas são as esperadas.
+# Uso: python benchmarks/benchmark_perfil.py [repeticoes]
+
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from src.RA1.functions.python.compilador import compilarLinha
+from src.RA1.functions.python.codigo_nativo import compilarLinhaNativa
+from src.RA1.functions.python.maquina_virtual import executarCodigo
+from src.RA1.functions.python.perfil import PerfilExecucao, instrumentarBytecode
+from src.RA1.functions.python.diagnosticos import Diagnosticos
+from src.RA1.functions.python.validarExpressao import analisarEValidar
+from src.RA1.functions.python.memoria import Memoria
+from src.RA1.functions.python.orcamento import Orcamento
+
+LINHAS = [
+    "(0 A)",
+    "(FOR (1)(40)(1)(((A 3 +) 7 %) B))",
+    "(0 C)",
+    "(WHILE (C 30 <)(((C 1 +) C)((C A *) D)))",
+    "(((A D +)(C 2 ^) *) E)",
+]
+# O FOR vai de 1 até 40 sem incluir o 40; o WHILE soma 1 a C até 30
+VOLTAS_ESPERADAS = 39 + 30
+
+def compilar(programa, nativo, perfilado):
+    memoria = Memoria()
+    codigos = []
+    for tokens in programa:
+        if nativo:
+            codigo = compilarLinhaNativa(tokens, simbolos=memoria.simbolos, perfilado=perfilado)
+        else:
+            codigo = compilarLinha(tokens, simbolos=memoria.simbolos)
+            if perfilado:
+                codigo = instrumentarBytecode(codigo)
+        codigos.append(codigo)
+    return memoria, codigos
+
+def rodar(programa, repeticoes, nativo, perfil=None):
+    memoria, codigos = compilar(programa, nativo, perfil is not None)
+    orcamento = Orcamento()
+    resultados = []
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        # As linhas zeram A e C antes dos laços
+        for codigo in codigos:
+            resultados.append(executarCodigo(codigo, memoria, orcamento, Diagnosticos()))
+    tempo = time.perf_counter() - inicio
+    if perfil is not None:
+        for numero, (linha, codigo) in enumerate(zip(LINHAS, codigos), 1):
+            perfil.registrar(numero, linha, 0.0, codigo.contadores)
+    return tempo, (resultados, memoria.como_dicionario(), orcamento.operacoes_usadas)
+
+if __name__ == "__main__":
+    repeticoes = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    programa = [analisarEValidar(linha)[1] for linha in LINHAS]
+
+    print(f"{repeticoes} execuções de {len(LINHAS)} linhas:")
+    perfis = []
+    for rotulo, nativo in (("bytecode", False), ("--nativo", True)):
+        t_sem, esperado = rodar(programa, repeticoes, nativo)
+        perfil = PerfilExecucao()
+        t_com, obtido = rodar(programa, repeticoes, nativo, perfil)
+        if obtido != esperado:
+            print(f"DIVERGÊNCIA ({rotulo}) entre a execução com e sem perfil")
+            sys.exit(1)
+        voltas = sum(laco.voltas for laco in perfil.lacos.values())
+        if voltas != VOLTAS_ESPERADAS * repeticoes:
+            print(f"DIVERGÊNCIA ({rotulo}) nas voltas contadas: {voltas} (esperado {VOLTAS_ESPERADAS * repeticoes})")
+            sys.exit(1)
+        perfis.append(perfil.comoDicionario())
+        print(f"  {rotulo:<9} sem perfil: {t_sem * 1000:9.2f} ms   com perfil: {t_com * 1000:9.2f} ms"
+              f"   custo {(t_com / t_sem - 1) * 100:+.1f}%   {sum(perfil.operadores.values())} operadores")
+    if perfis[0] != perfis[1]:
+        print("DIVERGÊNCIA entre os contadores do bytecode e da função nativa")
+        sys.exit(1)
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+
+# Integrantes do grupo (ordem alfabética):
+# Nome Completo 1 - Breno Rossi Duarte
+# Nome Completo 2 - Francisco Bley Ruthes
+# Nome Completo 3 - Rafael Olivare Piveta
+# Nome Completo 4 - Stefan Benjamim Seixas Lourenço Rodrigues
+#
+# Nome do grupo no Canvas: RA2_1
+
+# Mede o custo de gravar pontos de controle em um arquivo longo com laços e o tempo
+# para chegar à última linha retomando do último ponto de controle, em vez de executar
+# o arquivo inteiro de novo.
+# Uso: python benchmarks/benchmark_pontos_controle.py [linhas] [intervalo]
+
+import io
+import os
+import sys
+import time
+import tempfile
+import contextlib
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from src.RA1.functions.python.exibirResultados import exibirResultados, OpcoesExecucao
+from src.RA1.functions.python.pontos_controle import PontosDeControle
+
+def programa(linhas):
+    padroes = [
+        "(FOR (1)(50)(1)(((A 3 +) 7 %) A))",
+        "(((A B +) 11 %) B)",
+        "(WHILE (C 40 <)(((C 1 +) C)))",
+        "((A B +) C)",
+        "(2 RES)",
+    ]
+    return [padroes[posicao % len(padroes)] for posicao in range(linhas)]
+
+def rodar(linhas, **opcoes):
+    saida = io.StringIO()
+    inicio = time.perf_counter()
+    with contextlib.redirect_stdout(saida):
+        exibirResultados(iter(linhas), os.devnull, opcoes=OpcoesExecucao(**opcoes))
+    return time.perf_counter() - inicio, saida.getvalue().splitlines()
+
+if __name__ == "__main__":
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    intervalo = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    linhas = programa(total)
+
+    with tempfile.TemporaryDirectory() as pasta:
+        caminho = Path(pasta) / "programa.pontos"
+        t_sem, esperado = rodar(linhas)
+        t_com, saida = rodar(linhas, pontos=PontosDeControle(caminho, intervalo))
+        if saida != esperado:
+            print("DIVERGÊNCIA ao gravar pontos de controle")
+            sys.exit(1)
+
+        retomada = PontosDeControle(caminho, intervalo).anterior(total)
+        t_retomada, saida = rodar(linhas, retomada=retomada)
+        # A retomada só exibe as linhas depois do ponto de controle
+        if saida != esperado[-len(saida):] or not saida[0].startswith(f"Linha {retomada.linha + 1:02d}"):
+            print(f"DIVERGÊNCIA ao retomar depois da linha {retomada.linha}")
+            sys.exit(1)
+
+    print(f"{total} linhas, ponto de controle a cada {intervalo}:")
+    print(f"  execução completa:          {t_sem * 1000:9.2f} ms")
+    print(f"  com pontos de controle:     {t_com * 1000:9.2f} ms   custo {(t_com / t_sem - 1) * 100:+.1f}%")
+    print(f"  retomada na linha {retomada.linha:>6}:   {t_retomada * 1000:9.2f} ms   "
+          f"ganho {t_sem / t_retomada:.1f}x")
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+
+# Integrantes do grupo (ordem alfabética):
+# Nome Completo 1 - Breno Rossi Duarte
+# Nome Completo 2 - Francisco Bley Ruthes
+# Nome Completo 3 - Rafael Olivare Piveta
+# Nome Completo 4 - Stefan Benjamim Seixas Lourenço Rodrigues
+#
+# Nome do grupo no Canvas: RA2_1
+
+# Mede a avaliação de expressões profundamente aninhadas pelo interpretador de tokens
+# (rpn_calc.executarExpressao) e pelo caminho compilado (compilarLinha + executarCodigo).
+# O tempo por token deve ficar estável entre as profundidades.
+# Uso: python benchmarks/benchmark_profundidade.py [profundidade ...]
+
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from src.RA1.functions.python.memoria import Memoria
+from src.RA1.functions.python.rpn_calc import executarExpressao
+from src.RA1.functions.python.compilador import compilarLinha
+from src.RA1.functions.python.maquina_virtual import executarCodigo
+from src.RA1.functions.python.analisador_lexico import analisar_linha
+
+def grupos(profundidade: int) -> str:
+    return "(" * profundidade + "X" + " 2 +)" * profundidade
+
+FORMATOS = {
+    "grupos aninhados": grupos,
+    "grupos na condição": lambda profundidade: f"(IFELSE ({grupos(profundidade)} 0 >)(1)(2))",
+    "IFELSE aninhados": lambda profundidade: "(IFELSE (X)(" * profundidade + "5" + ")(0))" * profundidade,
+}
+
+def interpretar(tokens):
+    return executarExpressao(tokens, {'X': 0.5, 'historico_resultados': []})
+
+def compilar_e_executar(tokens):
+    memoria = Memoria()
+    memoria['X'] = 0.5
+    return executarCodigo(compilarLinha(tokens, simbolos=memoria.simbolos), memoria)
+
+def medir(funcao, tokens):
+    inicio = time.perf_counter()
+    resultado = funcao(tokens)
+    return time.perf_counter() - inicio, resultado
+
+if __name__ == "__main__":
+    profundidades = [int(arg) for arg in sys.argv[1:]] or [10, 1000, 100000]
+
+    for nome, formato in FORMATOS.items():
+        print(f"{nome}:")
+        for profundidade in profundidades:
+            tokens = analisar_linha(formato(profundidade))
+            t_interpretador, esperado = medir(interpretar, tokens)
+            t_compilado, obtido = medir(compilar_e_executar, tokens)
+            if obtido != esperado:
+                print(f"DIVERGÊNCIA na profundidade {profundidade}: {esperado!r} != {obtido!r}")
+                sys.exit(1)
+            por_token = 1e6 / len(tokens)
+            print(f"  profundidade {profundidade:>7} ({len(tokens):>7} tokens)   "
+                  f"interpretador {t_interpretador * 1000:9.2f} ms ({t_interpretador * por_token:5.2f} µs/token)   "
+                  f"compilado {t_compilado * 1000:9.2f} ms ({t_compilado * por_token:5.2f} µs/token)")
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+
+# Integrantes do grupo (ordem alfabética):
+# Nome Completo 1 - Breno Rossi Duarte
+# Nome Completo 2 - Francisco Bley Ruthes
+# Nome Completo 3 - Rafael Olivare Piveta
+# Nome Completo 4 - Stefan Benjamim Seixas Lourenço Rodrigues
+#
+# Nome do grupo no Canvas: RA2_1
+
+# Mede exibirResultados com e sem a tabela de subexpressões (subexpressoes.py) em um
+# programa com subexpressões repetidas entre linhas e subexpressões puras que não
+# mudam dentro dos laços, na máquina virtual e no código nativo. Nos dois modos as
+# subexpressões invariantes dos laços são calculadas uma vez antes das voltas
+# (compilador.icarInvariantes); com a tabela, esse cálculo consulta os valores guardados.
+# Uso: python benchmarks/benchmark_subexpressoes.py [voltas_por_laco]
+
+import io
+import sys
+import time
+import tempfile
+import contextlib
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from src.RA1.functions.python.orcamento import Orcamento
+from src.RA1.functions.python.subexpressoes import TabelaSubexpressoes
+from src.RA1.functions.python.exibirResultados import exibirResultados, OpcoesExecucao
+
+# (A B ...) só muda quando A ou B são atribuídos; X e Y mudam dentro dos laços
+MODELOS = [
+    "(((A B *) (A B -) /) ((A B *) 2 ^) +)",
+    "(FOR (1)({n})(1)((((((A B *) (A B -) /) 3 ^) X +) X)))",
+    "(0 Y)",
+    "(WHILE (Y {n} <)(((Y 1 +) Y)((((A B *) 7 %) Y +) X)))",
+    "(((A B *) (A B -) /) X +)",
+    "((A 1.5 +) A)",
+]
+
+def gerar_programa(voltas: int, repeticoes: int) -> list[str]:
+    linhas = ["(3 A)", "(2 B)", "(0 X)"]
+    linhas += [modelo.format(n=voltas) for _ in range(repeticoes) for modelo in MODELOS]
+    return linhas
+
+def rodar(linhas, arquivo_tokens, nativo, subexpressoes):
+    saida = io.StringIO()
+    inicio = time.perf_counter()
+    with contextlib.redirect_stdout(saida):
+        exibirResultados(linhas, arquivo_tokens,
+                         opcoes=OpcoesExecucao(orcamento=Orcamento(max_iteracoes=None), nativo=nativo,
+                                               subexpressoes=subexpressoes))
+    return time.perf_counter() - inicio, saida.getvalue()
+
+if __name__ == "__main__":
+    voltas = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    linhas = gerar_programa(voltas, 20)
+
+    print(f"{len(linhas)} linhas, laços com {voltas} voltas:")
+    with tempfile.TemporaryDirectory() as pasta:
+        arquivo_tokens = Path(pasta) / "tokens.txt"
+        for nativo in (False, True):
+            t_base, esperado = rodar(linhas, arquivo_tokens, nativo, None)
+            tabela = TabelaSubexpressoes()
+            tempo, obtido = rodar(linhas, arquivo_tokens, nativo, tabela)
+            if obtido != esperado:
+                print("DIVERGÊNCIA entre a execução com e sem memorização")
+                sys.exit(1)
+            nome = "nativo" if nativo else "vm"
+            print(f"  {nome:<6} sem memorização {t_base * 1000:9.2f} ms   com {tempo * 1000:9.2f} ms   "
+                  f"ganho {t_base / tempo:.1f}x")
+            for linha_relatorio in tabela.relatorio().split('\n'):
+                print(f"         {linha_relatorio}")
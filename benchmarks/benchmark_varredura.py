@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+
+# Integrantes do grupo (ordem alfabética):
+# Nome Completo 1 - Breno Rossi Duarte
+# Nome Completo 2 - Francisco Bley Ruthes
+# Nome Completo 3 - Rafael Olivare Piveta
+# Nome Completo 4 - Stefan Benjamim Seixas Lourenço Rodrigues
+#
+# Nome do grupo no Canvas: RA2_1
+
+# Compara uma varredura de parâmetros de um programa com laços feita rodada a rodada
+# (compila e executa o programa para cada conjunto de valores iniciais) com
+# varredura.varrerPrograma (compila uma vez) em 1 processo e em todos os núcleos.
+# Uso: python benchmarks/benchmark_varredura.py [rodadas]
+
+import os
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from src.RA1.functions.python.analisador_lexico import analisar_linha
+from src.RA1.functions.python.compilador import compilarLinha
+from src.RA1.functions.python.incremental import obterDesfecho
+from src.RA1.functions.python.memoria import Memoria
+from src.RA1.functions.python.orcamento import Orcamento
+from src.RA1.functions.python.varredura import varrerPrograma
+
+PROGRAMA = [
+    "(0 X)",
+    "(WHILE (X A <)(((X 1 +) X)((IFELSE ((X B %) 0 ==)(Y X +)(Y 1 -)) Y)))",
+    "(FOR (0)(B)(1)(((Z (X Y *) 7 % +) Z)))",
+    "((Y Z +) RES)",
+]
+
+def rodada_a_rodada(colunas):
+    # Como rodar o arquivo uma vez por conjunto de valores
+    resultados = []
+    for posicao in range(len(colunas['A'])):
+        memoria = Memoria()
+        for nome, valores in colunas.items():
+            memoria[nome] = float(valores[posicao])
+        orcamento = Orcamento()
+        for linha in PROGRAMA:
+            codigo = compilarLinha(analisar_linha(linha), simbolos=memoria.simbolos)
+            desfecho, _ = obterDesfecho(codigo, memoria, orcamento)
+            memoria.historico.adicionar(desfecho.resultado if desfecho.erro is None else None)
+        resultados.append(memoria.como_dicionario())
+    return resultados
+
+def medir(funcao, *args):
+    inicio = time.perf_counter()
+    resultado = funcao(*args)
+    return time.perf_counter() - inicio, resultado
+
+if __name__ == "__main__":
+    rodadas = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    colunas = {'A': [50 + posicao % 200 for posicao in range(rodadas)],
+               'B': [2 + posicao % 9 for posicao in range(rodadas)]}
+    nucleos = os.cpu_count() or 1
+
+    t_base, esperado = medir(rodada_a_rodada, colunas)
+    print(f"{rodadas} rodadas, {nucleos} núcleo(s):")
+    print(f"  rodada a rodada:            {t_base * 1000:9.2f} ms")
+    for processos in sorted({1, nucleos}):
+        tempo, rodadas_feitas = medir(lambda: list(varrerPrograma(PROGRAMA, colunas, processos=processos)))
+        if [rodada.variaveis for rodada in rodadas_feitas] != esperado:
+            print(f"DIVERGÊNCIA na varredura com {processos} processo(s)")
+            sys.exit(1)
+        print(f"  varrerPrograma, {processos:>2} proc.:  {tempo * 1000:9.2f} ms   ganho {t_base / tempo:.1f}x")
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+
+# Integrantes do grupo (ordem alfabética):
+# Nome Completo 1 - Breno Rossi Duarte
+# Nome Completo 2 - Francisco Bley Ruthes
+# Nome Completo 3 - Rafael Olivare Piveta
+# Nome Completo 4 - Stefan Benjamim Seixas Lourenço Rodrigues
+#
+# Nome do grupo no Canvas: RA2_1
+
+# Compara o interpretador por tokens (rpn_calc) com o bytecode + máquina virtual
+# em linhas com laços, no formato dos casos WHILE/FOR dos arquivos de teste.
+# Uso: python benchmarks/benchmark_vm.py [repeticoes]
+
+import io
+import sys
+import time
+import contextlib
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from src.RA1.functions.python.analisador_lexico import analisar_linha
+from src.RA1.functions.python.rpn_calc import executarExpressao
+from src.RA1.functions.python.compilador import compilarLinha
+from src.RA1.functions.python.maquina_virtual import executarCodigo
+from src.RA1.functions.python.memoria import Memoria
+
+# Cada programa começa com memória vazia; os laços chegam ao limite de 1000 iterações
+PROGRAMAS = {
+    "WHILE": ["(0 X)", "(WHILE (X 1000 <)(((X 1 +) X)((X 2 *) Y)))"],
+    "FOR": ["(0 P)", "(FOR (0)(1000)(1)(((P 1.5 +) P)((P 2 *) Q)))"],
+    "FOR + IFELSE": ["(0 A)", "(FOR (0)(1000)(1)(((IFELSE ((A 2 %) 0 ==)(A 3 *)(A 1 +)) A)))"],
+    "WHILE aninhado": ["(0 I)", "(WHILE (I 30 <)(((I 1 +) I)((0 J))((WHILE (J 30 <)(((J 1 +) J)((I J *) K))))))"],
+}
+
+def rodar(executar, linhas):
+    memoria = Memoria()
+    saida = io.StringIO()
+    with contextlib.redirect_stdout(saida):
+        for tokens in linhas:
+            memoria.historico.adicionar(executar(tokens, memoria))
+    return memoria.como_dicionario(), list(memoria.historico), saida.getvalue()
+
+def interpretar(tokens, memoria):
+    return executarExpressao(tokens, memoria)
+
+def compilar_e_executar(tokens, memoria):
+    return executarCodigo(compilarLinha(tokens, simbolos=memoria.simbolos), memoria)
+
+def medir(executar, linhas, repeticoes):
+    melhor = float('inf')
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        rodar(executar, linhas)
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor
+
+if __name__ == "__main__":
+    repeticoes = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    for nome, programa in PROGRAMAS.items():
+        linhas = [analisar_linha(linha) for linha in programa]
+
+        # Os dois caminhos precisam deixar a mesma memória e imprimir as mesmas mensagens
+        if rodar(interpretar, linhas) != rodar(compilar_e_executar, linhas):
+            print(f"DIVERGÊNCIA no programa {nome}: {programa}")
+            sys.exit(1)
+
+        t_interpretador = medir(interpretar, linhas, repeticoes)
+        t_vm = medir(compilar_e_executar, linhas, repeticoes)
+        print(f"{nome}:")
+        print(f"  interpretador: {t_interpretador * 1000:8.2f} ms")
+        print(f"  bytecode + VM: {t_vm * 1000:8.2f} ms (compilação incluída)")
+        print(f"  ganho:         {t_interpretador / t_vm:8.1f}x")
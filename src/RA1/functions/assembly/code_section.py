@@ -9,7 +9,7 @@
 # Nome do grupo no Canvas: RA2_1
 
 from .operations import (
-    is_number, is_integer, is_variable_mem,
+    OPERADORES, is_number, is_integer, is_variable_mem,
     gerar_push_int, gerar_operacao,
 )
 
@@ -193,7 +193,7 @@ def _gerar_processamento_operacao(codigo: list[str], tokens: list[str], op_numbe
                 valor = valor & 0xFFFF
             codigo.extend(gerar_push_int(valor))
 
-        elif token in ['+', '-', '*', '/', '%', '^', '<', '>', '==', '<=', '>=', '!=', '!', '||', '&&']:
+        elif token in OPERADORES:
             codigo.extend(gerar_operacao(token))
 
         elif token == 'MEM':
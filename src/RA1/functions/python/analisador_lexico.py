@@ -8,7 +8,10 @@
 #
 # Nome do grupo no Canvas: RA2_1
 
-from .tokens import Token, Tipo_de_Token
+import re
+from .tokens import (Token, TokenPosicionado, Tipo_de_Token, TOKENS_FIXOS, TOKEN_FIM, token_variavel,
+                     ListaTokens, indexar_parenteses, SEM_PAR, NAO_PARENTESE)
+from .operadores import LEXEMAS_OPERADORES
 
 class Analisador_Lexico:
     def __init__(self, texto_fonte: str):
@@ -36,7 +39,7 @@ class Analisador_Lexico:
             token = self.estado_zero()
             if token:
                 tokens.append(token)
-        tokens.append(Token(Tipo_de_Token.FIM, None))
+        tokens.append(TOKEN_FIM)
         return tokens
 
     def estado_zero(self):
@@ -50,78 +53,20 @@ class Analisador_Lexico:
         return self.estado_operador()
 
     def estado_operador(self):
-        token = None
-        caractere_atual = self.caractere  # Armazena o caractere atual
-        
-        if self.caractere == '(':
-            token = Token(Tipo_de_Token.ABRE_PARENTESES, '(')
-            self.avanca_ponteiro()
-        elif self.caractere == ')':
-            token = Token(Tipo_de_Token.FECHA_PARENTESES, ')')
-            self.avanca_ponteiro()
-        elif self.caractere == '+':
-            token = Token(Tipo_de_Token.SOMA, '+')
-            self.avanca_ponteiro()
-        elif self.caractere == '-':
-            token = Token(Tipo_de_Token.SUBTRACAO, '-')
-            self.avanca_ponteiro()
-        elif self.caractere == '*':
-            token = Token(Tipo_de_Token.MULTIPLICACAO, '*')
-            self.avanca_ponteiro()
-        elif self.caractere == '/':
-            token = Token(Tipo_de_Token.DIVISAO_INTEIRA, '/')
-            self.avanca_ponteiro()
-        elif self.caractere == '%':
-            token = Token(Tipo_de_Token.RESTO, '%')
-            self.avanca_ponteiro()
-        elif self.caractere == '^':
-            token = Token(Tipo_de_Token.POTENCIA, '^')
-            self.avanca_ponteiro()
-        elif self.caractere == '<':
-            self.avanca_ponteiro()
-            if self.caractere == '=':
-                token = Token(Tipo_de_Token.MENOR_IGUAL, '<=')
-                self.avanca_ponteiro()
-            else:
-                token = Token(Tipo_de_Token.MENOR, '<')
-        elif self.caractere == '>':
-            self.avanca_ponteiro()
-            if self.caractere == '=':
-                token = Token(Tipo_de_Token.MAIOR_IGUAL, '>=')
+        # Lexemas de símbolos vêm de TOKENS_FIXOS: tenta o de dois caracteres, depois o de um
+        caractere_atual = self.caractere
+        if caractere_atual not in _INICIAIS_SIMBOLOS:
+            raise ValueError(f"ERRO -> Caractere inválido: '{self.caractere}'")
+        self.avanca_ponteiro()
+        if self.caractere is not None:
+            token = TOKENS_FIXOS.get(caractere_atual + self.caractere)
+            if token is not None:
                 self.avanca_ponteiro()
-            else:
-                token = Token(Tipo_de_Token.MAIOR, '>')
-        elif self.caractere == '=':
-            self.avanca_ponteiro()
-            if self.caractere == '=':
-                token = Token(Tipo_de_Token.IGUAL, '==')
-                self.avanca_ponteiro()
-            else:
-                raise ValueError("ERRO -> Esperado '=' após '='")
-        elif self.caractere == '!':
-            self.avanca_ponteiro()
-            if self.caractere == '=':
-                token = Token(Tipo_de_Token.DIFERENTE, '!=')
-                self.avanca_ponteiro()
-            else:
-                token = Token(Tipo_de_Token.NOT, '!')
-        elif self.caractere == '|':
-            self.avanca_ponteiro()
-            if self.caractere == '|':
-                token = Token(Tipo_de_Token.OR, '||')
-                self.avanca_ponteiro()
-            else:
-                token = Token(Tipo_de_Token.DIVISAO_REAL, '|')
-        elif self.caractere == '&':
-            self.avanca_ponteiro()
-            if self.caractere == '&':
-                token = Token(Tipo_de_Token.AND, '&&')
-                self.avanca_ponteiro()
-            else:
-                raise ValueError("ERRO -> Esperado '&' após '&'")
-        if token:
+                return token
+        token = TOKENS_FIXOS.get(caractere_atual)
+        if token is not None:
             return token
-        raise ValueError(f"ERRO -> Caractere inválido: '{self.caractere}'")
+        raise ValueError(_ERROS_CARACTERE[caractere_atual])
 
     def estado_numero(self):
         resultado = ""
@@ -144,17 +89,227 @@ class Analisador_Lexico:
             resultado += self.caractere
             self.avanca_ponteiro()
             
-        # Lista de palavras-chave
-        palavras_chave = {
-            "RES": Tipo_de_Token.RES,
-            "WHILE": Tipo_de_Token.WHILE,
-            "FOR": Tipo_de_Token.FOR,
-            "IFELSE": Tipo_de_Token.IFELSE
-        }
-        
-        # Verifica se é uma palavra-chave
-        if resultado in palavras_chave:
-            return Token(palavras_chave[resultado], resultado)
+        # Verifica se é uma palavra-chave (RES, WHILE, FOR, IFELSE)
+        if resultado in TOKENS_FIXOS:
+            return TOKENS_FIXOS[resultado]
         else:
             # Qualquer sequência não reconhecida é considerada uma variável
-            return Token(Tipo_de_Token.VARIAVEL, resultado)
\ No newline at end of file
+            return token_variavel(resultado)
+
+
+# ============================================================================
+# MODO TABELA - varredura única por linha com expressão regular compilada
+# ============================================================================
+
+# Cada lexema é um número (com o ponto já incluído para detectar "5."),
+# um identificador, um operador de mais de um caractere (os mais longos primeiro,
+# tirados do registro de operadores) ou qualquer caractere isolado que não seja
+# espaço. A classificação é feita pelas tabelas abaixo.
+_OPERADORES_LONGOS = sorted((lexema for lexema in LEXEMAS_OPERADORES if len(lexema) > 1),
+                            key=lambda lexema: (-len(lexema), lexema))
+PADRAO_LEXEMA = re.compile(r'[0-9]+(?:\.[0-9]*)?|[A-Za-z][A-Za-z0-9_]*|'
+                           + ''.join(re.escape(lexema) + '|' for lexema in _OPERADORES_LONGOS) + r'\S')
+
+# Mensagens para caracteres que só são válidos quando repetidos
+_ERROS_CARACTERE = {
+    '=': "ERRO -> Esperado '=' após '='",
+    '&': "ERRO -> Esperado '&' após '&'",
+}
+
+# Primeiros caracteres dos lexemas de símbolos (operadores e parênteses)
+_INICIAIS_SIMBOLOS = frozenset(lexema[0] for lexema in TOKENS_FIXOS if not lexema[0].isalnum())
+
+# PADRAO_LEXEMA precedido dos espaços antes do lexema: um lexema sem espaços antes,
+# logo depois de outro que não é parêntese, está colado a ele
+_PADRAO_LEXEMA_ESPACADO = re.compile(r'(\s*)(' + PADRAO_LEXEMA.pattern + ')')
+
+# Palavras-chave de controle, procuradas também dentro de identificadores (como o
+# linha.find da validação por texto)
+_PALAVRAS_CONTROLE = ('IFELSE', 'WHILE', 'FOR')
+
+# Classe de cada lexema fixo para a varredura de analisar_linha: parênteses,
+# operadores, palavras-chave de controle e os demais (RES)
+_ABRE, _FECHA, _OPERADOR, _CONTROLE, _OUTRO = range(5)
+
+def _classe_fixa(lexema: str) -> int:
+    if lexema == '(':
+        return _ABRE
+    if lexema == ')':
+        return _FECHA
+    if lexema in LEXEMAS_OPERADORES:
+        return _OPERADOR
+    return _CONTROLE if lexema in _PALAVRAS_CONTROLE else _OUTRO
+
+_FIXOS_CLASSIFICADOS = {lexema: (token, _classe_fixa(lexema)) for lexema, token in TOKENS_FIXOS.items()}
+
+class ResumoLinha:
+    # Dados que validarExpressao tira do texto, coletados por analisar_linha na mesma
+    # passada dos tokens: parênteses de cada lado, operandos (números e identificadores
+    # só de letras), operadores, se há comandos especiais (MEM incluído), parênteses
+    # depois da primeira ocorrência de cada palavra-chave de controle presente como
+    # token, e se algum lexema está colado a outro sem espaço ou parêntese entre eles
+    __slots__ = ('abre', 'fecha', 'operandos', 'operadores', 'comandos', 'grupos', 'colados')
+
+    def __init__(self, abre: int, fecha: int, operandos: int, operadores: int, comandos: bool,
+                 grupos: dict, colados: bool):
+        self.abre = abre
+        self.fecha = fecha
+        self.operandos = operandos
+        self.operadores = operadores
+        self.comandos = comandos
+        self.grupos = grupos
+        self.colados = colados
+
+def analisar_linha(texto_fonte: str) -> list[Token]:
+    """
+    Versão tabelada de Analisador_Lexico.analise(): varre a linha uma única vez,
+    fatia os lexemas e os classifica por consulta em TOKENS_FIXOS.
+    Produz a mesma sequência de tokens e os mesmos erros do analisador por estados.
+    Devolve uma ListaTokens com a tabela de pares de parênteses e o ResumoLinha
+    montados na mesma passada (sem resumo em linhas não ASCII).
+    """
+    # As classes de caracteres do padrão seguem as regras ASCII de isalpha/isdigit;
+    # linhas com outros caracteres usam o analisador por estados para manter o comportamento.
+    if not texto_fonte.isascii():
+        tokens = ListaTokens(Analisador_Lexico(texto_fonte).analise())
+        tokens.pares = indexar_parenteses(tokens)
+        tokens.resumo = None
+        return tokens
+
+    tokens = ListaTokens()
+    pares = []
+    abertos = []
+    adicionar = tokens.append
+    fixos = _FIXOS_CLASSIFICADOS
+    numero = Tipo_de_Token.NUMERO_REAL
+    num_abre = num_fecha = operandos = operadores = 0
+    comandos = colados = False
+    # Parênteses antes da primeira ocorrência de cada palavra-chave; palavras-chave lidas como token
+    anteriores = {}
+    controle = []
+    # O lexema anterior não é parêntese
+    colavel = False
+    for espaco, lexema in _PADRAO_LEXEMA_ESPACADO.findall(texto_fonte):
+        fixo = fixos.get(lexema)
+        if fixo is None:
+            token = classificar_lexema(lexema)
+            if token.tipo == numero:
+                operandos += 1
+            else:
+                if lexema.isalpha():
+                    operandos += 1
+                    comandos = comandos or lexema == 'MEM'
+                if len(lexema) > 2:
+                    for palavra in _PALAVRAS_CONTROLE:
+                        if palavra in lexema and palavra not in anteriores:
+                            anteriores[palavra] = (num_abre, num_fecha)
+        else:
+            token, classe = fixo
+            if classe == _ABRE:
+                abertos.append(len(pares))
+                pares.append(SEM_PAR)
+                adicionar(token)
+                num_abre += 1
+                colavel = False
+                continue
+            if classe == _FECHA:
+                if abertos:
+                    par = abertos.pop()
+                    pares[par] = len(pares)
+                    pares.append(par)
+                else:
+                    pares.append(SEM_PAR)
+                adicionar(token)
+                num_fecha += 1
+                colavel = False
+                continue
+            if classe == _OPERADOR:
+                operadores += 1
+            else:
+                comandos = True
+                if classe == _CONTROLE:
+                    controle.append(lexema)
+                    if lexema not in anteriores:
+                        anteriores[lexema] = (num_abre, num_fecha)
+        if colavel and not espaco:
+            colados = True
+        colavel = True
+        pares.append(NAO_PARENTESE)
+        adicionar(token)
+    adicionar(TOKEN_FIM)
+    pares.append(NAO_PARENTESE)
+    tokens.pares = pares
+    grupos = {}
+    for palavra in controle:
+        abre_antes, fecha_antes = anteriores[palavra]
+        grupos[palavra] = (num_abre - abre_antes, num_fecha - fecha_antes)
+    tokens.resumo = ResumoLinha(num_abre, num_fecha, operandos, operadores, comandos, grupos, colados)
+    return tokens
+
+def classificar_lexema(lexema: str) -> Token:
+    """Classifica um lexema que não está em TOKENS_FIXOS (número, variável ou erro)."""
+    inicial = lexema[0]
+    if inicial.isdigit():
+        if lexema[-1] == '.':
+            raise ValueError("ERRO -> Espera-se dígito após o ponto decimal.")
+        return Token(Tipo_de_Token.NUMERO_REAL, float(lexema))
+    if inicial.isalpha():
+        return token_variavel(lexema)
+    raise ValueError(_ERROS_CARACTERE.get(inicial, f"ERRO -> Caractere inválido: '{inicial}'"))
+
+# ============================================================================
+# TOKENS SERIALIZADOS - elementos do arquivo de tokens gerado pelo RA1
+# ============================================================================
+
+# Um elemento é um parêntese isolado ou uma sequência sem espaços e sem parênteses
+_PADRAO_ELEMENTO = re.compile(r'[()]|[^\s()]+')
+
+# Exatamente o que float() aceita em um elemento sem espaços (o RA1 grava os
+# números com str(float), que pode gerar expoente, inf e nan)
+_PADRAO_NUMERO_SERIALIZADO = re.compile(
+    r'[+-]?(?:(?:\d(?:_?\d)*)?\.\d(?:_?\d)*|\d(?:_?\d)*\.?)(?:[eE][+-]?\d(?:_?\d)*)?'
+    r'|[+-]?(?:inf|infinity|nan)',
+    re.IGNORECASE,
+)
+
+def classificar_elemento(elemento: str) -> Token:
+    """
+    Classifica um elemento já separado por espaços: lexema fixo por consulta em
+    TOKENS_FIXOS, número pelo padrão compilado e, caso contrário, variável.
+    Números mantêm o texto original como valor.
+    """
+    token = TOKENS_FIXOS.get(elemento)
+    if token is not None:
+        return token
+    if _PADRAO_NUMERO_SERIALIZADO.fullmatch(elemento):
+        return Token(Tipo_de_Token.NUMERO_REAL, elemento)
+    return token_variavel(elemento)
+
+def tokenizar_elementos_posicionados(linha: str, numero_linha: int) -> list[TokenPosicionado]:
+    """Separa e classifica os elementos de uma linha serializada, com linha e coluna."""
+    tokens = []
+    for m in _PADRAO_ELEMENTO.finditer(linha):
+        token = classificar_elemento(m.group())
+        tokens.append(TokenPosicionado(token.tipo, token.valor, numero_linha, m.start() + 1))
+    return tokens
+
+def serializar_tokens(tokens: list[Token]) -> ListaTokens:
+    """
+    Converte os tokens do RA1 para a forma serializada usada pelo RA2 sem
+    reclassificá-los: só os números mudam, passando a guardar o texto str(valor)
+    (o mesmo gravado em tokens_gerados.txt). O token FIM é descartado e a
+    tabela de pares de parênteses da linha é mantida.
+    """
+    serializados = ListaTokens()
+    for token in tokens:
+        tipo = token.tipo
+        if tipo == Tipo_de_Token.NUMERO_REAL:
+            serializados.append(Token(tipo, str(token.valor)))
+        elif tipo != Tipo_de_Token.FIM:
+            serializados.append(token)
+    pares = getattr(tokens, 'pares', None)
+    if pares is not None and len(serializados) == len(tokens) - 1 and tokens[-1].tipo == Tipo_de_Token.FIM:
+        serializados.pares = pares[:-1]
+    else:
+        serializados.pares = indexar_parenteses(serializados)
+    return serializados
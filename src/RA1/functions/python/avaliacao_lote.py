@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+
+# Integrantes do grupo (ordem alfabética):
+# Nome Completo 1 - Breno Rossi Duarte
+# Nome Completo 2 - Francisco Bley Ruthes
+# Nome Completo 3 - Rafael Olivare Piveta
+# Nome Completo 4 - Stefan Benjamim Seixas Lourenço Rodrigues
+#
+# Nome do grupo no Canvas: RA2_1
+
+# Avaliação de uma mesma expressão sobre muitos valores de variáveis (varreduras de
+# parâmetros). Expressões sem laços nem histórico são avaliadas coluna a coluna com
+# NumPy, com os mesmos resultados de processarTokens; as demais (ou sem NumPy) são
+# compiladas uma vez e executadas pela máquina virtual para cada conjunto de valores.
+
+from typing import Mapping, Sequence
+from .tokens import Token
+from .compilador import (construirArvore, otimizarArvore, compilarLinha, Constante, Variavel,
+                         Grupo, Operacao, Quadro, Atribuicao, SeSenao, Protegido)
+from .maquina_virtual import executarCodigo, aritmetica
+from .memoria import Memoria
+from .operadores import ARITMETICO
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional: sem ele a avaliação é feita linha a linha
+    np = None
+
+# |x| a partir do qual o arredondamento usa round() elemento a elemento
+_LIMITE_ARREDONDAMENTO = 2.0 ** 45
+# Divisor de Veltkamp (2^27 + 1): separa um float em duas metades de 26 bits
+_DIVISOR = 134217729.0
+
+
+def _arredondar_vetor(x):
+    """round(x, 2) elemento a elemento, com o mesmo resultado de arredondar_16bit."""
+    # x*100 é calculado sem erro como p + erro (produto de Dekker); o inteiro mais
+    # próximo do valor exato (empate para o par) é rint(p) corrigido pelo sinal do erro
+    p = x * 100.0
+    c = x * _DIVISOR
+    alto = c - (c - x)
+    baixo = x - alto
+    erro = (alto * 100.0 - p) + baixo * 100.0
+    r = np.rint(p)
+    f = p - r
+    n = r + ((f == 0.5) & (erro > 0.0)) - ((f == -0.5) & (erro < 0.0))
+    resultado = np.where(n == 0.0, np.copysign(0.0, x), n / 100.0)
+    grandes = ~(np.abs(x) < _LIMITE_ARREDONDAMENTO)   # inclui inf e nan
+    if grandes.any():
+        resultado[grandes] = [round(float(v), 2) for v in x[grandes]]
+    return resultado
+
+
+def _perto_de_fronteira(x):
+    # Valores a menos de alguns ulps de um empate de arredondamento em duas casas
+    y = np.abs(x) * 100.0
+    return np.abs(y - np.floor(y) - 0.5) <= 1e-7 * np.maximum(1.0, y)
+
+
+def _divisao_inteira(a, b):
+    # int() não tem -0: o "+ 0.0" transforma o -0.0 de trunc em 0.0
+    return np.where(b != 0.0, np.trunc(a / b) + 0.0, 0.0)
+
+
+def _divisao_real(a, b):
+    return np.where(b != 0.0, a / b, 0.0)
+
+
+def _resto(a, b):
+    # np.remainder segue o % do Python (sinal do divisor)
+    return np.where(b != 0.0, np.remainder(a, b), 0.0)
+
+
+# Versões vetoriais dos operadores do registro (operadores.py), por lexema.
+# Aritméticos devolvem o valor antes do arredondamento; os demais, 1.0/0.0.
+# Um operador sem entrada aqui faz a expressão ser avaliada pela máquina virtual.
+_VETORIAIS = {
+    '+': lambda a, b: a + b,
+    '-': lambda a, b: a - b,
+    '*': lambda a, b: a * b,
+    '/': _divisao_inteira,
+    '|': _divisao_real,
+    '%': _resto,
+    '^': lambda a, b: np.power(a, b),
+    '<': lambda a, b: np.where(a < b, 1.0, 0.0),
+    '>': lambda a, b: np.where(a > b, 1.0, 0.0),
+    '==': lambda a, b: np.where(np.abs(a - b) < 1e-10, 1.0, 0.0),
+    '<=': lambda a, b: np.where(a <= b, 1.0, 0.0),
+    '>=': lambda a, b: np.where(a >= b, 1.0, 0.0),
+    '!=': lambda a, b: np.where(np.abs(a - b) >= 1e-10, 1.0, 0.0),
+    '&&': lambda a, b: np.where((a != 0.0) & (b != 0.0), 1.0, 0.0),
+    '||': lambda a, b: np.where((a != 0.0) | (b != 0.0), 1.0, 0.0),
+    '!': lambda a: np.where(a == 0.0, 1.0, 0.0),
+}
+
+
+def _aritmetica_vetor(operador, a, b):
+    bruto = _VETORIAIS[operador.lexema](a, b)
+    resultado = _arredondar_vetor(bruto)
+    # Infinitos, nan e estouros têm o tratamento de erros de processarTokens (0.0 ou
+    # o valor de round()); math.pow pode diferir de np.power no último bit, o que só
+    # importa perto de um empate de arredondamento ou em valores enormes
+    suspeitos = ~(np.isfinite(a) & np.isfinite(b) & np.isfinite(bruto))
+    if operador.lexema == '^':
+        suspeitos |= _perto_de_fronteira(bruto) | ~(np.abs(bruto) < 2.0 ** 40)
+    if suspeitos.any():
+        resultado[suspeitos] = [aritmetica(operador, float(x), float(y))
+                                for x, y in zip(a[suspeitos], b[suspeitos])]
+    return resultado
+
+
+def _quadro_vetorizavel(quadro: Quadro) -> bool:
+    # Profundidade da pilha conhecida e sem operandos insuficientes (que imprimem erro)
+    profundidade = 0
+    for item in quadro.itens:
+        if isinstance(item, (Constante, Variavel)):
+            profundidade += 1
+        elif isinstance(item, Grupo):
+            if not _vetorizavel(item.no):
+                return False
+            profundidade += 1
+        elif isinstance(item, Operacao):
+            operador = item.operador
+            if operador.lexema not in _VETORIAIS or profundidade < operador.aridade:
+                return False
+            profundidade -= operador.aridade - 1
+        else:
+            return False   # RES no meio da expressão
+    return True
+
+
+def _vetorizavel(no) -> bool:
+    """True se o nó só usa operadores, IFELSE e atribuição (sem laços nem histórico)."""
+    if isinstance(no, (Constante, Variavel)):
+        return True
+    if isinstance(no, Quadro):
+        return _quadro_vetorizavel(no)
+    if isinstance(no, (Atribuicao, Protegido)):
+        return _vetorizavel(no.no)
+    if isinstance(no, SeSenao):
+        return all(_vetorizavel(filho) for filho in (no.condicao, no.verdadeiro, no.falso))
+    return False
+
+
+def _variaveis(no, nomes: set):
+    if isinstance(no, Variavel):
+        nomes.add(no.nome)
+    elif isinstance(no, Quadro):
+        for item in no.itens:
+            _variaveis(item.no if isinstance(item, Grupo) else item, nomes)
+    elif isinstance(no, (Atribuicao, Protegido)):
+        _variaveis(no.no, nomes)
+    elif isinstance(no, SeSenao):
+        for filho in (no.condicao, no.verdadeiro, no.falso):
+            _variaveis(filho, nomes)
+    return nomes
+
+
+class _AvaliadorVetorial:
+    __slots__ = ('colunas', 'memoria', 'tamanho')
+
+    def __init__(self, colunas: dict, memoria: Mapping, tamanho: int):
+        self.colunas = colunas
+        self.memoria = memoria
+        self.tamanho = tamanho
+
+    def no(self, no):
+        if isinstance(no, Constante):
+            return np.full(self.tamanho, no.valor)
+        if isinstance(no, Variavel):
+            coluna = self.colunas.get(no.nome)
+            if coluna is not None:
+                return coluna
+            return np.full(self.tamanho, self.memoria.get(no.nome, 0.0))
+        if isinstance(no, Quadro):
+            return self.quadro(no)
+        if isinstance(no, (Atribuicao, Protegido)):
+            # A atribuição não altera `memoria`: cada conjunto de valores é independente
+            return self.no(no.no)
+        # IFELSE: os dois ramos são calculados e a condição escolhe elemento a elemento
+        condicao = self.no(no.condicao)
+        return np.where(condicao != 0.0, self.no(no.verdadeiro), self.no(no.falso))
+
+    def quadro(self, quadro: Quadro):
+        pilha = []
+        for item in quadro.itens:
+            if isinstance(item, Grupo):
+                pilha.append(self.no(item.no))
+            elif isinstance(item, Operacao):
+                operador = item.operador
+                if operador.aridade == 1:
+                    pilha[-1] = _VETORIAIS[operador.lexema](pilha[-1])
+                    continue
+                b = pilha.pop()
+                if operador.categoria == ARITMETICO:
+                    pilha[-1] = _aritmetica_vetor(operador, pilha[-1], b)
+                else:
+                    pilha[-1] = _VETORIAIS[operador.lexema](pilha[-1], b)
+            else:
+                pilha.append(self.no(item))
+        if not pilha:
+            return np.zeros(self.tamanho)
+        return _arredondar_vetor(pilha[-1])
+
+
+def tamanho_das_colunas(colunas: Mapping[str, Sequence]) -> int:
+    tamanhos = {len(valores) for valores in colunas.values()}
+    if len(tamanhos) != 1:
+        raise ValueError("ERRO -> As colunas de valores precisam ter o mesmo tamanho (e ao menos uma coluna)")
+    return tamanhos.pop()
+
+
+def avaliarEmLote(tokens: list[Token], colunas: Mapping[str, Sequence], memoria: Mapping | None = None):
+    """
+    Avalia a expressão de `tokens` uma vez para cada posição das colunas de `colunas`
+    (nome da variável -> valores). Variáveis fora de `colunas` vêm de `memoria`
+    (Memoria ou dicionário nome -> valor; 0.0 se não existirem). Cada posição é
+    avaliada sobre uma cópia de `memoria`, então atribuições não passam de uma
+    posição para outra.
+    Devolve um numpy.ndarray quando a expressão é vetorizada e uma lista quando é
+    executada posição a posição (laços, RES, mensagens de erro ou NumPy ausente).
+    """
+    memoria = {} if memoria is None else memoria
+    tamanho = tamanho_das_colunas(colunas)
+    arvore = otimizarArvore(construirArvore(tokens))
+
+    if np is not None and _vetorizavel(arvore):
+        escalares_float = all(
+            isinstance(memoria.get(nome, 0.0), float)
+            for nome in _variaveis(arvore, set()) if nome not in colunas
+        )
+        if escalares_float:
+            vetores = {nome: np.asarray(valores, dtype=float) for nome, valores in colunas.items()}
+            # inf e nan seguem as regras de processarTokens, sem avisos do NumPy
+            with np.errstate(all='ignore'):
+                resultado = _AvaliadorVetorial(vetores, memoria, tamanho).no(arvore)
+            return np.array(resultado, dtype=float)
+
+    base = memoria if isinstance(memoria, Memoria) else Memoria.de_dicionario(memoria)
+    codigo = compilarLinha(tokens, simbolos=base.simbolos)
+    slots = [base.simbolos.slot(nome) for nome in colunas]
+    valores = [[float(v) for v in coluna] for coluna in colunas.values()]
+    base.ajustar()
+    resultados = []
+    for posicao in range(tamanho):
+        memoria_local = base.copiar()
+        for slot, coluna in zip(slots, valores):
+            memoria_local.valores[slot] = coluna[posicao]
+        resultados.append(executarCodigo(codigo, memoria_local))
+    return resultados
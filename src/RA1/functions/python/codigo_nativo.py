@@ -0,0 +1,561 @@
+#!/usr/bin/env python3
+
+# Integrantes do grupo (ordem alfabética):
+# Nome Completo 1 - Breno Rossi Duarte
+# Nome Completo 2 - Francisco Bley Ruthes
+# Nome Completo 3 - Rafael Olivare Piveta
+# Nome Completo 4 - Stefan Benjamim Seixas Lourenço Rodrigues
+#
+# Nome do grupo no Canvas: RA2_1
+
+# Tradução de linhas RPN para funções Python. A árvore otimizada de compilador.py
+# (a mesma que vira bytecode) é escrita como o código-fonte de uma função: a pilha
+# RPN dos quadros de profundidade conhecida vira variáveis locais, as variáveis da
+# linha são os slots de Memoria.valores, os operadores são as expressões Python do
+# registro (Operador.python) e IFELSE/WHILE/FOR viram if/while com try/except. O
+# fonte é compilado uma vez com compile() e a função fica em cache pelo próprio texto.
+#
+# A função é guardada em CodigoCompilado.nativo e executarCodigo a chama no lugar do
+# bytecode, com o mesmo comportamento: resultado, diagnósticos (sem posição), erros
+# tratados nas estruturas e consumo do orçamento, contado nas instruções do bytecode
+# (o custo de cada volta de laço vem de REPETIR/FOR_PROXIMO). Linhas que o Python não
+# compila (estruturas aninhadas além do limite de blocos do compile()) ficam só com
+# o bytecode.
+#
+# Para o perfil (perfil.py), a função pode ser gerada com contadores: cada operador,
+# entrada, volta e limite atingido de laço incrementa uma posição da lista `c`,
+# na mesma ordem dos contadores do bytecode instrumentado.
+
+import math
+from functools import lru_cache
+
+from .tokens import Token, Tipo_de_Token
+from .operadores import Operador, OPERADORES_POR_TIPO, ARITMETICO
+from .memoria import TabelaSimbolos, AUSENTE, CONTADOR_FOR
+from .orcamento import OrcamentoExcedido
+from .diagnosticos import OPERANDOS_INSUFICIENTES, ESTRUTURA_INCOMPLETA, ERRO_ESTRUTURA
+from .perfil import ContadoresLinha, ENTRADAS, VOLTAS, LIMITES
+from .maquina_virtual import (Opcode, CodigoCompilado, arredondar, aritmetica, relacional, negacao,
+                              res_indice, res_ultimo, operar, decidir_logico)
+from .compilador import (No, Constante, Variavel, HistoricoUltimo, HistoricoIndice, Grupo, ResPilha, Quadro,
+                         CurtoCircuito, Atribuicao, SeSenao, Enquanto, Para, ErroEstrutura, Protegido, Sequencia, Memorizado,
+                         Invariante, PreCalculo, RelatorioOtimizacao, prepararArvore, gerarBytecode,
+                         analisar_quadro, sempre_float, grupos_no_lugar)
+
+# Funções geradas em cache (pelo código-fonte)
+TAMANHO_CACHE = 4096
+
+# Nomes globais do código gerado
+_GLOBAIS = {
+    'AUSENTE': AUSENTE,
+    'OrcamentoExcedido': OrcamentoExcedido,
+    '_O': OPERADORES_POR_TIPO,
+    '_INF': math.inf,
+    '_NAN': math.nan,
+    'arredondar': arredondar,
+    'aritmetica': aritmetica,
+    'relacional': relacional,
+    'negacao': negacao,
+    'res_indice': res_indice,
+    'res_ultimo': res_ultimo,
+    'operar': operar,
+    'decidir_logico': decidir_logico,
+}
+
+_CABECALHO = "def _linha(v, hist, relatar, orcamento, limite, proxima, inicio_linha, gasto, memo, c):"
+
+
+def _literal(valor) -> str:
+    """Expressão Python para uma constante da árvore."""
+    if valor.__class__ is float:
+        if valor != valor:
+            return '_NAN'
+        if math.isinf(valor):
+            return '_INF' if valor > 0 else '(-_INF)'
+        return repr(valor) if math.copysign(1.0, valor) > 0 else f"({valor!r})"
+    if valor.__class__ is str:
+        return repr(valor)
+    raise ValueError(f"Constante sem tradução para Python: {valor!r}")
+
+
+class _Gerador:
+    # Cada método que traduz um nó escreve os comandos que o calculam e devolve
+    # (expressão com o valor, True se o valor com certeza é float). A expressão é um
+    # literal ou uma variável local que não muda mais depois de calculada.
+
+    def __init__(self, simbolos: TabelaSimbolos, custos: list[int], contadores: ContadoresLinha | None = None):
+        self.simbolos = simbolos
+        self.contadores = contadores
+        # Custo de uma volta de cada laço, na ordem em que aparecem na linha
+        self.custos = iter(custos)
+        self.linhas = []
+        self.nivel = 2
+        self.nomes = 0
+        # Variável local com o valor pré-calculado de cada Invariante (por id do nó)
+        self.invariantes = {}
+
+    def novo(self, prefixo: str = 't') -> str:
+        self.nomes += 1
+        return f"{prefixo}{self.nomes}"
+
+    def emitir(self, texto: str):
+        self.linhas.append('    ' * self.nivel + texto)
+
+    def contar(self, indice: int | None):
+        # Contador do perfil (índice None: sem contadores)
+        if indice is not None:
+            self.emitir(f"c[{indice}] += 1")
+
+    def contar_operador(self, operador: Operador):
+        if self.contadores is not None:
+            self.contar(self.contadores.operador(operador.lexema))
+
+    def novo_laco(self, tipo: str) -> int | None:
+        return None if self.contadores is None else self.contadores.novoLaco(tipo)
+
+    def atribuir(self, expressao: str) -> str:
+        nome = self.novo()
+        self.emitir(f"{nome} = {expressao}")
+        return nome
+
+    def no(self, no: No) -> tuple[str, bool]:
+        if isinstance(no, Constante):
+            return _literal(no.valor), no.valor.__class__ is float
+        if isinstance(no, Variavel):
+            nome = self.atribuir(f"v[{self.simbolos.slot(no.nome)}]")
+            self.emitir(f"if {nome} is AUSENTE: {nome} = 0.0")
+            return nome, False
+        if isinstance(no, Quadro):
+            return self.quadro(no)
+        if isinstance(no, Atribuicao):
+            valor = self.no(no.no)
+            self.emitir(f"v[{self.simbolos.slot(no.nome)}] = {valor[0]}")
+            return valor
+        if isinstance(no, HistoricoUltimo):
+            return self.atribuir("hist[-1] if hist else 0.0"), False
+        if isinstance(no, HistoricoIndice):
+            return self.historico_indice(no), False
+        if isinstance(no, SeSenao):
+            return self.protegido("IFELSE", lambda resultado: self.se_senao(no, resultado)), False
+        if isinstance(no, Enquanto):
+            return self.protegido("WHILE", lambda resultado: self.enquanto(no, resultado)), False
+        if isinstance(no, Para):
+            return self.protegido("FOR", lambda resultado: self.para(no, resultado)), False
+        if isinstance(no, Sequencia):
+            valor = None
+            for nome, passo in no.passos:
+                if nome is not None:
+                    slot = self.simbolos.slot(nome)
+                    self.emitir(f"if v[{slot}] is AUSENTE: v[{slot}] = 0.0")
+                valor = self.no(passo)
+            return valor
+        if isinstance(no, ErroEstrutura):
+            self.emitir(f"relatar({ESTRUTURA_INCOMPLETA!r}, {no.mensagem!r}, None)")
+            return '0.0', True
+        if isinstance(no, Protegido):
+            return self.protegido(no.nome, lambda resultado: self.emitir(f"{resultado} = {self.no(no.no)[0]}")), False
+        if isinstance(no, Memorizado):
+            return self.memorizado(no)
+        if isinstance(no, Invariante):
+            return self.invariante(no)
+        if isinstance(no, PreCalculo):
+            self.pre_calculo(no)
+            return self.no(no.laco)
+        raise ValueError(f"Nó sem tradução para Python: {type(no).__name__}")
+
+    def historico_indice(self, no: HistoricoIndice) -> str:
+        # HIST_INDICE: o índice é o número do token, convertido na execução
+        try:
+            indice = int(float(no.indice))
+        except (ValueError, OverflowError, TypeError):
+            indice = self.atribuir(f"int(float({_literal(no.indice)}))")
+            return self.atribuir(f"res_indice({indice}, hist, relatar, None)")
+        if indice <= 0:
+            return self.atribuir(f"res_indice({indice}, hist, relatar, None)")
+        return self.atribuir(f"hist[-{indice}] if len(hist) >= {indice} else res_indice({indice}, hist, relatar, None)")
+
+    def memorizado(self, no: Memorizado) -> tuple[str, bool]:
+        # MEMO_BUSCAR/MEMO_GUARDAR
+        valor = self.novo()
+        self.emitir("memo.consultas += 1")
+        self.emitir(f"{valor} = memo.valores[{no.indice}]")
+        self.emitir(f"if {valor} is AUSENTE:")
+        self.nivel += 1
+        calculado, e_float = self.no(no.no)
+        self.emitir(f"{valor} = {calculado}")
+        numeros = " and ".join(f"(v[{slot}].__class__ is float or v[{slot}] is AUSENTE)" for slot in no.slots)
+        self.emitir(f"if {numeros}:")
+        self.emitir(f"    memo.valores[{no.indice}] = {valor}")
+        self.nivel -= 1
+        self.emitir("else:")
+        self.emitir("    memo.acertos += 1")
+        return valor, e_float
+
+    def pre_calculo(self, no: PreCalculo):
+        # PREPARAR_INVARIANTE: None fica no lugar do valor se alguma variável lida não é número
+        for invariante in no.invariantes:
+            nome = self.invariantes[id(invariante)] = self.novo('h')
+            self.emitir(f"{nome} = None")
+            numeros = " and ".join(f"(v[{slot}].__class__ is float or v[{slot}] is AUSENTE)"
+                                   for slot in invariante.slots)
+            self.emitir(f"if {numeros or 'True'}:")
+            self.nivel += 1
+            self.emitir(f"{nome} = {self.no(invariante.no)[0]}")
+            self.nivel -= 1
+
+    def invariante(self, no: Invariante) -> tuple[str, bool]:
+        # CARREGAR_INVARIANTE: sem o valor pré-calculado, o quadro é avaliado no lugar
+        valor = self.atribuir(self.invariantes[id(no)])
+        self.emitir(f"if {valor} is None:")
+        self.nivel += 1
+        calculado, e_float = self.no(no.no)
+        self.emitir(f"{valor} = {calculado}")
+        self.nivel -= 1
+        return valor, e_float
+
+    # --- quadros RPN ---
+
+    def binario(self, operador: Operador, a: tuple, b: tuple) -> tuple[str, bool]:
+        (valor_a, float_a), (valor_b, float_b) = a, b
+        if operador.categoria == ARITMETICO:
+            geral = f"aritmetica(_O[{operador.tipo}], {valor_a}, {valor_b})"
+            # Aritmética com um operando float dá float ou levanta TypeError
+            resultado_float = float_a or float_b
+        else:
+            geral = f"relacional(_O[{operador.tipo}], {valor_a}, {valor_b}, relatar, None)"
+            resultado_float = True
+        if operador.python is None:
+            return self.atribuir(geral), resultado_float
+        rapido = operador.python.format(a=valor_a, b=valor_b)
+        testes = [f"{valor}.__class__ is float" for valor, e_float in (a, b) if not e_float]
+        if not testes:
+            return self.atribuir(rapido), resultado_float
+        return self.atribuir(f"({rapido}) if {' and '.join(testes)} else {geral}"), resultado_float
+
+    def unario(self, operador: Operador, a: tuple) -> tuple[str, bool]:
+        valor, e_float = a
+        rapido = operador.python.format(a=valor)
+        if e_float:
+            return self.atribuir(rapido), True
+        return self.atribuir(f"({rapido}) if {valor}.__class__ is float "
+                             f"else negacao(_O[{operador.tipo}], {valor}, relatar, None)"), True
+
+    def quadro(self, quadro: Quadro) -> tuple[str, bool]:
+        estatico, _ = analisar_quadro(quadro)
+        no_lugar = grupos_no_lugar(quadro, estatico)
+        temps = {}
+        if not no_lugar:
+            for posicao, item in enumerate(quadro.itens):
+                if isinstance(item, Grupo):
+                    temps[posicao] = self.no(item.no)
+        if not estatico:
+            return self.quadro_dinamico(quadro, temps)
+
+        pilha = []
+        # Resultados de operadores já saem arredondados
+        arredondado = False
+        for posicao, item in enumerate(quadro.itens):
+            if isinstance(item, (Constante, Variavel)):
+                pilha.append(self.no(item))
+                arredondado = False
+            elif isinstance(item, Grupo):
+                if no_lugar:
+                    valor, e_float = self.no(item.no)
+                    converter = not sempre_float(item.no)
+                else:
+                    # CARREGAR_TEMP converte com float()
+                    valor, e_float = temps[posicao]
+                    converter = True
+                if converter and not e_float:
+                    valor = self.atribuir(f"float({valor})")
+                pilha.append((valor, True))
+                arredondado = False
+            elif isinstance(item, Memorizado):
+                pilha.append(self.memorizado(item))
+                arredondado = True
+            elif isinstance(item, Invariante):
+                pilha.append(self.invariante(item))
+                arredondado = True
+            elif isinstance(item, CurtoCircuito):
+                self.curto_circuito(item, pilha)
+                arredondado = True
+            elif isinstance(item, ResPilha):
+                if pilha:
+                    indice = pilha.pop()[0]
+                    pilha.append((self.atribuir(f"res_indice(int({indice}), hist, relatar, None)"), False))
+                else:
+                    pilha.append((self.atribuir("res_ultimo(hist, relatar, None)"), False))
+                arredondado = False
+            else:
+                operador = item.operador
+                self.contar_operador(operador)
+                if len(pilha) < operador.aridade:
+                    self.emitir(f"relatar({OPERANDOS_INSUFICIENTES!r}, {operador.mensagem_insuficiente()!r}, None)")
+                    pilha.append(('0.0', True))
+                elif operador.aridade == 1:
+                    pilha.append(self.unario(operador, pilha.pop()))
+                else:
+                    b = pilha.pop()
+                    pilha.append(self.binario(operador, pilha.pop(), b))
+                arredondado = True
+
+        if not pilha:
+            return '0.0', True
+        valor, e_float = pilha[-1]
+        if arredondado:
+            return valor, e_float
+        if e_float:
+            return self.atribuir(f"round({valor}, 2)"), True
+        return self.atribuir(f"round({valor}, 2) if {valor}.__class__ is float else arredondar({valor})"), False
+
+    def quadro_dinamico(self, quadro: Quadro, temps: dict) -> tuple[str, bool]:
+        # A profundidade da pilha depende dos valores: pilha em uma lista
+        pilha = self.novo('p')
+        self.emitir(f"{pilha} = []")
+        for posicao, item in enumerate(quadro.itens):
+            if isinstance(item, (Constante, Variavel)):
+                self.emitir(f"{pilha}.append({self.no(item)[0]})")
+            elif isinstance(item, Grupo):
+                valor, e_float = temps[posicao]
+                self.emitir(f"{pilha}.append({valor if e_float else f'float({valor})'})")
+            elif isinstance(item, CurtoCircuito):
+                # SALTAR_LOGICO dinâmico: o topo só é o operando esquerdo se a lista não está vazia
+                ou = item.operador.tipo == Tipo_de_Token.OR
+                decidido = self.atribuir(f"decidir_logico({pilha}[-1], {ou}) if {pilha} else None")
+                self.emitir(f"if {decidido} is not None:")
+                self.emitir(f"    {pilha}[-1] = {decidido}")
+                self.emitir("else:")
+                self.nivel += 1
+                self.emitir(f"{pilha}.append({self.operando_direito(item.no)[0]})")
+                self.operador_dinamico(pilha, item.operador)
+                self.nivel -= 1
+            elif isinstance(item, ResPilha):
+                self.emitir(f"if {pilha} and isinstance({pilha}[-1], (int, float)):")
+                self.emitir(f"    {pilha}.append(res_indice(int({pilha}.pop()), hist, relatar, None))")
+                self.emitir("else:")
+                self.emitir(f"    {pilha}.append(res_ultimo(hist, relatar, None))")
+            else:
+                self.operador_dinamico(pilha, item.operador)
+        return self.atribuir(f"arredondar({pilha}[-1] if {pilha} else 0.0)"), False
+
+    def operador_dinamico(self, pilha: str, operador: Operador):
+        self.contar_operador(operador)
+        self.emitir(f"if len({pilha}) < {operador.aridade}:")
+        self.emitir(f"    relatar({OPERANDOS_INSUFICIENTES!r}, {operador.mensagem_insuficiente()!r}, None)")
+        self.emitir(f"    {pilha}.append(0.0)")
+        self.emitir("else:")
+        if operador.aridade == 1:
+            self.emitir(f"    {pilha}[-1] = negacao(_O[{operador.tipo}], {pilha}[-1], relatar, None)")
+        else:
+            self.emitir(f"    b = {pilha}.pop()")
+            self.emitir(f"    {pilha}[-1] = operar(_O[{operador.tipo}], {pilha}[-1], b, relatar, None)")
+
+    def operando_direito(self, no: No) -> tuple[str, bool]:
+        # Grupo de um CurtoCircuito, avaliado no lugar e convertido com float() (PARA_FLOAT)
+        valor, e_float = self.no(no)
+        if not sempre_float(no) and not e_float:
+            valor = self.atribuir(f"float({valor})")
+        return valor, True
+
+    def curto_circuito(self, item: CurtoCircuito, pilha: list):
+        # SALTAR_LOGICO: o grupo e o operador ficam no ramo em que o topo não decide
+        operador = item.operador
+        if not pilha:
+            # Sem operando esquerdo não há o que decidir: o operador relata o erro
+            pilha.append(self.operando_direito(item.no))
+            self.contar_operador(operador)
+            self.emitir(f"relatar({OPERANDOS_INSUFICIENTES!r}, {operador.mensagem_insuficiente()!r}, None)")
+            pilha.append(('0.0', True))
+            return
+        a = pilha.pop()
+        valor_a, float_a = a
+        ou = operador.tipo == Tipo_de_Token.OR
+        resultado = self.novo()
+        if float_a:
+            self.emitir(f"if {valor_a} {'!=' if ou else '=='} 0.0:")
+            self.emitir(f"    {resultado} = {'1.0' if ou else '0.0'}")
+            self.emitir("else:")
+        else:
+            self.emitir(f"{resultado} = decidir_logico({valor_a}, {ou})")
+            self.emitir(f"if {resultado} is None:")
+        self.nivel += 1
+        b = self.operando_direito(item.no)
+        self.contar_operador(operador)
+        self.emitir(f"{resultado} = {self.binario(operador, a, b)[0]}")
+        self.nivel -= 1
+        pilha.append((resultado, True))
+
+    # --- estruturas ---
+
+    def protegido(self, nome: str, corpo) -> str:
+        # TENTAR/FIM_TENTAR: o erro vira diagnóstico e o valor 0.0, exceto o de orçamento
+        resultado = self.novo('r')
+        self.emitir("try:")
+        self.nivel += 1
+        corpo(resultado)
+        self.nivel -= 1
+        self.emitir("except Exception as e:")
+        self.emitir("    if e.__class__ is OrcamentoExcedido:")
+        self.emitir("        raise")
+        self.emitir(f"    relatar({ERRO_ESTRUTURA!r}, f\"ERRO no {nome}: {{e}}\", None)")
+        self.emitir(f"    {resultado} = 0.0")
+        return resultado
+
+    def condicao(self, no: No) -> str:
+        valor, e_float = self.no(no)
+        return f"{valor} == 0.0" if e_float else f"float({valor}) == 0.0"
+
+    def ramo(self, no: No, resultado: str):
+        self.nivel += 1
+        self.emitir(f"{resultado} = {self.no(no)[0]}")
+        self.nivel -= 1
+
+    def repetir(self, custo: int, laco: int | None):
+        self.emitir(f"gasto += {custo}")
+        self.emitir("if gasto >= proxima:")
+        if laco is None:
+            self.emitir("    proxima = orcamento.verificar(gasto, inicio_linha)")
+            return
+        self.emitir("    try:")
+        self.emitir("        proxima = orcamento.verificar(gasto, inicio_linha)")
+        self.emitir("    except OrcamentoExcedido:")
+        self.emitir(f"        c[{laco + LIMITES}] += 1")
+        self.emitir("        raise")
+
+    def limite_voltas(self, iteracoes: str, laco: int | None):
+        self.emitir(f"if {iteracoes} >= limite:")
+        self.nivel += 1
+        self.contar(None if laco is None else laco + LIMITES)
+        self.emitir("raise OrcamentoExcedido.iteracoes(limite)")
+        self.nivel -= 1
+
+    def se_senao(self, no: SeSenao, resultado: str):
+        self.emitir(f"if {self.condicao(no.condicao)}:")
+        self.ramo(no.falso, resultado)
+        self.emitir("else:")
+        self.ramo(no.verdadeiro, resultado)
+
+    def enquanto(self, no: Enquanto, resultado: str):
+        custo = next(self.custos)
+        laco = self.novo_laco('WHILE')
+        iteracoes = self.novo('i')
+        self.emitir(f"{resultado} = 0.0")
+        self.contar(None if laco is None else laco + ENTRADAS)
+        self.emitir(f"{iteracoes} = 0")
+        self.emitir("while True:")
+        self.nivel += 1
+        self.emitir(f"if {self.condicao(no.condicao)}:")
+        self.emitir("    break")
+        self.limite_voltas(iteracoes, laco)
+        self.emitir(f"{iteracoes} += 1")
+        self.contar(None if laco is None else laco + VOLTAS)
+        self.emitir(f"{resultado} = {self.no(no.corpo)[0]}")
+        self.repetir(custo, laco)
+        self.nivel -= 1
+
+    def para(self, no: Para, resultado: str):
+        custo = next(self.custos)
+        laco = self.novo_laco('FOR')
+        contador, final, incremento, iteracoes = self.novo('c'), self.novo('f'), self.novo('d'), self.novo('i')
+        slot = self.simbolos.slot(CONTADOR_FOR)
+        self.emitir(f"{contador} = int({self.no(no.inicial)[0]})")
+        self.emitir(f"{final} = int({self.no(no.final)[0]})")
+        self.emitir(f"{incremento} = int({self.no(no.incremento)[0]}) or 1")
+        self.emitir(f"{resultado} = 0.0")
+        self.emitir(f"{iteracoes} = 0")
+        self.emitir(f"v[{slot}] = float({contador})")
+        self.contar(None if laco is None else laco + ENTRADAS)
+        self.emitir(f"if {contador} < {final}:")
+        self.nivel += 1
+        self.emitir("while True:")
+        self.nivel += 1
+        self.contar(None if laco is None else laco + VOLTAS)
+        self.emitir(f"{resultado} = {self.no(no.corpo)[0]}")
+        self.repetir(custo, laco)
+        self.emitir(f"{contador} += {incremento}")
+        self.emitir(f"{iteracoes} += 1")
+        self.emitir(f"if {contador} >= {final}:")
+        self.emitir("    break")
+        self.limite_voltas(iteracoes, laco)
+        self.nivel -= 2
+        self.emitir(f"v[{slot}] = AUSENTE")
+
+
+def _custos_lacos(codigo: CodigoCompilado) -> list[int]:
+    # Custo de uma volta de cada laço, ordenado pelo início do laço no bytecode
+    # (a mesma ordem em que _Gerador encontra os laços na árvore)
+    lacos = []
+    for op, arg in codigo.instrucoes:
+        if op == Opcode.REPETIR:
+            lacos.append((arg[0], arg[1]))
+        elif op == Opcode.FOR_PROXIMO:
+            lacos.append((arg[4], arg[5]))
+    return [custo for _, custo in sorted(lacos)]
+
+
+def gerarFonte(arvore: No, codigo: CodigoCompilado, contadores: ContadoresLinha | None = None) -> str:
+    """
+    Código-fonte Python da linha, a partir da árvore otimizada e do seu bytecode.
+    Com `contadores`, a função incrementa os contadores do perfil na lista `c`.
+    """
+    gerador = _Gerador(codigo.simbolos, _custos_lacos(codigo), contadores)
+    valor, _ = gerador.no(arvore)
+    gerador.emitir(f"resultado = {valor}")
+    if next(gerador.custos, None) is not None:
+        raise ValueError("Laços do bytecode sem correspondência na árvore")
+    return "\n".join([
+        _CABECALHO,
+        "    try:",
+        *gerador.linhas,
+        "    except Exception:",
+        "        if orcamento is not None:",
+        "            orcamento.registrar(gasto)",
+        "        raise",
+        "    if orcamento is not None:",
+        "        orcamento.registrar(gasto)",
+        "    return resultado",
+        "",
+    ])
+
+
+@lru_cache(maxsize=TAMANHO_CACHE)
+def funcaoNativa(fonte: str):
+    """Função Python do código-fonte `fonte` (de gerarFonte), compilada uma vez por processo."""
+    ambiente = dict(_GLOBAIS)
+    exec(compile(fonte, '<rpn nativo>', 'exec'), ambiente)
+    return ambiente['_linha']
+
+
+def fonteNativa(arvore: No, codigo: CodigoCompilado, contadores: ContadoresLinha | None = None) -> str | None:
+    """
+    Código-fonte da função da linha (já compilado por funcaoNativa), ou None se a
+    linha não puder ser traduzida. Funções não vão para outros processos; o fonte vai.
+    """
+    try:
+        fonte = gerarFonte(arvore, codigo, contadores)
+        funcaoNativa(fonte)
+    except (SyntaxError, RecursionError, MemoryError, ValueError):
+        # Por exemplo, mais de 20 blocos try/while aninhados
+        return None
+    return fonte
+
+
+def compilarLinhaNativa(tokens: list[Token], relatorio: RelatorioOtimizacao | None = None,
+                        simbolos: TabelaSimbolos | None = None, subexpressoes=None,
+                        perfilado: bool = False, curto_circuito: bool = False) -> CodigoCompilado:
+    """
+    Como compilador.compilarLinha, com a função Python equivalente em codigo.nativo
+    (executada por executarCodigo no lugar do bytecode). Se a linha não puder ser
+    traduzida, o código fica só com o bytecode. Com `perfilado`, a função conta
+    operadores e laços em codigo.contadores (perfil.ContadoresLinha).
+    """
+    if simbolos is None:
+        simbolos = TabelaSimbolos()
+    arvore = prepararArvore(tokens, relatorio, simbolos, subexpressoes, curto_circuito)
+    codigo = gerarBytecode(arvore, simbolos, subexpressoes)
+    contadores = ContadoresLinha() if perfilado else None
+    fonte = fonteNativa(arvore, codigo, contadores)
+    if fonte is not None:
+        codigo.nativo = funcaoNativa(fonte)
+        codigo.contadores = contadores
+    return codigo
@@ -0,0 +1,1095 @@
+#!/usr/bin/env python3
+
+# Integrantes do grupo (ordem alfabética):
+# Nome Completo 1 - Breno Rossi Duarte
+# Nome Completo 2 - Francisco Bley Ruthes
+# Nome Completo 3 - Rafael Olivare Piveta
+# Nome Completo 4 - Stefan Benjamim Seixas Lourenço Rodrigues
+#
+# Nome do grupo no Canvas: RA2_1
+
+# Compilador de linhas RPN para o bytecode de maquina_virtual.py.
+# A linha é analisada uma única vez e convertida em uma árvore intermediária
+# (mesmos casos de executarExpressao/processarTokens em rpn_calc.py), que depois
+# é traduzida para instruções de pilha. Laços executam só o bytecode.
+# Os percursos da árvore (construção, otimização e emissão) são geradores executados
+# por percorrer, com uma pilha explícita: a profundidade de aninhamento da linha não
+# é limitada pela recursão do Python.
+
+from .tokens import Token, Tipo_de_Token, pares_de
+from .rpn_calc import encontrar_blocos_controle, IGNORADOS_NA_EXECUCAO, SEM_PARENTESES, LOGICOS
+from .operadores import Operador, OPERADORES_POR_TIPO, ARITMETICO
+from .memoria import Memoria, TabelaSimbolos, CONTADOR_FOR
+from .diagnosticos import Diagnosticos
+from .maquina_virtual import (Opcode, CodigoCompilado, executarCodigo,
+                              arredondar, negacao, operar)
+
+# ============================================================================
+# REPRESENTAÇÃO INTERMEDIÁRIA
+# ============================================================================
+
+class No:
+    __slots__ = ()
+
+class Constante(No):
+    __slots__ = ('valor',)
+    def __init__(self, valor):
+        self.valor = valor
+
+class Variavel(No):
+    # Leitura do slot da variável (0.0 se ainda não existir)
+    __slots__ = ('nome',)
+    def __init__(self, nome: str):
+        self.nome = nome
+
+class HistoricoUltimo(No):
+    # (RES) sozinho: último resultado ou 0.0, sem mensagem de erro
+    __slots__ = ()
+
+class HistoricoIndice(No):
+    # (N RES): resultado de N linhas atrás
+    __slots__ = ('indice',)
+    def __init__(self, indice):
+        self.indice = indice
+
+class Grupo(No):
+    # Subexpressão entre parênteses dentro de um quadro RPN
+    __slots__ = ('no',)
+    def __init__(self, no: No):
+        self.no = no
+
+class Operacao(No):
+    # Operador RPN; `operador` é a entrada do registro (operadores.py)
+    __slots__ = ('operador',)
+    def __init__(self, operador: Operador):
+        self.operador = operador
+
+class CurtoCircuito(No):
+    # Subexpressão entre parênteses seguida de && ou || (construirArvore com
+    # curto_circuito): o operando direito só é avaliado se o esquerdo, no topo da
+    # pilha, não decide o resultado. Grupos nunca atribuem variáveis
+    __slots__ = ('no', 'operador')
+    def __init__(self, no: No, operador: Operador):
+        self.no = no
+        self.operador = operador
+
+class ResPilha(No):
+    # RES no meio de uma expressão RPN (usa o topo da pilha como índice, se houver)
+    __slots__ = ()
+
+class Quadro(No):
+    # Avaliação de processarTokens: subexpressões primeiro, depois a pilha RPN
+    __slots__ = ('itens',)
+    def __init__(self, itens: list[No]):
+        self.itens = itens
+
+class Atribuicao(No):
+    __slots__ = ('nome', 'no')
+    def __init__(self, nome: str, no: No):
+        self.nome = nome
+        self.no = no
+
+class SeSenao(No):
+    __slots__ = ('condicao', 'verdadeiro', 'falso')
+    def __init__(self, condicao: No, verdadeiro: No, falso: No):
+        self.condicao = condicao
+        self.verdadeiro = verdadeiro
+        self.falso = falso
+
+class Enquanto(No):
+    __slots__ = ('condicao', 'corpo')
+    def __init__(self, condicao: No, corpo: No):
+        self.condicao = condicao
+        self.corpo = corpo
+
+class Para(No):
+    __slots__ = ('inicial', 'final', 'incremento', 'corpo')
+    def __init__(self, inicial: No, final: No, incremento: No, corpo: No):
+        self.inicial = inicial
+        self.final = final
+        self.incremento = incremento
+        self.corpo = corpo
+
+class ErroEstrutura(No):
+    # Estrutura de controle sem os blocos necessários: imprime a mensagem e vale 0.0
+    __slots__ = ('mensagem',)
+    def __init__(self, mensagem: str):
+        self.mensagem = mensagem
+
+class Protegido(No):
+    # Ramo de IFELSE escolhido em tempo de compilação: erros ainda viram "ERRO no IFELSE"
+    __slots__ = ('nome', 'no')
+    def __init__(self, nome: str, no: No):
+        self.nome = nome
+        self.no = no
+
+class Sequencia(No):
+    # Corpo de laço: lista de (variável a inicializar ou None, expressão)
+    __slots__ = ('passos',)
+    def __init__(self, passos: list[tuple]):
+        self.passos = passos
+
+class Memorizado(No):
+    # Subexpressão pura com valor memorizado na tabela de subexpressoes.py (posição
+    # `indice`); `slots` são as variáveis que ela lê. Também aparece como item de um
+    # Quadro, no lugar de um trecho da RPN (o `no` é o Quadro com os itens do trecho)
+    __slots__ = ('indice', 'no', 'slots')
+    def __init__(self, indice: int, no: No, slots: tuple):
+        self.indice = indice
+        self.no = no
+        self.slots = slots
+
+class Invariante(No):
+    # Quadro de um laço que não lê variáveis escritas no laço. O valor é calculado
+    # antes do laço (PreCalculo) se as variáveis lidas (`slots`) são números; senão,
+    # o quadro `no` é avaliado no lugar, como antes
+    __slots__ = ('no', 'slots')
+    def __init__(self, no: Quadro, slots: tuple):
+        self.no = no
+        self.slots = slots
+
+class PreCalculo(No):
+    # Laço (Enquanto ou Para) com as suas subexpressões invariantes calculadas antes dele
+    __slots__ = ('invariantes', 'laco')
+    def __init__(self, invariantes: list[Invariante], laco: No):
+        self.invariantes = invariantes
+        self.laco = laco
+
+def percorrer(gerador):
+    """
+    Executa um percurso escrito como gerador recursivo: cada `yield gerador_filho`
+    suspende o pai até o filho terminar e devolve o valor de retorno do filho. Os
+    geradores pendentes ficam em uma lista, não na pilha de chamadas do Python.
+    """
+    pendentes = [gerador]
+    valor = None
+    while True:
+        try:
+            filho = pendentes[-1].send(valor)
+        except StopIteration as fim:
+            pendentes.pop()
+            if not pendentes:
+                return fim.value
+            valor = fim.value
+        else:
+            pendentes.append(filho)
+            valor = None
+
+# ============================================================================
+# TOKENS -> REPRESENTAÇÃO INTERMEDIÁRIA
+# ============================================================================
+
+_ERROS_ESTRUTURA = {
+    Tipo_de_Token.IFELSE: (3, "ERRO -> IFELSE requer 3 blocos: (condição)(verdadeiro)(falso)"),
+    Tipo_de_Token.WHILE: (2, "ERRO -> WHILE requer 2 blocos: (condição)(corpo)"),
+    Tipo_de_Token.FOR: (4, "ERRO -> FOR requer 4 blocos: (inicial)(final)(incremento)(corpo)"),
+}
+
+def construirArvore(tokens: list[Token], curto_circuito: bool = False) -> No:
+    """
+    Converte os tokens de uma linha na árvore equivalente a executarExpressao. Com
+    `curto_circuito`, equivale a executarExpressao(..., curto_circuito=True): os
+    grupos logo antes de && ou || viram nós CurtoCircuito.
+    """
+    return percorrer(_expressao(tokens, None, 0, len(tokens), curto_circuito))
+
+def _expressao(tokens, pares, inicio, fim, curto_circuito):
+    # executarExpressao. Com estrutura de controle os tokens não são copiados: laços
+    # aninhados não copiam o corpo a cada nível
+    limpos = []
+    for i in range(inicio, fim):
+        tipo = tokens[i].tipo
+        if tipo in Tipo_de_Token.CONTROLE:
+            if pares is None:
+                pares = pares_de(tokens)
+            return (yield _estrutura(tokens, pares, inicio, fim, curto_circuito))
+        if tipo not in IGNORADOS_NA_EXECUCAO:
+            limpos.append(tokens[i])
+    if not limpos:
+        return Constante(0.0)
+
+    if (len(limpos) == 2 and limpos[0].tipo == Tipo_de_Token.NUMERO_REAL
+            and limpos[1].tipo == Tipo_de_Token.VARIAVEL):
+        return Atribuicao(limpos[1].valor, Constante(float(limpos[0].valor)))
+
+    if len(limpos) >= 2 and limpos[-1].tipo == Tipo_de_Token.VARIAVEL:
+        return Atribuicao(limpos[-1].valor, _processar(limpos, SEM_PARENTESES, 0, len(limpos) - 1))
+
+    return _processar(limpos, SEM_PARENTESES, 0, len(limpos))
+
+def _estrutura(tokens, pares, inicio, fim, curto_circuito):
+    # processarEstruturaControle + processarIFELSE/WHILE/FOR
+    for i in range(inicio, fim):
+        tipo = tokens[i].tipo
+        if tipo in Tipo_de_Token.CONTROLE:
+            num_blocos, mensagem = _ERROS_ESTRUTURA[tipo]
+            blocos, _ = encontrar_blocos_controle(tokens, i + 1, num_blocos, fim, pares)
+            if len(blocos) != num_blocos:
+                return ErroEstrutura(mensagem)
+            if tipo == Tipo_de_Token.IFELSE:
+                return SeSenao(*(_processar(tokens, pares, a, b, curto_circuito) for a, b in blocos))
+            if tipo == Tipo_de_Token.WHILE:
+                return Enquanto(_processar(tokens, pares, *blocos[0], curto_circuito),
+                                (yield _corpo(tokens, pares, *blocos[1], curto_circuito)))
+            parametros = [_processar(tokens, pares, a, b, curto_circuito) for a, b in blocos[:3]]
+            return Para(*parametros, (yield _corpo(tokens, pares, *blocos[3], curto_circuito)))
+    return Constante(0.0)
+
+def _corpo(tokens, pares, inicio, fim, curto_circuito):
+    # executarCorpoLoop
+    if inicio >= fim:
+        return Constante(0.0)
+
+    passos = []
+    i = inicio
+    while i < fim:
+        if tokens[i].tipo == Tipo_de_Token.ABRE_PARENTESES:
+            fecha = pares[i]
+            if fecha < 0 or fecha >= fim:
+                fecha = fim
+            if fecha > i + 1:
+                ultimo = tokens[fecha - 1]
+                nome = ultimo.valor if ultimo.tipo == Tipo_de_Token.VARIAVEL else None
+                passos.append((nome, (yield _expressao(tokens, pares, i, min(fecha + 1, fim), curto_circuito))))
+            i = fecha + 1
+        else:
+            i += 1
+
+    if not passos:
+        return _processar(tokens, pares, inicio, fim, curto_circuito)
+    return Sequencia(passos)
+
+def _no_direto(tokens, inicio, fim) -> No | None:
+    # Casos de processarTokens sem pilha RPN (rpn_calc._valor_direto)
+    tamanho = fim - inicio
+    if tamanho <= 0:
+        return Constante(0.0)
+
+    if tamanho == 1:
+        token = tokens[inicio]
+        if token.tipo == Tipo_de_Token.NUMERO_REAL:
+            return Constante(float(token.valor))
+        if token.tipo == Tipo_de_Token.VARIAVEL:
+            return Variavel(token.valor)
+        if token.tipo == Tipo_de_Token.RES:
+            return HistoricoUltimo()
+        return Constante(0.0)
+
+    if (tamanho == 2 and tokens[inicio].tipo == Tipo_de_Token.NUMERO_REAL
+            and tokens[inicio + 1].tipo == Tipo_de_Token.RES):
+        return HistoricoIndice(tokens[inicio].valor)
+    return None
+
+def _processar(tokens, pares, inicio, fim, curto_circuito=False) -> No:
+    # processarTokens: os parênteses aninhados usam uma pilha explícita de quadros
+    no = _no_direto(tokens, inicio, fim)
+    if no is not None:
+        return no
+
+    raiz = Quadro([])
+    # Quadros em construção: (quadro, fim do trecho, onde continuar no quadro de fora);
+    # `i` é a posição no mais interno
+    abertos = [(raiz, fim, fim + 1)]
+    i = inicio
+    while abertos:
+        quadro, fim_quadro, seguinte = abertos[-1]
+        if i >= fim_quadro:
+            abertos.pop()
+            # Continua no quadro de fora, depois do parêntese que fecha este (e do
+            # operador de um CurtoCircuito)
+            i = seguinte
+            continue
+        token = tokens[i]
+        tipo = token.tipo
+        if tipo == Tipo_de_Token.ABRE_PARENTESES:
+            if pares is None or pares is SEM_PARENTESES:
+                pares = pares_de(tokens)
+            fecha = pares[i]
+            if fecha < 0 or fecha >= fim_quadro:
+                fecha = fim_quadro
+            if fecha > i + 1:
+                # Como em processarTokens, o grupo é adiado se o próximo token é && ou ||
+                logico = None
+                if curto_circuito and fecha + 1 < fim_quadro and tokens[fecha + 1].tipo in LOGICOS:
+                    logico = OPERADORES_POR_TIPO[tokens[fecha + 1].tipo]
+                seguinte = fecha + 1 if logico is None else fecha + 2
+                no = _no_direto(tokens, i + 1, fecha)
+                aninhado = no is None
+                if aninhado:
+                    no = Quadro([])
+                    abertos.append((no, fecha, seguinte))
+                quadro.itens.append(Grupo(no) if logico is None else CurtoCircuito(no, logico))
+                # Um quadro aninhado é preenchido a partir do token seguinte ao parêntese
+                i = i + 1 if aninhado else seguinte
+                continue
+            i = fecha + 1
+            continue
+        if tipo == Tipo_de_Token.NUMERO_REAL:
+            quadro.itens.append(Constante(float(token.valor)))
+        elif tipo == Tipo_de_Token.VARIAVEL:
+            quadro.itens.append(Variavel(token.valor))
+        elif tipo == Tipo_de_Token.RES:
+            quadro.itens.append(ResPilha())
+        elif OPERADORES_POR_TIPO[tipo] is not None:
+            quadro.itens.append(Operacao(OPERADORES_POR_TIPO[tipo]))
+        # Demais tokens (palavras-chave, parênteses soltos) são ignorados pela pilha RPN
+        i += 1
+    return raiz
+
+# ============================================================================
+# OTIMIZAÇÃO: DOBRA DE CONSTANTES E ELIMINAÇÃO DE RAMOS MORTOS
+# ============================================================================
+
+class RelatorioOtimizacao:
+    # Simplificações feitas em uma linha, em texto, na ordem em que ocorreram
+    __slots__ = ('simplificacoes',)
+
+    def __init__(self):
+        self.simplificacoes = []
+
+    def registrar(self, descricao: str):
+        self.simplificacoes.append(descricao)
+
+    def __len__(self):
+        return len(self.simplificacoes)
+
+def otimizarArvore(arvore: No, relatorio: RelatorioOtimizacao | None = None) -> No:
+    """
+    Dobra subexpressões constantes (mesmo arredondamento de arredondar_16bit) e
+    elimina o ramo não tomado de IFELSE e WHILE com condição constante.
+    Só são dobradas operações que não imprimem mensagens nem levantam exceções.
+    """
+    return percorrer(_otimizar(arvore, relatorio if relatorio is not None else RelatorioOtimizacao()))
+
+def _otimizar(no: No, relatorio: RelatorioOtimizacao):
+    if isinstance(no, Quadro):
+        return (yield _otimizar_quadro(no, relatorio))
+    if isinstance(no, Atribuicao):
+        return Atribuicao(no.nome, (yield _otimizar(no.no, relatorio)))
+    if isinstance(no, Sequencia):
+        passos = []
+        for nome, passo in no.passos:
+            passos.append((nome, (yield _otimizar(passo, relatorio))))
+        return Sequencia(passos)
+    if isinstance(no, SeSenao):
+        condicao = yield _otimizar(no.condicao, relatorio)
+        verdadeiro = yield _otimizar(no.verdadeiro, relatorio)
+        falso = yield _otimizar(no.falso, relatorio)
+        if not isinstance(condicao, Constante):
+            return SeSenao(condicao, verdadeiro, falso)
+        if float(condicao.valor) != 0.0:
+            relatorio.registrar(f"IFELSE com condição constante {condicao.valor}: ramo falso eliminado")
+            ramo = verdadeiro
+        else:
+            relatorio.registrar(f"IFELSE com condição constante {condicao.valor}: ramo verdadeiro eliminado")
+            ramo = falso
+        return ramo if isinstance(ramo, Constante) else Protegido("IFELSE", ramo)
+    if isinstance(no, Enquanto):
+        condicao = yield _otimizar(no.condicao, relatorio)
+        if isinstance(condicao, Constante) and float(condicao.valor) == 0.0:
+            relatorio.registrar(f"WHILE com condição constante {condicao.valor}: laço eliminado")
+            return Constante(0.0)
+        return Enquanto(condicao, (yield _otimizar(no.corpo, relatorio)))
+    if isinstance(no, Para):
+        # O FOR mexe em _FOR_COUNTER mesmo sem iterar: nunca é eliminado
+        filhos = []
+        for filho in (no.inicial, no.final, no.incremento, no.corpo):
+            filhos.append((yield _otimizar(filho, relatorio)))
+        return Para(*filhos)
+    return no
+
+def _otimizar_quadro(quadro: Quadro, relatorio: RelatorioOtimizacao):
+    itens = []
+    for item in quadro.itens:
+        if isinstance(item, Grupo):
+            sub = yield _otimizar(item.no, relatorio)
+            # Subexpressão constante entra na pilha como número (float(), como no token gerado)
+            itens.append(Constante(float(sub.valor)) if isinstance(sub, Constante) else Grupo(sub))
+            continue
+        if isinstance(item, CurtoCircuito):
+            sub = yield _otimizar(item.no, relatorio)
+            if not isinstance(sub, Constante):
+                itens.append(CurtoCircuito(sub, item.operador))
+                continue
+            # Operando direito constante: avaliá-lo não imprime nada, o operador volta a ser comum
+            itens.append(Constante(float(sub.valor)))
+            item = Operacao(item.operador)
+        if isinstance(item, Operacao):
+            # Os dois últimos itens constantes são exatamente os dois valores do topo da pilha.
+            # Com operandos float nenhuma operação imprime ou levanta exceção.
+            operador = item.operador
+            if operador.aridade == 1:
+                if itens and isinstance(itens[-1], Constante):
+                    a = itens.pop().valor
+                    itens.append(Constante(negacao(operador, a)))
+                    relatorio.registrar(f"{a} {operador.lexema} -> {itens[-1].valor}")
+                    continue
+            elif len(itens) >= 2 and isinstance(itens[-1], Constante) and isinstance(itens[-2], Constante):
+                b = itens.pop().valor
+                a = itens.pop().valor
+                itens.append(Constante(operar(operador, a, b)))
+                relatorio.registrar(f"{a} {b} {operador.lexema} -> {itens[-1].valor}")
+                continue
+        itens.append(item)
+
+    # Quadro só de constantes: o resultado é o topo, arredondado como em processarTokens
+    if all(isinstance(item, Constante) for item in itens):
+        return Constante(arredondar(itens[-1].valor) if itens else 0.0)
+    return Quadro(itens)
+
+# ============================================================================
+# OTIMIZAÇÃO: SUBEXPRESSÕES INVARIANTES DE LAÇOS
+# ============================================================================
+
+def escritas_dos_lacos(arvore: No) -> tuple[frozenset, dict]:
+    """
+    Variáveis que a árvore pode escrever (ATRIBUIR, INICIALIZAR e o contador do FOR)
+    e as escritas em cada WHILE/FOR dentro dela, por id do laço. Uma só passada, de
+    baixo para cima; nós repetidos (DAG de subexpressoes.py) são visitados uma vez.
+    """
+    lacos = {}
+    return percorrer(_escritas(arvore, lacos, {})), lacos
+
+def _escritas(no: No, lacos: dict, vistos: dict):
+    # Quadros não escrevem variáveis: construirArvore só cria Atribuicao fora deles
+    if isinstance(no, Quadro):
+        return frozenset()
+    anteriores = vistos.get(id(no))
+    if anteriores is not None:
+        return anteriores
+    nomes = set()
+    if isinstance(no, Atribuicao):
+        nomes.add(no.nome)
+    elif isinstance(no, Para):
+        nomes.add(CONTADOR_FOR)
+    if isinstance(no, Sequencia):
+        nomes.update(nome for nome, _ in no.passos if nome is not None)
+        filhos = [passo for _, passo in no.passos]
+    else:
+        filhos = []
+        for campo in type(no).__slots__:
+            valor = getattr(no, campo)
+            if isinstance(valor, No):
+                filhos.append(valor)
+            elif isinstance(valor, list):
+                filhos.extend(valor)
+    for filho in filhos:
+        nomes.update((yield _escritas(filho, lacos, vistos)))
+    nomes = vistos[id(no)] = frozenset(nomes)
+    if isinstance(no, (Enquanto, Para)):
+        lacos[id(no)] = nomes
+    return nomes
+
+def trechos_puros(quadro: Quadro, leituras, aceitar) -> list[tuple]:
+    """
+    Maiores trechos da RPN do quadro que formam uma subexpressão completa com
+    operador e são aceitos por `aceitar`. Simula a pilha RPN: cada valor vem de um
+    trecho contíguo de itens, formado pelos trechos dos operandos. `leituras(item)`
+    dá as variáveis lidas por um item que não é operador, ou None se ele não é puro;
+    `aceitar(inicio, fim, leituras)` devolve o que guardar para um trecho puro, ou
+    None para procurar nos trechos dos operandos. Retorna [(inicio, fim, aceito)];
+    nenhum trecho se a pilha é dinâmica ou falta operando.
+    """
+    estatico, _ = analisar_quadro(quadro)
+    if not estatico:
+        return []
+    # Grupos avaliados antes da pilha não podem entrar em um trecho avaliado no lugar
+    no_lugar = grupos_no_lugar(quadro, estatico)
+    pilha = []   # (início, fim, leituras ou None, tem operador, trechos dos operandos)
+    for i, item in enumerate(quadro.itens):
+        if isinstance(item, Operacao):
+            aridade = item.operador.aridade
+            if len(pilha) < aridade:
+                return []
+            operandos = pilha[-aridade:]
+            del pilha[-aridade:]
+            lidas = None
+            if all(operando[2] is not None for operando in operandos):
+                lidas = frozenset().union(*(operando[2] for operando in operandos))
+            pilha.append((operandos[0][0], i, lidas, True, operandos))
+        elif isinstance(item, CurtoCircuito):
+            # Operador com o operando direito dentro: o trecho até ele nunca é puro
+            if not pilha:
+                return []
+            operandos = [pilha.pop()]
+            pilha.append((operandos[0][0], i, None, True, operandos))
+        elif isinstance(item, ResPilha):
+            operandos = [pilha.pop()] if pilha else []
+            pilha.append((operandos[0][0] if operandos else i, i, None, False, operandos))
+        elif isinstance(item, Grupo) and not no_lugar:
+            pilha.append((i, i, None, False, ()))
+        else:
+            # Um Memorizado é um trecho que já termina em operador
+            pilha.append((i, i, leituras(item), isinstance(item, Memorizado), ()))
+
+    trechos = []
+    pendentes = list(pilha)
+    while pendentes:
+        inicio, fim, lidas, operador, operandos = pendentes.pop()
+        aceito = aceitar(inicio, fim, lidas) if operador and lidas is not None else None
+        if aceito is not None:
+            trechos.append((inicio, fim, aceito))
+        else:
+            pendentes.extend(operandos)
+    return trechos
+
+def icarInvariantes(arvore: No, simbolos: TabelaSimbolos) -> No:
+    """
+    Tira da condição e do corpo de cada WHILE/FOR os quadros que não leem variáveis
+    escritas no laço (escritas_dos_lacos): o laço vira um PreCalculo, que os calcula
+    uma vez antes de entrar. Cada quadro vai para o laço mais externo em que é
+    invariante; subexpressões memorizadas (subexpressoes.py) também.
+    """
+    _, lacos = escritas_dos_lacos(arvore)
+    return percorrer(_icar(arvore, simbolos, lacos, []))
+
+def _custo_puro(itens: list) -> tuple | None:
+    """
+    (variáveis lidas, operadores, algum operador sem expressão Python rápida) dos
+    itens de um quadro, se com as variáveis valendo números eles nunca relatam
+    diagnósticos nem levantam exceções (sem RES e com operandos suficientes); senão
+    None. Os quadros memorizados são puros no mesmo sentido.
+    """
+    nomes = set()
+    operacoes = 0
+    lentas = False
+    pendentes = [itens]
+    while pendentes:
+        profundidade = 0
+        for item in pendentes.pop():
+            if isinstance(item, Operacao):
+                if profundidade < item.operador.aridade:
+                    return None
+                profundidade -= item.operador.aridade - 1
+                operacoes += 1
+                lentas = lentas or item.operador.python is None
+                continue
+            if isinstance(item, (Grupo, Memorizado)):
+                item = item.no
+                if isinstance(item, Quadro):
+                    pendentes.append(item.itens)
+                    item = None
+            if isinstance(item, Variavel):
+                nomes.add(item.nome)
+            elif item is not None and not isinstance(item, Constante):
+                return None
+            profundidade += 1
+    return frozenset(nomes), operacoes, lentas
+
+def _leituras_item(item: No) -> frozenset | None:
+    puro = _custo_puro([item])
+    return None if puro is None else puro[0]
+
+def _invariante(no: No, itens: list, simbolos: TabelaSimbolos, abertos: list) -> Invariante | None:
+    """
+    Invariante do laço mais externo em que o nó (um quadro com `itens`, ou um
+    Memorizado) não muda, se calculá-lo custa mais que buscar o valor pronto (dois
+    operadores, ou um sem expressão Python).
+    """
+    puro = _custo_puro(itens)
+    if puro is None:
+        return None
+    leituras, operacoes, lentas = puro
+    if operacoes < 2 and not lentas:
+        return None
+    for escritas, invariantes in abertos:
+        if escritas.isdisjoint(leituras):
+            # O mesmo nó em vários lugares do laço (DAG de subexpressoes.py) é calculado uma vez
+            invariante = invariantes.get(id(no))
+            if invariante is None:
+                slots = tuple(sorted(simbolos.slot(nome) for nome in leituras))
+                invariante = invariantes[id(no)] = Invariante(no, slots)
+            return invariante
+    return None
+
+def _icar(no: No, simbolos: TabelaSimbolos, lacos: dict, abertos: list):
+    # `abertos` são os laços em volta do nó, do mais externo para o mais interno:
+    # (variáveis escritas no laço, invariantes do laço por id do nó)
+    if isinstance(no, Quadro):
+        # Quadros não têm laços dentro: fora de laços não há o que procurar
+        if not abertos:
+            return no
+        invariante = _invariante(no, no.itens, simbolos, abertos)
+        if invariante is not None:
+            return invariante
+        # Como construirArvore achata a RPN aninhada em um só quadro, os trechos
+        # invariantes viram itens do quadro, avaliados ali mesmo
+        trechos = {}
+        for inicio, fim, invariante in trechos_puros(
+                no, _leituras_item,
+                lambda inicio, fim, _: _invariante(Quadro(no.itens[inicio:fim + 1]), no.itens[inicio:fim + 1],
+                                                   simbolos, abertos)):
+            trechos[inicio] = (fim, invariante)
+        itens = []
+        i = 0
+        while i < len(no.itens):
+            if i in trechos:
+                i, invariante = trechos[i]
+                itens.append(invariante)
+            else:
+                item = no.itens[i]
+                if isinstance(item, Grupo):
+                    item = Grupo((yield _icar(item.no, simbolos, lacos, abertos)))
+                elif isinstance(item, CurtoCircuito):
+                    item = CurtoCircuito((yield _icar(item.no, simbolos, lacos, abertos)), item.operador)
+                itens.append(item)
+            i += 1
+        return Quadro(itens)
+    if isinstance(no, Memorizado):
+        # O valor memorizado pode mudar entre as linhas, não entre as voltas
+        invariante = _invariante(no, [no], simbolos, abertos) if abertos else None
+        return no if invariante is None else invariante
+    if isinstance(no, (Enquanto, Para)):
+        invariantes = {}
+        if isinstance(no, Enquanto):
+            abertos.append((lacos[id(no)], invariantes))
+            laco = Enquanto((yield _icar(no.condicao, simbolos, lacos, abertos)),
+                            (yield _icar(no.corpo, simbolos, lacos, abertos)))
+        else:
+            # Os parâmetros do FOR são avaliados uma vez, antes das voltas
+            parametros = []
+            for parametro in (no.inicial, no.final, no.incremento):
+                parametros.append((yield _icar(parametro, simbolos, lacos, abertos)))
+            abertos.append((lacos[id(no)], invariantes))
+            laco = Para(*parametros, (yield _icar(no.corpo, simbolos, lacos, abertos)))
+        abertos.pop()
+        return PreCalculo(list(invariantes.values()), laco) if invariantes else laco
+    if isinstance(no, Atribuicao):
+        return Atribuicao(no.nome, (yield _icar(no.no, simbolos, lacos, abertos)))
+    if isinstance(no, Sequencia):
+        passos = []
+        for nome, passo in no.passos:
+            passos.append((nome, (yield _icar(passo, simbolos, lacos, abertos))))
+        return Sequencia(passos)
+    if isinstance(no, SeSenao):
+        return SeSenao((yield _icar(no.condicao, simbolos, lacos, abertos)),
+                       (yield _icar(no.verdadeiro, simbolos, lacos, abertos)),
+                       (yield _icar(no.falso, simbolos, lacos, abertos)))
+    if isinstance(no, Protegido):
+        return Protegido(no.nome, (yield _icar(no.no, simbolos, lacos, abertos)))
+    # Os demais nós não têm quadros
+    return no
+
+# ============================================================================
+# REPRESENTAÇÃO INTERMEDIÁRIA -> BYTECODE
+# ============================================================================
+
+# Soma, subtração e multiplicação têm opcodes próprios (caminho rápido da VM)
+_OPCODE_RAPIDO = {
+    Tipo_de_Token.SOMA: Opcode.SOMA,
+    Tipo_de_Token.SUBTRACAO: Opcode.SUBTRACAO,
+    Tipo_de_Token.MULTIPLICACAO: Opcode.MULTIPLICACAO,
+}
+
+def _opcode_operador(operador: Operador) -> int:
+    if operador.aridade == 1:
+        return Opcode.NOT
+    if operador.categoria == ARITMETICO:
+        return _OPCODE_RAPIDO.get(operador.tipo, Opcode.ARITMETICO)
+    return Opcode.RELACIONAL
+
+def sempre_float(no: No) -> bool:
+    """True se o valor do nó com certeza é um float (nunca None, vindo do histórico)."""
+    if isinstance(no, Constante):
+        return isinstance(no.valor, float)
+    if isinstance(no, Quadro):
+        return analisar_quadro(no)[1]
+    if isinstance(no, (Memorizado, Invariante)):
+        return sempre_float(no.no)
+    return False
+
+def analisar_quadro(quadro: Quadro) -> tuple[bool, bool]:
+    """
+    Simula a pilha RPN do quadro sem executá-lo.
+    Retorna (estatico, resultado_float): `estatico` diz se a profundidade da pilha
+    é conhecida em toda a avaliação (só RES sobre um valor de tipo incerto a torna
+    dinâmica); `resultado_float` diz se o resultado final com certeza é float.
+    """
+    pilha = []   # True para valores que com certeza são float
+    for item in quadro.itens:
+        if isinstance(item, Constante):
+            pilha.append(True)
+        elif isinstance(item, Variavel):
+            pilha.append(False)
+        elif isinstance(item, Grupo):
+            pilha.append(True)
+        elif isinstance(item, (Memorizado, Invariante)):
+            pilha.append(analisar_quadro(item.no)[1])
+        elif isinstance(item, CurtoCircuito):
+            # Resultado do && ou || (decidido pelo esquerdo ou calculado); sem operando
+            # esquerdo, o grupo fica na pilha e o operador empilha o 0.0 do erro
+            if pilha:
+                pilha[-1] = True
+            else:
+                pilha.extend((True, True))
+        elif isinstance(item, ResPilha):
+            if pilha and not pilha[-1]:
+                return False, False
+            if pilha:
+                pilha.pop()
+            pilha.append(False)
+        elif item.operador.aridade == 1:
+            if pilha:
+                pilha.pop()
+            pilha.append(True)
+        elif len(pilha) >= 2:
+            b = pilha.pop()
+            a = pilha.pop()
+            # Aritmética com um operando float dá float ou levanta TypeError
+            pilha.append((a or b) if item.operador.categoria == ARITMETICO else True)
+        else:
+            pilha.append(True)
+    return True, (pilha[-1] if pilha else True)
+
+
+def grupos_no_lugar(quadro: Quadro, estatico: bool) -> bool:
+    # As subexpressões são avaliadas antes da pilha RPN (podem imprimir erros).
+    # Só dá para avaliá-las no lugar se nada antes delas puder imprimir ou falhar.
+    if not estatico:
+        return False
+    posicoes = [i for i, item in enumerate(quadro.itens) if isinstance(item, Grupo)]
+    if not posicoes:
+        return True
+    for item in quadro.itens[:posicoes[-1]]:
+        if isinstance(item, Grupo):
+            if not sempre_float(item.no):
+                return False
+        elif not isinstance(item, (Constante, Variavel)):
+            return False
+    return True
+
+
+class _Emissor:
+    def __init__(self, simbolos: TabelaSimbolos):
+        # Variáveis são resolvidas para slots de `simbolos` durante a emissão
+        self.simbolos = simbolos
+        self.instrucoes = []
+        self.num_temps = 0
+        # Posição do último destino de salto: instruções antes dela não podem ser fundidas
+        self.ultimo_alvo = 0
+        # Instruções de memorização e de invariantes emitidas (não entram no custo do orçamento)
+        self.auxiliares = 0
+        # Temporário com o valor pré-calculado de cada Invariante (por id do nó)
+        self.invariantes = {}
+
+    def emitir(self, op: int, arg=None) -> int:
+        self.instrucoes.append((op, arg))
+        return len(self.instrucoes) - 1
+
+    def corrigir(self, posicao: int, arg):
+        self.instrucoes[posicao] = (self.instrucoes[posicao][0], arg)
+
+    def alvo(self) -> int:
+        """Marca a próxima instrução como destino de salto e devolve sua posição."""
+        self.ultimo_alvo = len(self.instrucoes)
+        return self.ultimo_alvo
+
+    def custo_desde(self, inicio: int, auxiliares: int) -> int:
+        """Custo de uma volta de laço que começa em `inicio` (até o salto de volta, inclusive)."""
+        return len(self.instrucoes) - inicio + 1 - (self.auxiliares - auxiliares)
+
+    def novo_temp(self) -> int:
+        self.num_temps += 1
+        return self.num_temps - 1
+
+    def operador(self, operador: Operador):
+        # Operador binário com os dois operandos na pilha.
+        # (X 1 +) e (X Y <) viram uma única superinstrução.
+        op = _opcode_operador(operador)
+        instrucoes = self.instrucoes
+        if len(instrucoes) - 2 >= self.ultimo_alvo and instrucoes[-2][0] == Opcode.CARREGAR:
+            (_, slot_a), (op_b, arg_b) = instrucoes[-2], instrucoes[-1]
+            if op_b == Opcode.CONST:
+                del instrucoes[-2:]
+                self.emitir(Opcode.OPERAR_VAR_CONST, (op, operador.tipo, operador, slot_a, arg_b))
+                return
+            if op_b == Opcode.CARREGAR:
+                del instrucoes[-2:]
+                self.emitir(Opcode.OPERAR_VAR_VAR, (op, operador.tipo, operador, slot_a, arg_b))
+                return
+        self.emitir(op, operador)
+
+    def descartar(self):
+        # ATRIBUIR seguido de DESCARTAR vira ATRIBUIR_DESCARTAR
+        instrucoes = self.instrucoes
+        if instrucoes and instrucoes[-1][0] == Opcode.ATRIBUIR and len(instrucoes) > self.ultimo_alvo:
+            instrucoes[-1] = (Opcode.ATRIBUIR_DESCARTAR, instrucoes[-1][1])
+        else:
+            self.emitir(Opcode.DESCARTAR)
+
+    def no(self, no: No):
+        """Emite o código que deixa o valor do nó no topo da pilha."""
+        percorrer(self._no(no))
+
+    def _no(self, no: No):
+        if isinstance(no, Constante):
+            self.emitir(Opcode.CONST, no.valor)
+        elif isinstance(no, Variavel):
+            self.emitir(Opcode.CARREGAR, self.simbolos.slot(no.nome))
+        elif isinstance(no, Quadro):
+            yield self.quadro(no)
+        elif isinstance(no, Atribuicao):
+            yield self._no(no.no)
+            self.emitir(Opcode.ATRIBUIR, self.simbolos.slot(no.nome))
+        elif isinstance(no, HistoricoUltimo):
+            self.emitir(Opcode.HIST_ULTIMO)
+        elif isinstance(no, HistoricoIndice):
+            self.emitir(Opcode.HIST_INDICE, no.indice)
+        elif isinstance(no, SeSenao):
+            yield self.se_senao(no)
+        elif isinstance(no, Enquanto):
+            yield self.enquanto(no)
+        elif isinstance(no, Para):
+            yield self.para(no)
+        elif isinstance(no, Sequencia):
+            for k, (nome, passo) in enumerate(no.passos):
+                if k:
+                    self.descartar()
+                if nome is not None:
+                    self.emitir(Opcode.INICIALIZAR, self.simbolos.slot(nome))
+                yield self._no(passo)
+        elif isinstance(no, ErroEstrutura):
+            self.emitir(Opcode.ERRO_ESTRUTURA, no.mensagem)
+        elif isinstance(no, Protegido):
+            tentar = self.emitir(Opcode.TENTAR)
+            yield self._no(no.no)
+            self.emitir(Opcode.FIM_TENTAR)
+            self.corrigir(tentar, (self.alvo(), no.nome))
+        elif isinstance(no, Memorizado):
+            buscar = self.emitir(Opcode.MEMO_BUSCAR)
+            yield self._no(no.no)
+            self.emitir(Opcode.MEMO_GUARDAR, (no.indice, no.slots))
+            self.corrigir(buscar, (no.indice, self.alvo()))
+            self.auxiliares += 2
+        elif isinstance(no, Invariante):
+            carregar = self.emitir(Opcode.CARREGAR_INVARIANTE)
+            yield self._no(no.no)
+            self.corrigir(carregar, (self.invariantes[id(no)], self.alvo()))
+            self.auxiliares += 1
+        elif isinstance(no, PreCalculo):
+            yield self.pre_calculo(no)
+        else:
+            raise TypeError(f"Nó sem tradução para bytecode: {type(no).__name__}")
+
+    def quadro(self, quadro: Quadro):
+        estatico, _ = analisar_quadro(quadro)
+        no_lugar = grupos_no_lugar(quadro, estatico)
+
+        # Temporário de cada grupo, pela posição no quadro (o mesmo nó pode se repetir)
+        temps = {}
+        if not no_lugar:
+            for posicao, item in enumerate(quadro.itens):
+                if isinstance(item, Grupo):
+                    yield self._no(item.no)
+                    temps[posicao] = self.novo_temp()
+                    self.emitir(Opcode.GUARDAR_TEMP, temps[posicao])
+
+        if not estatico:
+            yield self.quadro_dinamico(quadro, temps)
+            return
+
+        profundidade = 0
+        # Resultados de operadores já saem arredondados
+        arredondado = False
+        for posicao, item in enumerate(quadro.itens):
+            if isinstance(item, Constante):
+                self.emitir(Opcode.CONST, item.valor)
+                profundidade += 1
+                arredondado = False
+            elif isinstance(item, Variavel):
+                self.emitir(Opcode.CARREGAR, self.simbolos.slot(item.nome))
+                profundidade += 1
+                arredondado = False
+            elif isinstance(item, Grupo):
+                if no_lugar:
+                    yield self._no(item.no)
+                    if not sempre_float(item.no):
+                        self.emitir(Opcode.PARA_FLOAT)
+                else:
+                    self.emitir(Opcode.CARREGAR_TEMP, temps[posicao])
+                profundidade += 1
+                arredondado = False
+            elif isinstance(item, (Memorizado, Invariante)):
+                # Trecho da RPN: o mesmo código dos itens, no lugar, terminando em operador
+                yield self._no(item)
+                profundidade += 1
+                arredondado = True
+            elif isinstance(item, CurtoCircuito):
+                # SALTAR_LOGICO; grupo; operador; fim (sem operando esquerdo, nada a decidir)
+                salto = self.emitir(Opcode.SALTAR_LOGICO) if profundidade else None
+                yield self._no(item.no)
+                if not sempre_float(item.no):
+                    self.emitir(Opcode.PARA_FLOAT)
+                if salto is None:
+                    self.emitir(Opcode.OPERANDOS_INSUFICIENTES, item.operador)
+                    profundidade += 2
+                else:
+                    self.operador(item.operador)
+                    self.corrigir(salto, (self.alvo(), item.operador.tipo == Tipo_de_Token.OR, False))
+                arredondado = True
+            elif isinstance(item, ResPilha):
+                if profundidade:
+                    self.emitir(Opcode.RES_INDICE)
+                else:
+                    self.emitir(Opcode.RES_ULTIMO)
+                    profundidade += 1
+                arredondado = False
+            else:
+                operador = item.operador
+                if profundidade < operador.aridade:
+                    self.emitir(Opcode.OPERANDOS_INSUFICIENTES, operador)
+                    profundidade += 1
+                elif operador.aridade == 1:
+                    self.emitir(Opcode.NOT, operador)
+                else:
+                    self.operador(operador)
+                    profundidade -= 1
+                arredondado = True
+
+        if profundidade == 0:
+            self.emitir(Opcode.CONST, 0.0)
+            return
+        if profundidade > 1:
+            self.emitir(Opcode.MANTER_TOPO, profundidade - 1)
+        if not arredondado:
+            self.emitir(Opcode.ARREDONDAR)
+
+    def quadro_dinamico(self, quadro: Quadro, temps: dict):
+        # A profundidade da pilha depende dos valores: checagem em tempo de execução
+        self.emitir(Opcode.MARCAR_BASE)
+        for posicao, item in enumerate(quadro.itens):
+            if isinstance(item, Constante):
+                self.emitir(Opcode.CONST, item.valor)
+            elif isinstance(item, Variavel):
+                self.emitir(Opcode.CARREGAR, self.simbolos.slot(item.nome))
+            elif isinstance(item, Grupo):
+                self.emitir(Opcode.CARREGAR_TEMP, temps[posicao])
+            elif isinstance(item, CurtoCircuito):
+                # Como no quadro estático; se há operando esquerdo só se sabe na execução
+                salto = self.emitir(Opcode.SALTAR_LOGICO)
+                yield self._no(item.no)
+                if not sempre_float(item.no):
+                    self.emitir(Opcode.PARA_FLOAT)
+                self.emitir(Opcode.OPERADOR_DINAMICO, (_opcode_operador(item.operador), item.operador))
+                self.corrigir(salto, (self.alvo(), item.operador.tipo == Tipo_de_Token.OR, True))
+            elif isinstance(item, ResPilha):
+                self.emitir(Opcode.RES_DINAMICO)
+            else:
+                self.emitir(Opcode.OPERADOR_DINAMICO, (_opcode_operador(item.operador), item.operador))
+        self.emitir(Opcode.FIM_QUADRO)
+
+    def se_senao(self, no: SeSenao):
+        # TENTAR; condição; SALTAR_SE_ZERO senão; verdadeiro; SALTAR fim; senão: falso; fim: FIM_TENTAR
+        tentar = self.emitir(Opcode.TENTAR)
+        yield self._no(no.condicao)
+        salto_senao = self.emitir(Opcode.SALTAR_SE_ZERO)
+        yield self._no(no.verdadeiro)
+        salto_fim = self.emitir(Opcode.SALTAR)
+        self.corrigir(salto_senao, self.alvo())
+        yield self._no(no.falso)
+        self.corrigir(salto_fim, self.alvo())
+        self.emitir(Opcode.FIM_TENTAR)
+        self.corrigir(tentar, (self.alvo(), "IFELSE"))
+
+    def pre_calculo(self, no: PreCalculo):
+        # Os invariantes são calculados antes do laço, fora do custo do orçamento: cada
+        # volta continua custando o quadro avaliado no lugar, como sem o pré-cálculo
+        for invariante in no.invariantes:
+            inicio = len(self.instrucoes)
+            auxiliares = self.auxiliares
+            temp = self.invariantes[id(invariante)] = self.novo_temp()
+            preparar = self.emitir(Opcode.PREPARAR_INVARIANTE)
+            yield self._no(invariante.no)
+            self.emitir(Opcode.GUARDAR_TEMP, temp)
+            self.corrigir(preparar, (invariante.slots, temp, self.alvo()))
+            # Tudo o que foi emitido aqui é auxiliar, inclusive a memorização de dentro
+            self.auxiliares = auxiliares + len(self.instrucoes) - inicio
+        yield self._no(no.laco)
+
+    def enquanto(self, no: Enquanto):
+        # O resultado do laço fica na pilha; TESTAR_LACO troca pelo do corpo a cada volta
+        tentar = self.emitir(Opcode.TENTAR)
+        iteracoes = self.novo_temp()
+        self.emitir(Opcode.CONST, 0.0)
+        self.emitir(Opcode.ZERAR_TEMP, iteracoes)
+        inicio = self.alvo()
+        auxiliares = self.auxiliares
+        yield self._no(no.condicao)
+        saida = self.emitir(Opcode.TESTAR_LACO)
+        yield self._no(no.corpo)
+        # Cada volta custa as instruções da condição e do corpo
+        self.emitir(Opcode.REPETIR, (inicio, self.custo_desde(inicio, auxiliares)))
+        self.corrigir(saida, (self.alvo(), iteracoes))
+        self.emitir(Opcode.FIM_TENTAR)
+        self.corrigir(tentar, (self.alvo(), "WHILE"))
+
+    def para(self, no: Para):
+        tentar = self.emitir(Opcode.TENTAR)
+        contador, final, incremento, iteracoes = (self.novo_temp() for _ in range(4))
+        yield self._no(no.inicial)
+        self.emitir(Opcode.PARA_INT)
+        self.emitir(Opcode.GUARDAR_TEMP, contador)
+        yield self._no(no.final)
+        self.emitir(Opcode.PARA_INT)
+        self.emitir(Opcode.GUARDAR_TEMP, final)
+        yield self._no(no.incremento)
+        self.emitir(Opcode.PARA_INT_OU_1)
+        self.emitir(Opcode.GUARDAR_TEMP, incremento)
+        self.emitir(Opcode.CONST, 0.0)
+        self.emitir(Opcode.ZERAR_TEMP, iteracoes)
+        entrar = self.emitir(Opcode.FOR_ENTRAR)
+        corpo = self.alvo()
+        auxiliares = self.auxiliares
+        yield self._no(no.corpo)
+        slot_contador = self.simbolos.slot(CONTADOR_FOR)
+        self.emitir(Opcode.FOR_PROXIMO, (contador, incremento, final, iteracoes, corpo,
+                                         self.custo_desde(corpo, auxiliares)))
+        self.corrigir(entrar, (contador, final, self.alvo(), slot_contador))
+        self.emitir(Opcode.FOR_FIM, slot_contador)
+        self.emitir(Opcode.FIM_TENTAR)
+        self.corrigir(tentar, (self.alvo(), "FOR"))
+
+
+def gerarBytecode(arvore: No, simbolos: TabelaSimbolos, subexpressoes=None) -> CodigoCompilado:
+    """
+    Traduz a árvore de uma linha para bytecode, com as variáveis nos slots de `simbolos`.
+    Nós Memorizado usam a tabela `subexpressoes` (subexpressoes.TabelaSubexpressoes).
+    """
+    emissor = _Emissor(simbolos)
+    emissor.no(arvore)
+    emissor.emitir(Opcode.RETORNAR)
+    return CodigoCompilado(emissor.instrucoes, emissor.num_temps, simbolos, memo=subexpressoes,
+                           custo=len(emissor.instrucoes) - emissor.auxiliares)
+
+def prepararArvore(tokens: list[Token], relatorio: RelatorioOtimizacao | None, simbolos: TabelaSimbolos,
+                   subexpressoes=None, curto_circuito: bool = False) -> No:
+    """
+    Árvore otimizada da linha; com `subexpressoes`, consolidada no DAG da execução.
+    As subexpressões invariantes dos laços ficam em nós PreCalculo (icarInvariantes).
+    """
+    arvore = otimizarArvore(construirArvore(tokens, curto_circuito), relatorio)
+    if subexpressoes is not None:
+        arvore = subexpressoes.consolidar(arvore, simbolos)
+    return icarInvariantes(arvore, simbolos)
+
+def compilarLinha(tokens: list[Token], relatorio: RelatorioOtimizacao | None = None,
+                  simbolos: TabelaSimbolos | None = None, subexpressoes=None,
+                  curto_circuito: bool = False) -> CodigoCompilado:
+    """
+    Compila os tokens de uma linha (saída de analisar_linha) para bytecode,
+    passando pela otimização. As simplificações feitas vão para `relatorio`.
+    O código só executa sobre memórias com a tabela `simbolos` (Memoria.simbolos);
+    sem ela, é criada uma tabela nova. Com `subexpressoes`
+    (subexpressoes.TabelaSubexpressoes), as subexpressões puras da linha são
+    memorizadas nela e reaproveitadas pelas linhas seguintes. Com `curto_circuito`,
+    o grupo à direita de && ou || é pulado por SALTAR_LOGICO quando o operando
+    esquerdo decide o resultado (como executarExpressao(..., curto_circuito=True)).
+    """
+    if simbolos is None:
+        simbolos = TabelaSimbolos()
+    arvore = prepararArvore(tokens, relatorio, simbolos, subexpressoes, curto_circuito)
+    return gerarBytecode(arvore, simbolos, subexpressoes)
+
+def executarLinha(tokens: list[Token], memoria: Memoria, diagnosticos: Diagnosticos | None = None):
+    """Compila e executa uma linha; mesmo resultado e diagnósticos de executarExpressao."""
+    return executarCodigo(compilarLinha(tokens, simbolos=memoria.simbolos), memoria, diagnosticos=diagnosticos)
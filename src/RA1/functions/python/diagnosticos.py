@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+
+# Integrantes do grupo (ordem alfabética):
+# Nome Completo 1 - Breno Rossi Duarte
+# Nome Completo 2 - Francisco Bley Ruthes
+# Nome Completo 3 - Rafael Olivare Piveta
+# Nome Completo 4 - Stefan Benjamim Seixas Lourenço Rodrigues
+#
+# Nome do grupo no Canvas: RA2_1
+
+# Diagnósticos de execução: problemas que não interrompem a linha (operandos faltando,
+# índice de RES fora do histórico, erro dentro de IFELSE/WHILE/FOR...) e fazem a
+# operação valer 0.0. O interpretador (rpn_calc) e a máquina virtual relatam cada um
+# com código, mensagem e posição em um Diagnosticos; sem coletor, a mensagem é
+# impressa, como antes.
+
+# Códigos
+OPERANDOS_INSUFICIENTES = 'operandos_insuficientes'
+OPERACAO_INVALIDA = 'operacao_invalida'          # operando não numérico em comparação/lógico
+HISTORICO_FORA = 'historico_fora'                # índice de RES fora do histórico
+HISTORICO_VAZIO = 'historico_vazio'
+ESTRUTURA_INCOMPLETA = 'estrutura_incompleta'    # IFELSE/WHILE/FOR sem todos os blocos
+ERRO_ESTRUTURA = 'erro_estrutura'                # exceção tratada dentro de IFELSE/WHILE/FOR
+
+
+class Diagnostico:
+    """
+    Um problema relatado: código, mensagem (a mesma que era impressa) e posição em
+    que ocorreu, quando conhecida: índice do token na lista avaliada (rpn_calc) ou da
+    instrução no bytecode (maquina_virtual, ver desmontar).
+    """
+    __slots__ = ('codigo', 'mensagem', 'posicao')
+
+    def __init__(self, codigo: str, mensagem: str, posicao: int | None = None):
+        self.codigo = codigo
+        self.mensagem = mensagem
+        self.posicao = posicao
+
+    def __reduce__(self):
+        return (Diagnostico, (self.codigo, self.mensagem, self.posicao))
+
+    def __eq__(self, outro):
+        return (isinstance(outro, Diagnostico) and self.codigo == outro.codigo
+                and self.mensagem == outro.mensagem and self.posicao == outro.posicao)
+
+    def __hash__(self):
+        return hash((self.codigo, self.mensagem, self.posicao))
+
+    def __str__(self):
+        return self.mensagem
+
+    def __repr__(self):
+        return f"Diagnostico({self.codigo!r}, {self.mensagem!r}, posicao={self.posicao})"
+
+
+class Diagnosticos:
+    """Diagnósticos de uma execução, na ordem em que ocorreram."""
+    __slots__ = ('itens',)
+
+    def __init__(self):
+        self.itens = []
+
+    def relatar(self, codigo: str, mensagem: str, posicao: int | None = None):
+        self.itens.append(Diagnostico(codigo, mensagem, posicao))
+
+    def __len__(self):
+        return len(self.itens)
+
+    def __iter__(self):
+        return iter(self.itens)
+
+    def __repr__(self):
+        return f"Diagnosticos({self.itens!r})"
+
+
+def imprimir(codigo: str, mensagem: str, posicao: int | None = None):
+    # Relato sem coletor: só a mensagem, na saída padrão
+    print(mensagem)
+
+
+def relator(diagnosticos: Diagnosticos | None):
+    """Função que relata um diagnóstico em `diagnosticos` (ou o imprime, se None)."""
+    return imprimir if diagnosticos is None else diagnosticos.relatar
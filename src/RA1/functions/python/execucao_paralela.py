@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+
+# Integrantes do grupo (ordem alfabética):
+# Nome Completo 1 - Breno Rossi Duarte
+# Nome Completo 2 - Francisco Bley Ruthes
+# Nome Completo 3 - Rafael Olivare Piveta
+# Nome Completo 4 - Stefan Benjamim Seixas Lourenço Rodrigues
+#
+# Nome do grupo no Canvas: RA2_1
+
+# Execução paralela das linhas de um programa. Com as dependências de cada linha
+# (incremental.analisarDependencias), o programa vira um grafo acíclico: uma linha
+# depende da última linha anterior que escreve cada variável que ela lê ou escreve e
+# das linhas cujos resultados ela consulta com RES (de todas as anteriores, se o
+# índice só é conhecido na execução). Cada linha fica no nível 1 + o maior nível das
+# suas dependências; as linhas de um mesmo nível são independentes e rodam juntas em
+# um pool de processos, cada uma sobre uma memória só com as suas entradas.
+#
+# Os desfechos (incremental.Desfecho) são exibidos depois por exibirResultados, na
+# ordem do arquivo e com a mesma memória e histórico da execução sequencial; um
+# desfecho só é usado se as entradas da linha conferem com as previstas aqui.
+
+from functools import partial
+from itertools import chain
+
+from .compilador import compilarLinha, RelatorioOtimizacao
+from .codigo_nativo import compilarLinhaNativa
+from .incremental import (EstadoIncremental, AnaliseLinha, analisarDependencias, chaveEntradas,
+                          obterDesfecho)
+from .memoria import Memoria, HistoricoResultados, AUSENTE
+from .orcamento import Orcamento, TEMPO
+from .pool_processos import PoolDeExecutores, TAREFAS_POR_PROCESSO, dividir
+from .tokens import Tipo_de_Token
+from .validarExpressao import analisarEValidar
+
+def _analisarBloco(linhas: list[str]) -> list[AnaliseLinha]:
+    # Validação, tokens, dependências e simplificações de cada linha (como na primeira
+    # execução de exibirResultados com EstadoIncremental)
+    analises = []
+    for linha in linhas:
+        valida, tokens, erro = analisarEValidar(linha)
+        analise = AnaliseLinha(valida, erro)
+        if valida and erro is None:
+            analise.textos = [str(token.valor) for token in tokens if token.tipo != Tipo_de_Token.FIM]
+            relatorio = RelatorioOtimizacao()
+            try:
+                codigo = compilarLinha(tokens, relatorio)
+            except Exception:
+                # A linha não compila: exibirResultados mostra o erro e ela não é executada
+                pass
+            else:
+                analise.dependencias = analisarDependencias(codigo)
+                analise.simplificacoes = relatorio.simplificacoes
+        analises.append(analise)
+    return analises
+
+
+class _Executor:
+    # Executa linhas isoladas: cada tarefa traz o texto da linha, as variáveis de
+    # entrada e os resultados do histórico que ela consulta
+    __slots__ = ('profundidade', 'orcamento', 'compilar', 'codigos')
+
+    def __init__(self, profundidade: int | None, orcamento: Orcamento, nativo: bool = False,
+                 curto_circuito: bool = False):
+        self.profundidade = profundidade
+        self.orcamento = orcamento
+        self.compilar = compilarLinhaNativa if nativo else compilarLinha
+        if curto_circuito:
+            self.compilar = partial(self.compilar, curto_circuito=True)
+        # Texto da linha -> (código com tabela de símbolos própria, variáveis escritas)
+        self.codigos = {}
+
+    def executar(self, tarefas: list[tuple]) -> list[tuple]:
+        """(Desfecho, pode ser guardado em EstadoIncremental) de cada tarefa."""
+        resultados = []
+        for linha, entradas, historico in tarefas:
+            compilado = self.codigos.get(linha)
+            if compilado is None:
+                _, tokens, _ = analisarEValidar(linha)
+                codigo = self.compilar(tokens)
+                compilado = self.codigos[linha] = (codigo, analisarDependencias(codigo).escritas)
+            codigo, escritas = compilado
+            memoria = Memoria(self.profundidade, codigo.simbolos)
+            memoria.historico = HistoricoResultados(self.profundidade, historico)
+            for nome, valor in entradas:
+                memoria[nome] = valor
+            desfecho, interrupcao = obterDesfecho(codigo, memoria, self.orcamento)
+            desfecho.escritas = tuple((nome, memoria.get(nome, AUSENTE)) for nome in escritas)
+            # O limite de tempo não depende só das entradas
+            resultados.append((desfecho, interrupcao is None or interrupcao.recurso != TEMPO))
+        return resultados
+
+
+class _Janela:
+    # Histórico visto pela linha da posição `fim`: os `tamanho` resultados anteriores
+    __slots__ = ('resultados', 'fim', 'tamanho')
+
+    def __init__(self, resultados: list, fim: int, tamanho: int):
+        self.resultados = resultados
+        self.fim = fim
+        self.tamanho = tamanho
+
+    def __len__(self):
+        return self.tamanho
+
+    def __getitem__(self, indice: int):
+        # Só índices negativos dentro da janela (como em chaveEntradas)
+        return self.resultados[self.fim + indice]
+
+    def __iter__(self):
+        return iter(self.resultados[self.fim - self.tamanho:self.fim])
+
+    def itens(self, dependencias) -> list:
+        """Menor histórico com o mesmo comportamento de RES para a linha."""
+        if dependencias.res_dinamico:
+            return list(self)
+        indices = dependencias.res_indices
+        if not all(0 < indice <= self.tamanho for indice in indices):
+            # O erro de índice fora do intervalo mostra o tamanho do histórico
+            tamanho = self.tamanho
+        else:
+            tamanho = max(indices, default=0)
+        itens = [None] * tamanho
+        for indice in indices:
+            if 0 < indice <= tamanho:
+                itens[-indice] = self.resultados[self.fim - indice]
+        return itens
+
+
+def executarEmParalelo(linhas: list[str], estado: EstadoIncremental, processos: int,
+                       profundidade_historico: int | None, orcamento: Orcamento, nativo: bool = False,
+                       curto_circuito: bool = False) -> dict:
+    """
+    Executa em `processos` processos as linhas de `linhas` (texto de cada linha do
+    arquivo, na ordem) que não dependem umas das outras. Devolve o desfecho de cada
+    linha executada, pela chave de EstadoIncremental.chave. As análises das linhas
+    ficam em `estado`; desfechos guardados em `estado` são reaproveitados e os novos
+    são guardados nele. `orcamento` não pode ter limites da execução inteira. Com
+    `nativo`, as linhas rodam como funções Python (codigo_nativo.compilarLinhaNativa);
+    com `curto_circuito`, são compiladas com o curto-circuito de && e ||.
+    """
+    processadas = [linha for linha in linhas if linha.strip() and not linha.strip().startswith('#')]
+    previstos = {}
+    local = _Executor(profundidade_historico, orcamento, nativo, curto_circuito)
+
+    with PoolDeExecutores(processos, _Executor,
+                          (profundidade_historico, orcamento, nativo, curto_circuito)) as pool:
+        # Análise das linhas ainda sem dependências (texto novo ou nunca compilado)
+        pendentes = [linha for linha in dict.fromkeys(processadas)
+                     if (analise := estado.analise(linha)).valida is None
+                     or (analise.valida and analise.erro is None and analise.dependencias is None)]
+        blocos = dividir(pendentes, processos * TAREFAS_POR_PROCESSO)
+        analises = chain.from_iterable(pool.mapear(_analisarBloco, blocos)) if len(blocos) > 1 \
+            else chain.from_iterable(map(_analisarBloco, blocos))
+        for linha, nova in zip(pendentes, analises):
+            analise = estado.analise(linha)
+            analise.valida, analise.erro = nova.valida, nova.erro
+            if analise.textos is None:
+                analise.textos = nova.textos
+            analise.dependencias, analise.simplificacoes = nova.dependencias, nova.simplificacoes
+
+        # Níveis do grafo: posição (no histórico) das linhas de cada nível
+        niveis = []
+        nivel = {}
+        produtores = {}
+        ultimo_escritor = {}
+        maior = 0
+        for posicao, linha in enumerate(processadas):
+            analise = estado.analise(linha)
+            dependencias = analise.dependencias
+            if not analise.valida or analise.erro is not None or dependencias is None:
+                # Linha com erro léxico ou de compilação: resultado None, sem execução
+                continue
+            produtores[posicao] = fontes = [ultimo_escritor.get(nome) for nome in dependencias.entradas]
+            if dependencias.res_dinamico:
+                # Pode consultar qualquer resultado anterior
+                atual = maior + 1
+            else:
+                tamanho = posicao if profundidade_historico is None else min(posicao, profundidade_historico)
+                fontes = chain(fontes, (posicao - indice for indice in dependencias.res_indices
+                                        if 0 < indice <= tamanho))
+                atual = 1 + max((nivel.get(fonte, 0) for fonte in fontes if fonte is not None), default=0)
+            nivel[posicao] = atual
+            maior = max(maior, atual)
+            if atual > len(niveis):
+                niveis.append([])
+            niveis[atual - 1].append(posicao)
+            for nome in dependencias.escritas:
+                ultimo_escritor[nome] = posicao
+
+        resultados = [None] * len(processadas)
+        escritos = {}
+        for posicoes in niveis:
+            chaves = {}
+            tarefas = {}
+            for posicao in posicoes:
+                linha = processadas[posicao]
+                dependencias = estado.analise(linha).dependencias
+                valores = [AUSENTE if fonte is None else escritos[fonte][nome]
+                           for nome, fonte in zip(dependencias.entradas, produtores[posicao])]
+                tamanho = posicao if profundidade_historico is None else min(posicao, profundidade_historico)
+                janela = _Janela(resultados, posicao, tamanho)
+                chaves[posicao] = chave = chaveEntradas(linha, dependencias, valores, janela)
+                if chave in previstos or chave in tarefas:
+                    continue
+                desfecho = estado.buscar(chave)
+                if desfecho is not None:
+                    previstos[chave] = desfecho
+                    continue
+                entradas = tuple((nome, valor) for nome, valor in zip(dependencias.entradas, valores)
+                                 if valor is not AUSENTE)
+                tarefas[chave] = (linha, entradas, janela.itens(dependencias))
+
+            # Níveis com menos linhas que processos rodam no processo principal
+            if len(tarefas) < processos:
+                executados = local.executar(list(tarefas.values()))
+            else:
+                blocos = dividir(list(tarefas.values()), processos * TAREFAS_POR_PROCESSO)
+                executados = chain.from_iterable(pool.executar(blocos))
+            for chave, (desfecho, guardar) in zip(tarefas, executados):
+                previstos[chave] = desfecho
+                estado.executadas += 1
+                if guardar:
+                    estado.guardar(chave, desfecho)
+
+            for posicao in posicoes:
+                desfecho = previstos[chaves[posicao]]
+                escritos[posicao] = dict(desfecho.escritas)
+                resultados[posicao] = desfecho.resultado if desfecho.erro is None else None
+    return previstos
@@ -8,92 +8,275 @@
 #
 # Nome do grupo no Canvas: RA2_1
 
-import io
-import sys
+import os
+import time
+from functools import partial
 from pathlib import Path
-from src.RA1.functions.python.rpn_calc import parseExpressao, executarExpressao
-from src.RA1.functions.python.io_utils import salvar_tokens
+from typing import Iterable
+from src.RA1.functions.python.compilador import compilarLinha, RelatorioOtimizacao
+from src.RA1.functions.python.memoria import Memoria, PROFUNDIDADE_HISTORICO, AUSENTE
+from src.RA1.functions.python.orcamento import Orcamento, EXECUCAO, TEMPO
+from src.RA1.functions.python.incremental import EstadoIncremental, analisarDependencias, obterDesfecho
+from src.RA1.functions.python.execucao_paralela import executarEmParalelo
+from src.RA1.functions.python.codigo_nativo import compilarLinhaNativa
+from src.RA1.functions.python.subexpressoes import TabelaSubexpressoes
+from src.RA1.functions.python.pontos_controle import (PontosDeControle, Instantaneo, PontoDeControleInvalido,
+                                                      RESUMO_INICIAL, encadearResumo)
+from src.RA1.functions.python.perfil import PerfilExecucao, instrumentarBytecode
+from src.RA1.functions.python.io_utils import GravadorTokens
 from src.RA1.functions.python.tokens import Tipo_de_Token
-from src.RA1.functions.python.validarExpressao import validarExpressao, criarMensagemErro
+from src.RA1.functions.python.validarExpressao import analisarEValidar, validarExpressao, criarMensagemErro
 
-def exibirResultados(vetor_linhas: list[str], out_tokens: Path) -> tuple[bool, int, int]:
+class OpcoesExecucao:
+    """
+    Configuração da execução das linhas em exibirResultados. O padrão é a execução
+    sequencial em bytecode (compilador.py e maquina_virtual.py), sem estado nem pontos
+    de controle.
+    """
+    __slots__ = ('profundidade_historico', 'orcamento', 'estado', 'processos', 'nativo', 'subexpressoes',
+                 'pontos', 'retomada', 'perfil', 'curto_circuito')
+
+    def __init__(self, profundidade_historico: int | None = PROFUNDIDADE_HISTORICO,
+                 orcamento: Orcamento | None = None,
+                 estado: EstadoIncremental | None = None,
+                 processos: int | None = 1, nativo: bool = False,
+                 subexpressoes: TabelaSubexpressoes | None = None,
+                 pontos: PontosDeControle | None = None,
+                 retomada: Instantaneo | None = None,
+                 perfil: PerfilExecucao | None = None,
+                 curto_circuito: bool = False):
+        # Quantos dos últimos resultados ficam disponíveis para RES (None = todos)
+        self.profundidade_historico = profundidade_historico
+        # Limites de iterações, operações e tempo (padrão: só MAX_ITERACOES voltas por
+        # laço). A linha que passa de um limite é reportada como ERRO DE ORÇAMENTO; se o
+        # limite for o da execução inteira, as linhas seguintes não rodam
+        self.orcamento = orcamento
+        # Linhas com o mesmo texto e as mesmas entradas da execução anterior reaproveitam
+        # o desfecho guardado, sem compilar nem executar; o estado recebe os desta execução
+        self.estado = estado
+        # Com mais de um (None ou 0 = todos os núcleos), as linhas que não dependem umas
+        # das outras rodam antes em paralelo (execucao_paralela.executarEmParalelo) e os
+        # desfechos são exibidos na ordem do arquivo. Com limites da execução inteira no
+        # orçamento ou com `perfil`, a execução é sequencial
+        self.processos = processos
+        # Cada linha vira uma função Python (codigo_nativo.py), executada no lugar do
+        # bytecode com o mesmo resultado
+        self.nativo = nativo
+        # As árvores das linhas são consolidadas em um DAG e os valores das subexpressões
+        # puras ficam guardados até uma linha escrever uma variável que elas leem
+        self.subexpressoes = subexpressoes
+        # O estado depois de cada `pontos.intervalo` linhas é gravado como instantâneo
+        self.pontos = pontos
+        # Instantâneo de onde retomar: as linhas até retomada.linha são puladas e a execução
+        # continua do estado guardado. Se o texto dessas linhas mudou desde a gravação,
+        # exibirResultados levanta PontoDeControleInvalido antes de executar qualquer linha
+        self.retomada = retomada
+        # Cada linha executada roda com contadores de operadores e laços e tem o tempo
+        # medido; as linhas reaproveitadas de `estado` não entram no perfil
+        self.perfil = perfil
+        # && e || com curto-circuito (compilador.compilarLinha): o grupo à direita só é
+        # avaliado se o operando esquerdo não decidir, e os erros do grupo pulado não aparecem
+        self.curto_circuito = curto_circuito
+
+def exibirResultados(vetor_linhas: Iterable, out_tokens: Path, tokens_linhas: list | None = None,
+                     pre_tokenizado: bool = False, otimizacoes: list | None = None,
+                     opcoes: OpcoesExecucao | None = None) -> tuple[bool, int, int]:
+    """
+    Valida, tokeniza e executa cada linha conforme `opcoes` (OpcoesExecucao). Se
+    `tokens_linhas` for informado, recebe a lista de tokens de cada linha, para o
+    Assembly e o RA2; com `pre_tokenizado`, cada item de `vetor_linhas` já é a tupla
+    (linha, valida, tokens, erro) de lexico_paralelo.tokenizarArquivoParalelo. Se
+    `otimizacoes` for informado, recebe (número da linha, linha, simplificações) das
+    linhas em que o compilador dobrou constantes ou eliminou ramos.
+    """
     
-    memoria_global = {}
-    tokens_salvos_txt = []
+    if opcoes is None:
+        opcoes = OpcoesExecucao()
+    profundidade_historico, orcamento, estado = opcoes.profundidade_historico, opcoes.orcamento, opcoes.estado
+    processos, nativo, subexpressoes = opcoes.processos, opcoes.nativo, opcoes.subexpressoes
+    pontos, retomada, perfil = opcoes.pontos, opcoes.retomada, opcoes.perfil
+    curto_circuito = opcoes.curto_circuito
+    if orcamento is None:
+        orcamento = Orcamento()
+    orcamento.iniciar()
+    inicio = 0 if retomada is None else retomada.linha
+    # Com limites da execução inteira, cada linha precisa consumir o orçamento de novo
+    reaproveitar = estado is not None and not orcamento.por_execucao
+    previstos = None
+    processos = processos or os.cpu_count() or 1
+    if processos > 1 and not orcamento.por_execucao and perfil is None:
+        vetor_linhas = list(vetor_linhas)
+        if estado is None:
+            estado = EstadoIncremental()
+        linhas = [item[0] for item in vetor_linhas] if pre_tokenizado else vetor_linhas
+        previstos = executarEmParalelo(linhas[inicio:], estado, processos, profundidade_historico, orcamento, nativo,
+                                       curto_circuito)
+    compilar = compilarLinhaNativa if nativo else compilarLinha
+    if nativo and perfil is not None:
+        compilar = partial(compilarLinhaNativa, perfilado=True)
+    if curto_circuito:
+        compilar = partial(compilar, curto_circuito=True)
+    memoria_global = Memoria(profundidade_historico)
+    historico = memoria_global.historico
+    # Os tokens de cada linha vão para out_tokens assim que ela é processada
+    tokens_salvos = GravadorTokens(out_tokens)
     contador_erros = 0
     linhas_processadas = 0
-
-    # Inicializar o histórico na memória global
-    memoria_global['historico_resultados'] = []
+    resumo = RESUMO_INICIAL
+    if retomada is not None:
+        retomada.restaurar(memoria_global)
+        historico = memoria_global.historico
+        contador_erros, linhas_processadas = retomada.erros, retomada.processadas
+        orcamento.operacoes_usadas = retomada.operacoes
+    if pontos is not None:
+        pontos.abrir(inicio)
 
     for i, linha in enumerate(vetor_linhas, 1):
+        if pre_tokenizado:
+            linha, eh_valida, tokens_previos, erro_lexico = linha
+        if pontos is not None or i <= inicio:
+            if pontos is not None and i - 1 > inicio and (i - 1) % pontos.intervalo == 0:
+                pontos.gravar(Instantaneo.capturar(i - 1, resumo, memoria_global, contador_erros,
+                                                   linhas_processadas, orcamento.operacoes_usadas))
+            resumo = encadearResumo(resumo, linha)
+            if i <= inicio:
+                # Linha anterior ao instantâneo da retomada: só confere o texto
+                if i == inicio and resumo != retomada.resumo:
+                    if pontos is not None:
+                        pontos.fechar()
+                    raise PontoDeControleInvalido(inicio)
+                continue
         # Pula linhas vazias ou comentários
         if not linha.strip() or linha.strip().startswith('#'):
             continue
         
         linhas_processadas += 1
         
-        # Valida a expressão usando a função dedicada
-        eh_valida, mensagem_erro = validarExpressao(linha, i)
+        # Valida a expressão e obtém os tokens na mesma varredura
+        analise = estado.analise(linha) if estado is not None else None
+        if not pre_tokenizado:
+            if analise is not None and analise.valida is not None and tokens_linhas is None:
+                # Texto já analisado: os tokens só são refeitos se a linha for compilada
+                eh_valida, tokens_previos, erro_lexico = analise.valida, None, analise.erro
+            else:
+                eh_valida, tokens_previos, erro_lexico = analisarEValidar(linha)
+        if analise is not None and analise.valida is None:
+            analise.valida, analise.erro = eh_valida, erro_lexico
         if not eh_valida:
+            # A mensagem detalhada vem da validação por texto (só para linhas inválidas)
+            eh_valida, mensagem_erro = validarExpressao(linha, i)
             print(mensagem_erro)
-            tokens_salvos_txt.append([])
-            memoria_global['historico_resultados'].append(None)
+            tokens_salvos.gravar([])
+            historico.adicionar(None)
             contador_erros += 1
             continue
-            
+
+        escritas = ()
         try:
-            lista_de_tokens = parseExpressao(linha)
-            # para salvar tokens completos (incluindo parênteses) para RA2
-            tokens_completos = [str(token.valor) for token in lista_de_tokens if token.tipo != Tipo_de_Token.FIM]
-            tokens_salvos_txt.append(tokens_completos)
+            if erro_lexico is not None:
+                raise ValueError(erro_lexico)
+            lista_de_tokens = tokens_previos
+            if lista_de_tokens is None:
+                tokens_completos = analise.textos
+            else:
+                # para salvar tokens completos (incluindo parênteses) para RA2
+                tokens_completos = [str(token.valor) for token in lista_de_tokens if token.tipo != Tipo_de_Token.FIM]
+                if analise is not None and analise.textos is None:
+                    analise.textos = tokens_completos
+            tokens_salvos.gravar(tokens_completos)
+            if tokens_linhas is not None:
+                tokens_linhas.append(lista_de_tokens)
 
-            # Captura saída para detectar erros do RA1
-            old_stdout = sys.stdout
-            sys.stdout = buffer = io.StringIO()
-            
-            try:
-                resultado = executarExpressao(lista_de_tokens, memoria_global)
-                sys.stdout = old_stdout
-                
-                # Verifica se houve erro capturado
-                output = buffer.getvalue()
-                if 'ERRO' in output:
-                    print(f"Linha {i:02d}: Expressão '{linha}' -> Resultado: {resultado}")
-                    # Formata o erro com indentação
-                    erro_lines = output.strip().split('\n')
-                    for erro_line in erro_lines:
+            desfecho = interrupcao = None
+            if analise is not None and analise.dependencias is not None:
+                chave = estado.chave(linha, analise.dependencias, memoria_global)
+                if previstos is not None:
+                    # Desfecho da execução paralela, se as entradas conferem
+                    desfecho = previstos.get(chave)
+                elif reaproveitar:
+                    desfecho = estado.buscar(chave)
+            if desfecho is not None:
+                # Mesmo texto e mesmas entradas da execução anterior
+                desfecho.aplicar(memoria_global)
+                simplificacoes = analise.simplificacoes
+                escritas = analise.dependencias.escritas
+            else:
+                if lista_de_tokens is None:
+                    _, lista_de_tokens, _ = analisarEValidar(linha)
+                # Compila a linha uma única vez para bytecode (laços não reanalisam tokens)
+                relatorio = RelatorioOtimizacao()
+                codigo = compilar(lista_de_tokens, relatorio, memoria_global.simbolos, subexpressoes)
+                simplificacoes = relatorio.simplificacoes
+                if analise is not None and analise.dependencias is None:
+                    analise.dependencias = analisarDependencias(codigo)
+                    analise.simplificacoes = simplificacoes
+                    chave = estado.chave(linha, analise.dependencias, memoria_global)
+                if subexpressoes is not None:
+                    # Invalidadas mesmo que a linha termine em erro no meio
+                    escritas = (analisarDependencias(codigo) if analise is None else analise.dependencias).escritas
+                if perfil is None:
+                    desfecho, interrupcao = obterDesfecho(codigo, memoria_global, orcamento)
+                else:
+                    if codigo.contadores is None:
+                        codigo = instrumentarBytecode(codigo)
+                    comeco = time.perf_counter()
+                    desfecho, interrupcao = obterDesfecho(codigo, memoria_global, orcamento)
+                    perfil.registrar(i, linha, time.perf_counter() - comeco, codigo.contadores)
+                if analise is not None:
+                    estado.executadas += 1
+                    # Limites de tempo e da execução inteira não dependem só das entradas
+                    if interrupcao is None or (interrupcao.recurso != TEMPO and interrupcao.escopo != EXECUCAO):
+                        desfecho.escritas = tuple((nome, memoria_global.get(nome, AUSENTE))
+                                                  for nome in analise.dependencias.escritas)
+                        estado.guardar(chave, desfecho)
+            if otimizacoes is not None and simplificacoes:
+                otimizacoes.append((i, linha, simplificacoes))
+
+            if desfecho.erro is None:
+                print(f"Linha {i:02d}: Expressão '{linha}' -> Resultado: {desfecho.resultado}")
+                # Problemas relatados na execução, com indentação
+                if desfecho.diagnosticos:
+                    mensagens = '\n'.join(diagnostico.mensagem for diagnostico in desfecho.diagnosticos)
+                    for erro_line in mensagens.strip().split('\n'):
                         if erro_line.strip():
                             print(f"    {erro_line}")
                     contador_erros += 1
-                else:
-                    print(f"Linha {i:02d}: Expressão '{linha}' -> Resultado: {resultado}")
-                    
-                memoria_global['historico_resultados'].append(resultado)
-            except Exception as exec_error:
-                sys.stdout = old_stdout
-                raise exec_error
+                historico.adicionar(desfecho.resultado)
+            else:
+                print(criarMensagemErro(linha, i, *desfecho.erro))
+                tokens_salvos.gravar([])  # Adiciona lista vazia para manter índices
+                historico.adicionar(None)  # Adiciona None para erro
+                contador_erros += 1
+                if interrupcao is not None and interrupcao.escopo == EXECUCAO:
+                    print("Execução interrompida: orçamento da execução esgotado")
+                    break
             
         except ValueError as e:
             print(criarMensagemErro(linha, i, "SINTAXE", str(e)))
-            tokens_salvos_txt.append([])  # Adiciona lista vazia para manter índices
-            memoria_global['historico_resultados'].append(None)  # Adiciona None para erro
+            tokens_salvos.gravar([])  # Adiciona lista vazia para manter índices
+            historico.adicionar(None)  # Adiciona None para erro
             contador_erros += 1
             
         except ZeroDivisionError:
             print(criarMensagemErro(linha, i, "MATEMÁTICO", "Divisão por zero"))
-            tokens_salvos_txt.append([])
-            memoria_global['historico_resultados'].append(None)
+            tokens_salvos.gravar([])
+            historico.adicionar(None)
             contador_erros += 1
             
         except Exception as e:
             print(criarMensagemErro(linha, i, "INESPERADO", f"{type(e).__name__}: {e}"))
-            tokens_salvos_txt.append([])
-            memoria_global['historico_resultados'].append(None)
+            tokens_salvos.gravar([])
+            historico.adicionar(None)
             contador_erros += 1
 
-    # Salva os tokens gerados
-    salvar_tokens(tokens_salvos_txt, out_tokens)
+        finally:
+            if subexpressoes is not None:
+                subexpressoes.invalidar(escritas)
+
+    if pontos is not None:
+        pontos.fechar()
+
+    tokens_salvos.fechar()
     
     # Retorna (sucesso, linhas_processadas, contador_erros)
     return (contador_erros == 0, linhas_processadas, contador_erros)
\ No newline at end of file
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+
+# Integrantes do grupo (ordem alfabética):
+# Nome Completo 1 - Breno Rossi Duarte
+# Nome Completo 2 - Francisco Bley Ruthes
+# Nome Completo 3 - Rafael Olivare Piveta
+# Nome Completo 4 - Stefan Benjamim Seixas Lourenço Rodrigues
+#
+# Nome do grupo no Canvas: RA2_1
+
+# Reexecução incremental. O bytecode de cada linha diz quais variáveis ela lê e
+# escreve e quais resultados anteriores ela consulta com RES; essas são as arestas
+# do grafo de dependências entre linhas. Uma linha com o mesmo texto e os mesmos
+# valores nessas entradas tem o mesmo desfecho (resultado, mensagens e variáveis
+# escritas), então o desfecho guardado na execução anterior é reaproveitado sem
+# compilar nem executar a linha (nem tokenizar, se os tokens não forem pedidos). Uma linha alterada só faz reexecutar as
+# seguintes cujas entradas mudaram de valor.
+#
+# O estado é gravado com pickle (o mesmo usado para passar tokens entre processos em
+# lexico_paralelo.py) e só deve ser lido de arquivos gerados pelo próprio programa.
+
+import pickle
+from pathlib import Path
+
+from .maquina_virtual import CodigoCompilado, Opcode, executarCodigo
+from .memoria import Memoria, AUSENTE
+from .orcamento import Orcamento, OrcamentoExcedido
+from .diagnosticos import Diagnosticos
+
+# Muda sempre que o formato do estado ou a semântica da execução mudar
+VERSAO_ESTADO = 3
+
+_LEITURAS = {Opcode.CARREGAR, Opcode.INICIALIZAR}
+_ESCRITAS = {Opcode.ATRIBUIR, Opcode.ATRIBUIR_DESCARTAR, Opcode.INICIALIZAR, Opcode.FOR_FIM}
+_RES_ULTIMO = {Opcode.HIST_ULTIMO, Opcode.RES_ULTIMO}
+_RES_DINAMICO = {Opcode.RES_INDICE, Opcode.RES_DINAMICO}
+# Instruções que podem desviar a execução, com a posição do destino no argumento
+_DESTINOS = {
+    Opcode.SALTAR: lambda arg: arg,
+    Opcode.SALTAR_SE_ZERO: lambda arg: arg,
+    Opcode.SALTAR_LOGICO: lambda arg: arg[0],
+    Opcode.TENTAR: lambda arg: arg[0],
+    Opcode.TESTAR_LACO: lambda arg: arg[0],
+    Opcode.REPETIR: lambda arg: arg[0],
+    Opcode.FOR_ENTRAR: lambda arg: arg[2],
+    Opcode.FOR_PROXIMO: lambda arg: arg[4],
+    Opcode.MEMO_BUSCAR: lambda arg: arg[1],
+    Opcode.PREPARAR_INVARIANTE: lambda arg: arg[2],
+    Opcode.CARREGAR_INVARIANTE: lambda arg: arg[1],
+}
+
+
+class DependenciasLinha:
+    """Variáveis lidas e escritas por uma linha e índices de RES que ela consulta."""
+    __slots__ = ('leituras', 'escritas', 'res_indices', 'res_dinamico', 'entradas')
+
+    def __init__(self, leituras: tuple, escritas: tuple, res_indices: tuple, res_dinamico: bool,
+                 entradas: tuple | None = None):
+        # Nomes em ordem alfabética
+        self.leituras = leituras
+        self.escritas = escritas
+        self.res_indices = res_indices
+        # Índice de RES calculado em tempo de execução: depende do histórico inteiro
+        self.res_dinamico = res_dinamico
+        # Uma variável escrita só em um dos ramos mantém o valor anterior no outro,
+        # então o valor de antes da linha também é entrada
+        self.entradas = tuple(sorted({*leituras, *escritas})) if entradas is None else entradas
+
+    def __reduce__(self):
+        # Estado gravado como tupla: bem mais compacto e rápido de ler que o dos __slots__
+        return (DependenciasLinha, (self.leituras, self.escritas, self.res_indices, self.res_dinamico, self.entradas))
+
+    def __repr__(self):
+        return (f"DependenciasLinha(leituras={list(self.leituras)}, escritas={list(self.escritas)}, "
+                f"res={list(self.res_indices)}{', dinâmico' if self.res_dinamico else ''})")
+
+
+def _indice_constante(instrucoes: list, pc: int, destinos: set) -> int | None:
+    # (N RES) no meio de uma expressão vira CONST N seguido de RES_INDICE/RES_DINAMICO;
+    # o índice é fixo se nenhum salto chega direto à instrução de RES
+    if pc == 0 or pc in destinos:
+        return None
+    op, arg = instrucoes[pc - 1]
+    if op != Opcode.CONST or arg.__class__ is not float or arg != arg or abs(arg) == float('inf'):
+        return None
+    return int(arg)
+
+
+def analisarDependencias(codigo: CodigoCompilado) -> DependenciasLinha:
+    """Dependências de uma linha compilada, pelas instruções que acessam memória e histórico."""
+    nomes = codigo.simbolos.nomes
+    instrucoes = codigo.instrucoes
+    destinos = {_DESTINOS[op](arg) for op, arg in instrucoes if op in _DESTINOS}
+    leituras, escritas, res_indices = set(), set(), set()
+    res_dinamico = False
+    for pc, (op, arg) in enumerate(instrucoes):
+        if op in _LEITURAS:
+            leituras.add(nomes[arg])
+        if op in _ESCRITAS:
+            escritas.add(nomes[arg])
+        if op == Opcode.OPERAR_VAR_CONST:
+            leituras.add(nomes[arg[3]])
+        elif op == Opcode.OPERAR_VAR_VAR:
+            leituras.update((nomes[arg[3]], nomes[arg[4]]))
+        elif op == Opcode.FOR_ENTRAR:
+            escritas.add(nomes[arg[3]])
+        elif op in _RES_ULTIMO:
+            res_indices.add(1)
+        elif op == Opcode.HIST_INDICE:
+            try:
+                res_indices.add(int(float(arg)))
+            except (ValueError, OverflowError):
+                res_dinamico = True
+        elif op in _RES_DINAMICO:
+            indice = _indice_constante(instrucoes, pc, destinos)
+            if indice is None:
+                res_dinamico = True
+            else:
+                res_indices.add(indice)
+    return DependenciasLinha(tuple(sorted(leituras)), tuple(sorted(escritas)), tuple(sorted(res_indices)), res_dinamico)
+
+
+class AnaliseLinha:
+    # O que depende só do texto da linha: validade e erro léxico (None enquanto a linha
+    # não foi analisada), texto dos tokens (como em tokens_gerados.txt), dependências e
+    # simplificações do compilador (None enquanto a linha não foi compilada). Os tokens
+    # em si não são guardados: refazê-los custa o mesmo que lê-los do arquivo de estado
+    __slots__ = ('valida', 'erro', 'textos', 'dependencias', 'simplificacoes')
+
+    def __init__(self, valida: bool | None = None, erro: str | None = None, textos: list | None = None,
+                 dependencias: DependenciasLinha | None = None, simplificacoes: list | None = None):
+        self.valida = valida
+        self.erro = erro
+        self.textos = textos
+        self.dependencias = dependencias
+        self.simplificacoes = simplificacoes
+
+    def __reduce__(self):
+        return (AnaliseLinha, (self.valida, self.erro, self.textos, self.dependencias, self.simplificacoes))
+
+
+class Desfecho:
+    """
+    Efeito observável da execução de uma linha: resultado, diagnósticos relatados
+    (diagnosticos.Diagnostico), erro (tipo, detalhes) ou None e valores finais das
+    variáveis escritas.
+    """
+    __slots__ = ('resultado', 'diagnosticos', 'erro', 'escritas')
+
+    def __init__(self, resultado, diagnosticos: tuple, erro: tuple | None, escritas: tuple = ()):
+        self.resultado = resultado
+        self.diagnosticos = diagnosticos
+        self.erro = erro
+        self.escritas = escritas
+
+    def __reduce__(self):
+        return (Desfecho, (self.resultado, self.diagnosticos, self.erro, self.escritas))
+
+    def aplicar(self, memoria: Memoria):
+        # Variáveis removidas (AUSENTE) voltam a não existir
+        for nome, valor in self.escritas:
+            memoria[nome] = valor
+
+
+def obterDesfecho(codigo: CodigoCompilado, memoria: Memoria, orcamento: Orcamento | None = None) -> tuple:
+    """
+    Executa a linha compilada recolhendo os diagnósticos relatados. Devolve o Desfecho
+    e a exceção OrcamentoExcedido, se algum limite foi ultrapassado (senão None).
+    """
+    diagnosticos = Diagnosticos()
+    try:
+        resultado = executarCodigo(codigo, memoria, orcamento, diagnosticos)
+    except ValueError as e:
+        return Desfecho(None, (), ("SINTAXE", str(e))), None
+    except OrcamentoExcedido as e:
+        return Desfecho(None, (), ("ORÇAMENTO", str(e))), e
+    except ZeroDivisionError:
+        return Desfecho(None, (), ("MATEMÁTICO", "Divisão por zero")), None
+    except Exception as e:
+        return Desfecho(None, (), ("INESPERADO", f"{type(e).__name__}: {e}")), None
+    return Desfecho(resultado, tuple(diagnosticos), None), None
+
+
+def chaveEntradas(linha: str, dependencias: DependenciasLinha, valores: list, historico) -> tuple:
+    """
+    Texto da linha e valores das suas entradas: `valores` das variáveis (na ordem de
+    dependencias.entradas, AUSENTE se não existem) e resultados consultados em
+    `historico` (qualquer sequência com len e índice negativo, do mais antigo ao último).
+    """
+    valores = list(valores)
+    if dependencias.res_dinamico:
+        valores.append(tuple(historico))
+    else:
+        tamanho = len(historico)
+        # Fora do intervalo, a mensagem de erro mostra o tamanho do histórico
+        valores.extend(historico[-indice] if 0 < indice <= tamanho else ('fora', tamanho)
+                       for indice in dependencias.res_indices)
+    # repr distingue 0.0 de -0.0 e torna nan igual a si mesmo
+    return (linha, repr(valores))
+
+
+class EstadoIncremental:
+    """
+    Análises e desfechos de uma execução, consultados pela seguinte. Só o que foi
+    usado na execução atual é mantido ao salvar.
+    """
+    __slots__ = ('assinatura', '_analises', '_desfechos', 'analises', 'desfechos',
+                 'reaproveitadas', 'executadas')
+
+    def __init__(self, assinatura: tuple = ()):
+        # Configuração que muda os desfechos (profundidade do histórico, orçamento)
+        self.assinatura = (VERSAO_ESTADO, *assinatura)
+        self._analises = {}
+        self._desfechos = {}
+        self.analises = {}
+        self.desfechos = {}
+        # Linhas desta execução com desfecho reaproveitado e com execução de fato
+        self.reaproveitadas = 0
+        self.executadas = 0
+
+    @classmethod
+    def carregar(cls, caminho: str | Path, assinatura: tuple = ()) -> 'EstadoIncremental':
+        """Estado gravado em `caminho`; vazio se não existir ou tiver outra assinatura."""
+        estado = cls(assinatura)
+        try:
+            with open(caminho, 'rb') as arquivo:
+                assinatura_gravada, analises, desfechos = pickle.load(arquivo)
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError, AttributeError):
+            return estado
+        if assinatura_gravada == estado.assinatura:
+            estado._analises = analises
+            estado._desfechos = desfechos
+        return estado
+
+    def salvar(self, caminho: str | Path):
+        caminho = Path(caminho)
+        caminho.parent.mkdir(parents=True, exist_ok=True)
+        with open(caminho, 'wb') as arquivo:
+            pickle.dump((self.assinatura, self.analises, self.desfechos), arquivo,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+
+    def analise(self, linha: str) -> AnaliseLinha:
+        """Análise de `linha` guardada (da execução anterior ou desta) ou uma nova."""
+        analise = self.analises.get(linha)
+        if analise is None:
+            analise = self._analises.get(linha) or AnaliseLinha()
+            self.analises[linha] = analise
+        return analise
+
+    def chave(self, linha: str, dependencias: DependenciasLinha, memoria: Memoria) -> tuple:
+        """Texto da linha e valores atuais das suas entradas (variáveis e histórico)."""
+        return chaveEntradas(linha, dependencias, [memoria.get(nome, AUSENTE) for nome in dependencias.entradas],
+                             memoria.historico)
+
+    def buscar(self, chave: tuple) -> Desfecho | None:
+        desfecho = self.desfechos.get(chave)
+        if desfecho is None:
+            desfecho = self._desfechos.get(chave)
+            if desfecho is None:
+                return None
+            self.desfechos[chave] = desfecho
+        self.reaproveitadas += 1
+        return desfecho
+
+    def guardar(self, chave: tuple, desfecho: Desfecho):
+        self.desfechos[chave] = desfecho
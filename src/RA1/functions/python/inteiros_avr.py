@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+
+# Integrantes do grupo (ordem alfabética):
+# Nome Completo 1 - Breno Rossi Duarte
+# Nome Completo 2 - Francisco Bley Ruthes
+# Nome Completo 3 - Rafael Olivare Piveta
+# Nome Completo 4 - Stefan Benjamim Seixas Lourenço Rodrigues
+#
+# Nome do grupo no Canvas: RA2_1
+
+# Aritmética de 16 bits das rotinas do código gerado para o Arduino (assembly/), com
+# inteiros do Python entre 0 e 0xFFFF. operadores.py usa estas funções na avaliação AVR
+# de cada operador; semantica_avr.py executa as linhas com elas.
+
+from functools import lru_cache
+
+MASCARA = 0xFFFF
+
+
+def com_sinal(valor: int) -> int:
+    return valor - 0x10000 if valor & 0x8000 else valor
+
+
+def _multiplicar(a: int, b: int) -> tuple[int, int]:
+    # multiply_int: 16 bits inferiores do produto e o carry do último add (r22 + lo(AH*BH))
+    al, ah, bl, bh = a & 0xFF, a >> 8, b & 0xFF, b >> 8
+    meio = ((al * bl) >> 8) + ((al * bh) & 0xFF)
+    alto = (al * bh >> 8) + (meio >> 8)
+    meio = (meio & 0xFF) + ((ah * bl) & 0xFF)
+    alto = (alto + (ah * bl >> 8) + (meio >> 8)) & 0xFF
+    return (a * b) & MASCARA, (alto + ((ah * bh) & 0xFF)) >> 8
+
+
+@lru_cache(maxsize=65536)
+def _bloco_potencia(valor: int, base: int) -> tuple[int, int]:
+    # 256 voltas de pow_loop: valor no fim e soma dos carries (módulo 256)
+    carries = 0
+    for _ in range(256):
+        valor, carry = _multiplicar(valor, base)
+        carries += carry
+    return valor, carries & 0xFF
+
+
+def potencia(base: int, expoente: int) -> int | None:
+    # power_int; None se o contador nunca zera
+    if expoente == 0:
+        return 1
+    if expoente == 1:
+        return base
+    # dec r22 / sbc r23, r1 antes do laço: o carry vem do cpc com 1, que é 0 aqui
+    baixo, alto = (expoente - 1) & 0xFF, expoente >> 8
+    valor = base
+    while baixo:
+        valor, carry = _multiplicar(valor, base)
+        baixo -= 1
+        alto = (alto - carry) & 0xFF
+    # Daqui em diante, r22 volta a 0 a cada 256 voltas
+    vistos = set()
+    while alto:
+        if (valor, alto) in vistos:
+            return None
+        vistos.add((valor, alto))
+        valor, carries = _bloco_potencia(valor, base)
+        alto = (alto - carries) & 0xFF
+    return valor
@@ -11,12 +11,18 @@
 from pathlib import Path
 
 def lerArquivo(nomeArquivo: str):
+    return list(iterarArquivo(nomeArquivo))
+
+def iterarArquivo(nomeArquivo: str):
+    # Versão em fluxo de lerArquivo: entrega uma linha (sem espaços nas pontas) por vez
     try:
         with open(nomeArquivo, 'r', encoding="utf-8") as arquivos_teste:
-            return [linha.strip() for linha in arquivos_teste if linha.strip()]
+            for linha in arquivos_teste:
+                linha = linha.strip()
+                if linha:
+                    yield linha
     except FileNotFoundError:
         print(f'ERRO -> Arquivo não encontrado: {nomeArquivo}')
-        return []
 
 from pathlib import Path
 
@@ -36,3 +42,47 @@ def salvar_tokens(tokens_por_linha, nome_arquivo: str | Path) -> bool:
         print(f'ERRO -> Falha ao escrever os tokens no arquivo: {e}')
         return False
 
+class GravadorTokens:
+    # Versão em fluxo de salvar_tokens: grava os tokens de cada linha assim que ela é
+    # processada. O arquivo só é aberto (e esvaziado) na primeira gravação ou em fechar,
+    # para que uma execução abandonada antes da primeira linha não apague o anterior.
+    __slots__ = ('destino', 'arquivo', 'falhou')
+
+    def __init__(self, nome_arquivo: str | Path):
+        self.destino = Path(nome_arquivo)
+        self.arquivo = None
+        self.falhou = False
+
+    def _abrir(self) -> bool:
+        if self.arquivo is None and not self.falhou:
+            try:
+                self.destino.parent.mkdir(parents=True, exist_ok=True)
+                self.arquivo = self.destino.open("w", encoding='utf-8')
+            except Exception as e:
+                self._falhar(e)
+        return self.arquivo is not None
+
+    def _falhar(self, erro: Exception):
+        print(f'ERRO -> Falha ao escrever os tokens no arquivo: {erro}')
+        self.falhou = True
+        if self.arquivo is not None:
+            self.arquivo.close()
+            self.arquivo = None
+
+    def gravar(self, lista_de_tokens):
+        if self._abrir():
+            try:
+                self.arquivo.write(" ".join(lista_de_tokens) + "\n")
+            except Exception as e:
+                self._falhar(e)
+
+    def fechar(self) -> bool:
+        if not self._abrir():
+            return False
+        try:
+            self.arquivo.close()
+        except Exception as e:
+            self._falhar(e)
+            return False
+        self.arquivo = None
+        return True
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+
+# Integrantes do grupo (ordem alfabética):
+# Nome Completo 1 - Breno Rossi Duarte
+# Nome Completo 2 - Francisco Bley Ruthes
+# Nome Completo 3 - Rafael Olivare Piveta
+# Nome Completo 4 - Stefan Benjamim Seixas Lourenço Rodrigues
+#
+# Nome do grupo no Canvas: RA2_1
+
+# Análise léxica paralela: o arquivo é dividido em blocos que terminam em quebra de
+# linha e cada bloco é tokenizado em um processo separado. Cada linha é independente
+# das outras, então só a execução (que depende da memória) precisa ser sequencial.
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterator
+
+from .validarExpressao import analisarEValidar
+
+# Tamanho alvo de cada bloco enviado a um processo
+TAMANHO_BLOCO_PADRAO = 1 << 20
+
+def dividirEmBlocos(caminho: str | Path, tamanho_bloco: int = TAMANHO_BLOCO_PADRAO) -> list[tuple[int, int]]:
+    """
+    Divide o arquivo em intervalos de bytes (inicio, fim) de ~tamanho_bloco bytes.
+    Todo bloco termina logo após um '\\n' (ou no fim do arquivo), então nenhuma
+    linha é cortada ao meio.
+    """
+    tamanho = os.path.getsize(caminho)
+    blocos = []
+    inicio = 0
+    with open(caminho, 'rb') as arquivo:
+        while inicio < tamanho:
+            arquivo.seek(min(inicio + tamanho_bloco, tamanho))
+            arquivo.readline()  # avança até o fim da linha corrente
+            fim = min(arquivo.tell(), tamanho)
+            blocos.append((inicio, fim))
+            inicio = fim
+    return blocos
+
+def tokenizarBloco(caminho: str | Path, inicio: int, fim: int) -> list[tuple]:
+    """
+    Valida e tokeniza as linhas do intervalo de bytes [inicio, fim) do arquivo.
+    Devolve (linha, valida, tokens, erro) para cada linha não vazia, na ordem do
+    arquivo (ver validarExpressao.analisarEValidar); comentários ('#') são
+    devolvidos sem tokens.
+    """
+    with open(caminho, 'rb') as arquivo:
+        arquivo.seek(inicio)
+        texto = arquivo.read(fim - inicio).decode('utf-8')
+
+    # Mesmas quebras de linha reconhecidas pela leitura em modo texto
+    texto = texto.replace('\r\n', '\n').replace('\r', '\n')
+
+    resultados = []
+    for linha in texto.split('\n'):
+        linha = linha.strip()
+        if not linha:
+            continue
+        if linha.startswith('#'):
+            resultados.append((linha, True, None, None))
+            continue
+        resultados.append((linha, *analisarEValidar(linha)))
+    return resultados
+
+def tokenizarArquivoParalelo(caminho: str | Path, processos: int | None = None,
+                             tamanho_bloco: int = TAMANHO_BLOCO_PADRAO) -> Iterator[tuple]:
+    """
+    Tokeniza o arquivo em um pool de processos e entrega (linha, valida, tokens, erro)
+    para cada linha não vazia, na ordem original. As linhas são as mesmas de
+    io_utils.iterarArquivo. Com um só bloco ou um só processo, roda no processo atual.
+    """
+    try:
+        blocos = dividirEmBlocos(caminho, tamanho_bloco)
+    except FileNotFoundError:
+        print(f'ERRO -> Arquivo não encontrado: {caminho}')
+        return
+
+    processos = processos or os.cpu_count() or 1
+    if len(blocos) <= 1 or processos <= 1:
+        for inicio, fim in blocos:
+            yield from tokenizarBloco(caminho, inicio, fim)
+        return
+
+    with ProcessPoolExecutor(max_workers=min(processos, len(blocos))) as executor:
+        caminhos = [caminho] * len(blocos)
+        inicios = [inicio for inicio, _ in blocos]
+        fins = [fim for _, fim in blocos]
+        # map devolve os blocos na ordem de envio, mesmo que terminem fora de ordem
+        for resultados in executor.map(tokenizarBloco, caminhos, inicios, fins):
+            yield from resultados
@@ -0,0 +1,508 @@
+#!/usr/bin/env python3
+
+# Integrantes do grupo (ordem alfabética):
+# Nome Completo 1 - Breno Rossi Duarte
+# Nome Completo 2 - Francisco Bley Ruthes
+# Nome Completo 3 - Rafael Olivare Piveta
+# Nome Completo 4 - Stefan Benjamim Seixas Lourenço Rodrigues
+#
+# Nome do grupo no Canvas: RA2_1
+
+# Máquina virtual de pilha que executa o bytecode gerado por compilador.py.
+# Cada instrução reproduz exatamente uma operação de rpn_calc (mesmos cálculos,
+# mesmos diagnósticos), mas sem reanalisar os tokens a cada avaliação.
+
+import time
+
+from .tokens import Tipo_de_Token
+from .operadores import Operador, ARITMETICO
+from .memoria import Memoria, TabelaSimbolos, HistoricoResultados, AUSENTE
+from .orcamento import Orcamento, OrcamentoExcedido, MAX_ITERACOES
+from .diagnosticos import (Diagnosticos, relator, imprimir, OPERANDOS_INSUFICIENTES, OPERACAO_INVALIDA,
+                           HISTORICO_FORA, HISTORICO_VAZIO, ESTRUTURA_INCOMPLETA, ERRO_ESTRUTURA)
+
+class Opcode:
+    # Pilha e memória
+    # (arg das instruções de variáveis é o slot em memoria.valores)
+    CONST = 0               # empilha arg
+    CARREGAR = 1            # empilha o valor do slot arg (0.0 se a variável não existir)
+    ATRIBUIR = 2            # slot arg = topo (o valor continua na pilha)
+    ATRIBUIR_DESCARTAR = 3  # slot arg = desempilha
+    INICIALIZAR = 4         # slot arg = 0.0 se a variável não existir
+    DESCARTAR = 5           # remove o topo
+    MANTER_TOPO = 6         # remove arg valores abaixo do topo
+    ARREDONDAR = 7          # topo = arredondar_16bit(topo)
+    PARA_FLOAT = 8          # topo = float(topo)
+    PARA_INT = 9            # topo = int(topo)
+    PARA_INT_OU_1 = 10      # topo = int(topo) or 1
+    GUARDAR_TEMP = 11       # temps[arg] = desempilha
+    CARREGAR_TEMP = 12      # empilha float(temps[arg])
+
+    # Operadores com operandos garantidos; arg = Operador do registro (operadores.py)
+    SOMA = 13
+    SUBTRACAO = 14
+    MULTIPLICACAO = 15
+    ARITMETICO = 16         # demais aritméticos: arredondar_16bit(operador.avaliar(a, b))
+    RELACIONAL = 17         # comparações e lógicos binários: operador.avaliar(float(a), float(b))
+    NOT = 18
+    OPERANDOS_INSUFICIENTES = 19   # imprime o erro do operador e empilha 0.0
+
+    # Superinstruções: variável com constante ou com variável, (X 1 +), (X Y <)
+    OPERAR_VAR_CONST = 20   # arg = (opcode, tipo, operador, slot, constante)
+    OPERAR_VAR_VAR = 21     # arg = (opcode, tipo, operador, slot_a, slot_b)
+
+    # Histórico de resultados (RES)
+    HIST_ULTIMO = 22        # (RES) isolado: último resultado ou 0.0
+    HIST_INDICE = 23        # (N RES): arg = N
+    RES_ULTIMO = 24         # RES na pilha RPN sem índice
+    RES_INDICE = 25         # RES na pilha RPN com índice no topo
+
+    # Quadros com profundidade de pilha conhecida só em tempo de execução
+    MARCAR_BASE = 26
+    FIM_QUADRO = 27
+    OPERADOR_DINAMICO = 28  # arg = (opcode, operador)
+    RES_DINAMICO = 29
+
+    # Controle de fluxo
+    SALTAR = 30             # pc = arg
+    SALTAR_SE_ZERO = 31     # desempilha v; se float(v) == 0.0, pc = arg
+    TENTAR = 32             # arg = (pc_saida, nome): erros até FIM_TENTAR viram "ERRO no nome"
+    FIM_TENTAR = 33
+    ERRO_ESTRUTURA = 34     # imprime arg e empilha 0.0
+    ZERAR_TEMP = 35         # temps[arg] = 0
+    TESTAR_LACO = 36        # arg = (pc_saida, iteracoes): desempilha a condição; se zero, pc = pc_saida;
+                            # senão conta a volta e descarta o resultado anterior
+    REPETIR = 37            # arg = (pc, custo): consome `custo` operações e volta a pc
+    FOR_ENTRAR = 38         # arg = (contador, final, pc_fim, slot do _FOR_COUNTER)
+    FOR_PROXIMO = 39        # arg = (contador, incremento, final, iteracoes, pc_corpo, custo)
+    FOR_FIM = 40            # remove _FOR_COUNTER (slot arg)
+    RETORNAR = 41
+
+    # Memorização de subexpressões puras (subexpressoes.py); não contam no orçamento
+    MEMO_BUSCAR = 42        # arg = (índice, pc_fim): se há valor memorizado, empilha e pc = pc_fim
+    MEMO_GUARDAR = 43       # arg = (índice, slots lidos): memoriza o topo se as variáveis lidas são números
+
+    # Curto-circuito de && e || (compilarLinha com curto_circuito)
+    SALTAR_LOGICO = 44      # arg = (pc_fim, ou, dinamico): se o topo decide o && (0) ou o || (diferente
+                            # de 0), ele vira 0.0 ou 1.0 e pc = pc_fim, pulando o grupo e o operador;
+                            # com `dinamico`, só se o quadro tem algum valor acima da base
+
+    # Perfil de execução (perfil.instrumentarBytecode); só aparece no bytecode instrumentado
+    CONTAR = 45             # contadores.valores[arg] += 1
+
+    # Subexpressões invariantes de laços (compilador.icarInvariantes); não contam no orçamento
+    PREPARAR_INVARIANTE = 46    # arg = (slots lidos, temp, pc_fim): se alguma variável lida não é
+                                # número, temps[temp] = None e pc = pc_fim; senão segue para o cálculo
+    CARREGAR_INVARIANTE = 47    # arg = (temp, pc_fim): se temps[temp] tem valor, empilha e pc = pc_fim
+
+    NOMES = (
+        "CONST", "CARREGAR", "ATRIBUIR", "ATRIBUIR_DESCARTAR", "INICIALIZAR", "DESCARTAR", "MANTER_TOPO",
+        "ARREDONDAR", "PARA_FLOAT", "PARA_INT", "PARA_INT_OU_1", "GUARDAR_TEMP", "CARREGAR_TEMP",
+        "SOMA", "SUBTRACAO", "MULTIPLICACAO", "ARITMETICO", "RELACIONAL", "NOT", "OPERANDOS_INSUFICIENTES",
+        "OPERAR_VAR_CONST", "OPERAR_VAR_VAR",
+        "HIST_ULTIMO", "HIST_INDICE", "RES_ULTIMO", "RES_INDICE",
+        "MARCAR_BASE", "FIM_QUADRO", "OPERADOR_DINAMICO", "RES_DINAMICO",
+        "SALTAR", "SALTAR_SE_ZERO", "TENTAR", "FIM_TENTAR", "ERRO_ESTRUTURA",
+        "ZERAR_TEMP", "TESTAR_LACO", "REPETIR", "FOR_ENTRAR", "FOR_PROXIMO", "FOR_FIM",
+        "RETORNAR", "MEMO_BUSCAR", "MEMO_GUARDAR", "SALTAR_LOGICO", "CONTAR", "PREPARAR_INVARIANTE",
+        "CARREGAR_INVARIANTE",
+    )
+
+    ARITMETICOS = frozenset((SOMA, SUBTRACAO, MULTIPLICACAO, ARITMETICO))
+
+
+_MENOR = Tipo_de_Token.MENOR
+_MAIOR = Tipo_de_Token.MAIOR
+
+
+class CodigoCompilado:
+    # Bytecode de uma linha: lista de (opcode, argumento), número de temporários e a
+    # tabela de símbolos em que os slots das variáveis foram resolvidos. `nativo` é a
+    # função Python equivalente (codigo_nativo.py), executada no lugar do bytecode;
+    # `memo` é a tabela de subexpressões (subexpressoes.py) das instruções MEMO_*;
+    # `custo` são as instruções cobradas do orçamento (sem as de memorização);
+    # `contadores` são os do perfil (perfil.ContadoresLinha), incrementados pelas
+    # instruções CONTAR ou pela função nativa gerada com eles
+    __slots__ = ('instrucoes', 'num_temps', 'simbolos', 'nativo', 'memo', 'custo', 'contadores')
+
+    def __init__(self, instrucoes: list[tuple], num_temps: int, simbolos: TabelaSimbolos, nativo=None,
+                 memo=None, custo: int | None = None, contadores=None):
+        self.instrucoes = instrucoes
+        self.num_temps = num_temps
+        self.simbolos = simbolos
+        self.nativo = nativo
+        self.memo = memo
+        self.custo = len(instrucoes) if custo is None else custo
+        self.contadores = contadores
+
+
+def desmontar(codigo: CodigoCompilado) -> str:
+    """Listagem legível do bytecode, uma instrução por linha."""
+    linhas = []
+    for pc, (op, arg) in enumerate(codigo.instrucoes):
+        nome = Opcode.NOMES[op]
+        linhas.append(f"{pc:4d}  {nome}" if arg is None else f"{pc:4d}  {nome:<24} {arg!r}")
+    return "\n".join(linhas)
+
+
+def arredondar(valor):
+    # Igual a rpn_calc.arredondar_16bit
+    try:
+        return round(float(valor), 2)
+    except (ValueError, TypeError):
+        return valor
+
+
+def aritmetica(operador: Operador, a, b):
+    """Operação aritmética com o mesmo tratamento de erros de processarTokens."""
+    try:
+        return arredondar(operador.avaliar(a, b))
+    except (ZeroDivisionError, ValueError, OverflowError):
+        return 0.0
+
+
+# Os auxiliares abaixo relatam problemas com `relatar` (diagnosticos.relator), na
+# posição `pc` da instrução; sem ele (dobra de constantes), a mensagem é impressa
+
+def relacional(operador: Operador, a, b, relatar=imprimir, pc: int | None = None) -> float:
+    # Comparações e lógicos binários
+    try:
+        return operador.avaliar(float(a), float(b))
+    except (ValueError, TypeError) as e:
+        relatar(OPERACAO_INVALIDA, f"{operador.erro}: {e}", pc)
+        return 0.0
+
+
+def negacao(operador: Operador, a, relatar=imprimir, pc: int | None = None) -> float:
+    try:
+        return operador.avaliar(float(a))
+    except (ValueError, TypeError) as e:
+        relatar(OPERACAO_INVALIDA, f"{operador.erro}: {e}", pc)
+        return 0.0
+
+
+def decidir_logico(valor, ou: bool):
+    # Resultado de "a (b) &&" ou "a (b) ||" quando o topo `a` já o decide (None se não
+    # decide), como rpn_calc._decidir_logico
+    try:
+        a = float(valor)
+    except (ValueError, TypeError):
+        return None
+    if ou:
+        return 1.0 if a != 0.0 else None
+    return 0.0 if a == 0.0 else None
+
+
+def res_indice(idx, hist: HistoricoResultados, relatar=imprimir, pc: int | None = None):
+    if hist and 0 < idx <= len(hist):
+        return hist[-idx]
+    relatar(HISTORICO_FORA, f"ERRO -> Índice {idx} fora do intervalo do histórico (tamanho: {len(hist)})", pc)
+    return 0.0
+
+
+def res_ultimo(hist: HistoricoResultados, relatar=imprimir, pc: int | None = None):
+    if hist:
+        return hist[-1]
+    relatar(HISTORICO_VAZIO, "ERRO -> Histórico vazio", pc)
+    return 0.0
+
+
+def operar(operador: Operador, a, b, relatar=imprimir, pc: int | None = None):
+    # Caminho geral das superinstruções e dos operadores dinâmicos
+    if operador.categoria == ARITMETICO:
+        return aritmetica(operador, a, b)
+    return relacional(operador, a, b, relatar, pc)
+
+
+def executarCodigo(codigo: CodigoCompilado, memoria: Memoria, orcamento: Orcamento | None = None,
+                   diagnosticos: Diagnosticos | None = None):
+    """
+    Executa o bytecode de uma linha sobre `memoria` e devolve o resultado.
+    O código precisa ter sido compilado com a tabela de símbolos de `memoria`.
+    Erros dentro de IFELSE/WHILE/FOR são tratados como em rpn_calc
+    ("ERRO no X: ..." e resultado 0.0); os demais sobem para quem chamou.
+    Com `orcamento`, os limites de iterações, operações e tempo são os dele e as
+    operações da linha entram no consumo da execução; sem ele, só vale o limite
+    de MAX_ITERACOES voltas por laço. Passar de um limite levanta OrcamentoExcedido.
+    Os problemas que fazem uma operação valer 0.0 vão para `diagnosticos`, com a
+    posição da instrução; sem ele, as mensagens são impressas.
+    """
+    relatar = relator(diagnosticos)
+    if codigo.simbolos is not memoria.simbolos:
+        raise ValueError("ERRO -> Código compilado com outra tabela de símbolos")
+    gasto = codigo.custo
+    if orcamento is None:
+        limite_iteracoes = MAX_ITERACOES
+        proxima_verificacao = float('inf')
+        inicio_linha = 0.0
+    else:
+        limite_iteracoes = orcamento.limite_iteracoes
+        inicio_linha = time.perf_counter()
+        proxima_verificacao = orcamento.verificar(gasto, inicio_linha)
+    memoria.ajustar()
+    contadores = codigo.contadores
+    if codigo.nativo is not None:
+        return codigo.nativo(memoria.valores, memoria.historico, relatar, orcamento, limite_iteracoes,
+                             proxima_verificacao, inicio_linha, gasto, codigo.memo,
+                             None if contadores is None else contadores.valores)
+    contagens = None
+    if contadores is not None:
+        # Bytecode instrumentado pelo perfil: diagnósticos com as posições do original
+        contagens = contadores.valores
+        relatar = contadores.relator(relatar)
+    valores = memoria.valores
+    hist = memoria.historico
+    memo = codigo.memo
+    memorizados = None if memo is None else memo.valores
+    instrucoes = codigo.instrucoes
+    temps = [None] * codigo.num_temps
+    pilha = []
+    empilhar = pilha.append
+    desempilhar = pilha.pop
+    bases = []
+    tratadores = []
+    pc = 0
+
+    # Opcodes em variáveis locais: comparar com elas custa o mesmo que com literais,
+    # e a VM continua certa se a numeração de Opcode mudar
+    (OP_CONST, OP_CARREGAR, OP_ATRIBUIR, OP_ATRIBUIR_DESCARTAR, OP_INICIALIZAR, OP_DESCARTAR, OP_MANTER_TOPO,
+     OP_ARREDONDAR, OP_PARA_FLOAT, OP_PARA_INT, OP_PARA_INT_OU_1, OP_GUARDAR_TEMP, OP_CARREGAR_TEMP) = (
+        Opcode.CONST, Opcode.CARREGAR, Opcode.ATRIBUIR, Opcode.ATRIBUIR_DESCARTAR, Opcode.INICIALIZAR,
+        Opcode.DESCARTAR, Opcode.MANTER_TOPO, Opcode.ARREDONDAR, Opcode.PARA_FLOAT, Opcode.PARA_INT,
+        Opcode.PARA_INT_OU_1, Opcode.GUARDAR_TEMP, Opcode.CARREGAR_TEMP)
+    (OP_SOMA, OP_SUBTRACAO, OP_MULTIPLICACAO, OP_ARITMETICO, OP_RELACIONAL, OP_NOT,
+     OP_OPERANDOS_INSUFICIENTES, OP_ARITMETICOS, OP_OPERAR_VAR_CONST, OP_OPERAR_VAR_VAR) = (
+        Opcode.SOMA, Opcode.SUBTRACAO, Opcode.MULTIPLICACAO, Opcode.ARITMETICO, Opcode.RELACIONAL, Opcode.NOT,
+        Opcode.OPERANDOS_INSUFICIENTES, Opcode.ARITMETICOS, Opcode.OPERAR_VAR_CONST, Opcode.OPERAR_VAR_VAR)
+    (OP_HIST_ULTIMO, OP_HIST_INDICE, OP_RES_ULTIMO, OP_RES_INDICE, OP_MARCAR_BASE, OP_FIM_QUADRO,
+     OP_OPERADOR_DINAMICO, OP_RES_DINAMICO) = (
+        Opcode.HIST_ULTIMO, Opcode.HIST_INDICE, Opcode.RES_ULTIMO, Opcode.RES_INDICE, Opcode.MARCAR_BASE,
+        Opcode.FIM_QUADRO, Opcode.OPERADOR_DINAMICO, Opcode.RES_DINAMICO)
+    (OP_SALTAR, OP_SALTAR_SE_ZERO, OP_TENTAR, OP_FIM_TENTAR, OP_ERRO_ESTRUTURA, OP_ZERAR_TEMP, OP_TESTAR_LACO,
+     OP_REPETIR, OP_FOR_ENTRAR, OP_FOR_PROXIMO, OP_FOR_FIM, OP_RETORNAR, OP_MEMO_BUSCAR, OP_MEMO_GUARDAR,
+     OP_SALTAR_LOGICO, OP_CONTAR, OP_PREPARAR_INVARIANTE, OP_CARREGAR_INVARIANTE) = (
+        Opcode.SALTAR, Opcode.SALTAR_SE_ZERO, Opcode.TENTAR, Opcode.FIM_TENTAR, Opcode.ERRO_ESTRUTURA,
+        Opcode.ZERAR_TEMP, Opcode.TESTAR_LACO, Opcode.REPETIR, Opcode.FOR_ENTRAR, Opcode.FOR_PROXIMO,
+        Opcode.FOR_FIM, Opcode.RETORNAR, Opcode.MEMO_BUSCAR, Opcode.MEMO_GUARDAR, Opcode.SALTAR_LOGICO,
+        Opcode.CONTAR, Opcode.PREPARAR_INVARIANTE, Opcode.CARREGAR_INVARIANTE)
+
+    while True:
+        try:
+            # Instruções mais frequentes primeiro; somas, subtrações, multiplicações
+            # e comparações < e > entre floats são feitas sem chamar funções auxiliares
+            while True:
+                op, arg = instrucoes[pc]
+                pc += 1
+
+                if op == OP_OPERAR_VAR_CONST:
+                    operacao, tipo, operador, slot, b = arg
+                    a = valores[slot]
+                    if a.__class__ is not float:
+                        empilhar(operar(operador, 0.0 if a is AUSENTE else a, b, relatar, pc - 1))
+                    elif operacao == OP_SOMA: empilhar(round(a + b, 2))
+                    elif operacao == OP_SUBTRACAO: empilhar(round(a - b, 2))
+                    elif operacao == OP_MULTIPLICACAO: empilhar(round(a * b, 2))
+                    elif tipo == _MENOR: empilhar(1.0 if a < b else 0.0)
+                    elif tipo == _MAIOR: empilhar(1.0 if a > b else 0.0)
+                    else: empilhar(operar(operador, a, b, relatar, pc - 1))
+                elif op == OP_ATRIBUIR_DESCARTAR:
+                    valores[arg] = desempilhar()
+                elif op == OP_INICIALIZAR:
+                    if valores[arg] is AUSENTE:
+                        valores[arg] = 0.0
+                elif op == OP_CARREGAR:
+                    a = valores[arg]
+                    empilhar(0.0 if a is AUSENTE else a)
+                elif op == OP_CONST:
+                    empilhar(arg)
+                elif op == OP_TESTAR_LACO:
+                    if float(desempilhar()) == 0.0:
+                        pc = arg[0]
+                    else:
+                        if temps[arg[1]] >= limite_iteracoes:
+                            raise OrcamentoExcedido.iteracoes(limite_iteracoes)
+                        temps[arg[1]] += 1
+                        desempilhar()
+                elif op == OP_REPETIR:
+                    gasto += arg[1]
+                    if gasto >= proxima_verificacao:
+                        proxima_verificacao = orcamento.verificar(gasto, inicio_linha)
+                    pc = arg[0]
+                elif op == OP_FOR_PROXIMO:
+                    contador, incremento, final, iteracoes, pc_corpo, custo = arg
+                    gasto += custo
+                    if gasto >= proxima_verificacao:
+                        proxima_verificacao = orcamento.verificar(gasto, inicio_linha)
+                    # O contador fica só em temps: nenhum programa lê _FOR_COUNTER, que
+                    # é escrito só por FOR_ENTRAR e FOR_FIM
+                    temps[contador] += temps[incremento]
+                    temps[iteracoes] += 1
+                    if temps[contador] < temps[final]:
+                        if temps[iteracoes] >= limite_iteracoes:
+                            raise OrcamentoExcedido.iteracoes(limite_iteracoes)
+                        desempilhar()
+                        pc = pc_corpo
+                elif op == OP_OPERAR_VAR_VAR:
+                    operacao, tipo, operador, slot_a, slot_b = arg
+                    a = valores[slot_a]
+                    b = valores[slot_b]
+                    if a.__class__ is not float or b.__class__ is not float:
+                        empilhar(operar(operador, 0.0 if a is AUSENTE else a, 0.0 if b is AUSENTE else b,
+                                         relatar, pc - 1))
+                    elif operacao == OP_SOMA: empilhar(round(a + b, 2))
+                    elif operacao == OP_SUBTRACAO: empilhar(round(a - b, 2))
+                    elif operacao == OP_MULTIPLICACAO: empilhar(round(a * b, 2))
+                    elif tipo == _MENOR: empilhar(1.0 if a < b else 0.0)
+                    elif tipo == _MAIOR: empilhar(1.0 if a > b else 0.0)
+                    else: empilhar(operar(operador, a, b, relatar, pc - 1))
+                elif op in OP_ARITMETICOS:
+                    b = desempilhar()
+                    a = pilha[-1]
+                    if a.__class__ is float and b.__class__ is float and op != OP_ARITMETICO:
+                        if op == OP_SOMA: pilha[-1] = round(a + b, 2)
+                        elif op == OP_SUBTRACAO: pilha[-1] = round(a - b, 2)
+                        else: pilha[-1] = round(a * b, 2)
+                    else:
+                        pilha[-1] = aritmetica(arg, a, b)
+                elif op == OP_CARREGAR_INVARIANTE:
+                    valor = temps[arg[0]]
+                    if valor is not None:
+                        empilhar(valor)
+                        pc = arg[1]
+                elif op == OP_ATRIBUIR:
+                    valores[arg] = pilha[-1]
+                elif op == OP_RELACIONAL:
+                    b = desempilhar()
+                    pilha[-1] = relacional(arg, pilha[-1], b, relatar, pc - 1)
+                elif op == OP_SALTAR_SE_ZERO:
+                    if float(desempilhar()) == 0.0:
+                        pc = arg
+                elif op == OP_SALTAR:
+                    pc = arg
+                elif op == OP_SALTAR_LOGICO:
+                    if not arg[2] or len(pilha) > bases[-1]:
+                        decidido = decidir_logico(pilha[-1], arg[1])
+                        if decidido is not None:
+                            pilha[-1] = decidido
+                            pc = arg[0]
+                elif op == OP_DESCARTAR:
+                    desempilhar()
+                elif op == OP_ARREDONDAR:
+                    pilha[-1] = arredondar(pilha[-1])
+                elif op == OP_CARREGAR_TEMP:
+                    empilhar(float(temps[arg]))
+                elif op == OP_GUARDAR_TEMP:
+                    temps[arg] = desempilhar()
+                elif op == OP_MANTER_TOPO:
+                    del pilha[-1 - arg:-1]
+                elif op == OP_MEMO_BUSCAR:
+                    memo.consultas += 1
+                    valor = memorizados[arg[0]]
+                    if valor is not AUSENTE:
+                        memo.acertos += 1
+                        empilhar(valor)
+                        pc = arg[1]
+                elif op == OP_MEMO_GUARDAR:
+                    # Variável com None (resultado de linha com erro) pode gerar diagnósticos
+                    for slot in arg[1]:
+                        a = valores[slot]
+                        if a.__class__ is not float and a is not AUSENTE:
+                            break
+                    else:
+                        memorizados[arg[0]] = pilha[-1]
+                elif op == OP_NOT:
+                    pilha[-1] = negacao(arg, pilha[-1], relatar, pc - 1)
+                elif op == OP_PARA_FLOAT:
+                    pilha[-1] = float(pilha[-1])
+                elif op == OP_PARA_INT:
+                    pilha[-1] = int(pilha[-1])
+                elif op == OP_PARA_INT_OU_1:
+                    pilha[-1] = int(pilha[-1]) or 1
+                elif op == OP_OPERANDOS_INSUFICIENTES:
+                    relatar(OPERANDOS_INSUFICIENTES, arg.mensagem_insuficiente(), pc - 1)
+                    empilhar(0.0)
+                elif op == OP_HIST_ULTIMO:
+                    empilhar(hist[-1] if hist else 0.0)
+                elif op == OP_HIST_INDICE:
+                    idx = int(float(arg))
+                    if hist and 0 < idx <= len(hist):
+                        empilhar(hist[-idx])
+                    else:
+                        relatar(HISTORICO_FORA,
+                                f"ERRO -> Índice {idx} fora do intervalo do histórico (tamanho: {len(hist)})", pc - 1)
+                        empilhar(0.0)
+                elif op == OP_RES_ULTIMO:
+                    empilhar(res_ultimo(hist, relatar, pc - 1))
+                elif op == OP_RES_INDICE:
+                    empilhar(res_indice(int(desempilhar()), hist, relatar, pc - 1))
+                elif op == OP_TENTAR:
+                    tratadores.append((arg[0], arg[1], len(pilha), len(bases)))
+                elif op == OP_FIM_TENTAR:
+                    tratadores.pop()
+                elif op == OP_ZERAR_TEMP:
+                    temps[arg] = 0
+                elif op == OP_FOR_ENTRAR:
+                    contador, final, pc_fim, slot = arg
+                    valores[slot] = float(temps[contador])
+                    if temps[contador] < temps[final]:
+                        desempilhar()
+                    else:
+                        pc = pc_fim
+                elif op == OP_PREPARAR_INVARIANTE:
+                    for slot in arg[0]:
+                        a = valores[slot]
+                        if a.__class__ is not float and a is not AUSENTE:
+                            temps[arg[1]] = None
+                            pc = arg[2]
+                            break
+                elif op == OP_FOR_FIM:
+                    valores[arg] = AUSENTE
+                elif op == OP_ERRO_ESTRUTURA:
+                    relatar(ESTRUTURA_INCOMPLETA, arg, pc - 1)
+                    empilhar(0.0)
+                elif op == OP_MARCAR_BASE:
+                    bases.append(len(pilha))
+                elif op == OP_FIM_QUADRO:
+                    base = bases.pop()
+                    valor = pilha[-1] if len(pilha) > base else 0.0
+                    del pilha[base:]
+                    empilhar(arredondar(valor))
+                elif op == OP_OPERADOR_DINAMICO:
+                    operacao, operador = arg
+                    disponiveis = len(pilha) - bases[-1]
+                    if disponiveis < operador.aridade:
+                        relatar(OPERANDOS_INSUFICIENTES, operador.mensagem_insuficiente(), pc - 1)
+                        empilhar(0.0)
+                    elif operacao == OP_NOT:
+                        pilha[-1] = negacao(operador, pilha[-1], relatar, pc - 1)
+                    else:
+                        b = desempilhar()
+                        pilha[-1] = operar(operador, pilha[-1], b, relatar, pc - 1)
+                elif op == OP_RES_DINAMICO:
+                    if len(pilha) > bases[-1] and isinstance(pilha[-1], (int, float)):
+                        empilhar(res_indice(int(desempilhar()), hist, relatar, pc - 1))
+                    else:
+                        empilhar(res_ultimo(hist, relatar, pc - 1))
+                elif op == OP_CONTAR:
+                    contagens[arg] += 1
+                elif op == OP_RETORNAR:
+                    if orcamento is not None:
+                        orcamento.registrar(gasto)
+                    return pilha[-1]
+                else:
+                    raise ValueError(f"Opcode inválido: {op}")
+        except Exception as e:
+            # Mesmo efeito do try/except de processarIFELSE/WHILE/FOR; o orçamento
+            # excedido interrompe a linha inteira
+            if not tratadores or e.__class__ is OrcamentoExcedido:
+                if orcamento is not None:
+                    orcamento.registrar(gasto)
+                if contadores is not None and e.__class__ is OrcamentoExcedido:
+                    contadores.limiteAtingido(pc - 1)
+                raise
+            posicao = pc - 1
+            pc, nome, altura, num_bases = tratadores.pop()
+            relatar(ERRO_ESTRUTURA, f"ERRO no {nome}: {e}", posicao)
+            del pilha[altura:]
+            del bases[num_bases:]
+            empilhar(0.0)
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+
+# Integrantes do grupo (ordem alfabética):
+# Nome Completo 1 - Breno Rossi Duarte
+# Nome Completo 2 - Francisco Bley Ruthes
+# Nome Completo 3 - Rafael Olivare Piveta
+# Nome Completo 4 - Stefan Benjamim Seixas Lourenço Rodrigues
+#
+# Nome do grupo no Canvas: RA2_1
+
+# Memória de execução: variáveis em posições fixas (slots) de uma lista e histórico
+# de resultados (RES) em um buffer circular de profundidade limitada.
+# O compilador resolve cada nome de variável para um slot uma única vez; a máquina
+# virtual lê e escreve direto na lista. Memoria também aceita o acesso por nome de um
+# dicionário (get, [], in, del), usado por rpn_calc e pela avaliação em lote.
+
+from typing import Iterable, Mapping
+
+# Chave do histórico no acesso por nome (como no dicionário usado antes)
+CHAVE_HISTORICO = 'historico_resultados'
+# Variável interna com o contador do FOR
+CONTADOR_FOR = '_FOR_COUNTER'
+# Resultados guardados para RES por padrão (None = sem limite)
+PROFUNDIDADE_HISTORICO = 1000
+
+
+class _Ausente:
+    # Marca slots de variáveis que ainda não existem (ou foram removidas)
+    __slots__ = ()
+    def __repr__(self):
+        return "AUSENTE"
+    def __reduce__(self):
+        # Com pickle, volta como a instância única deste módulo
+        return 'AUSENTE'
+
+AUSENTE = _Ausente()
+
+
+class TabelaSimbolos:
+    """Nome de variável -> slot. Os slots nunca mudam depois de criados."""
+    __slots__ = ('slots', 'nomes')
+
+    def __init__(self):
+        self.slots = {}
+        self.nomes = []
+
+    def __len__(self):
+        return len(self.nomes)
+
+    def slot(self, nome: str) -> int:
+        slot = self.slots.get(nome)
+        if slot is None:
+            slot = self.slots[nome] = len(self.nomes)
+            self.nomes.append(nome)
+        return slot
+
+
+class HistoricoResultados:
+    """
+    Resultados das linhas anteriores, do mais antigo ao mais recente. Com
+    `profundidade`, só os últimos `profundidade` ficam guardados (buffer circular).
+    Indexação como a de uma lista: historico[-1] é o último resultado.
+    """
+    __slots__ = ('profundidade', '_itens', '_inicio', '_tamanho')
+
+    def __init__(self, profundidade: int | None = PROFUNDIDADE_HISTORICO, itens: Iterable = ()):
+        if profundidade is not None and profundidade < 1:
+            raise ValueError("ERRO -> A profundidade do histórico deve ser pelo menos 1")
+        self.profundidade = profundidade
+        self._itens = [] if profundidade is None else [None] * profundidade
+        self._inicio = 0
+        self._tamanho = 0
+        for valor in itens:
+            self.adicionar(valor)
+
+    def adicionar(self, valor):
+        if self.profundidade is None:
+            self._itens.append(valor)
+            self._tamanho += 1
+        elif self._tamanho < self.profundidade:
+            self._itens[(self._inicio + self._tamanho) % self.profundidade] = valor
+            self._tamanho += 1
+        else:
+            # Cheio: sobrescreve o mais antigo
+            self._itens[self._inicio] = valor
+            self._inicio = (self._inicio + 1) % self.profundidade
+
+    def __len__(self):
+        return self._tamanho
+
+    def __getitem__(self, indice: int):
+        if indice < 0:
+            indice += self._tamanho
+        if not 0 <= indice < self._tamanho:
+            raise IndexError("índice fora do histórico")
+        if self.profundidade is None:
+            return self._itens[indice]
+        return self._itens[(self._inicio + indice) % self.profundidade]
+
+    def __iter__(self):
+        if self.profundidade is None or self._tamanho < self.profundidade:
+            # Antes de encher, o buffer começa na posição 0
+            return iter(self._itens[:self._tamanho])
+        return iter(self._itens[self._inicio:] + self._itens[:self._inicio])
+
+    def __repr__(self):
+        return f"HistoricoResultados({list(self)!r})"
+
+
+class Memoria:
+    """Variáveis (slots de `simbolos`) e histórico de resultados de uma execução."""
+    __slots__ = ('simbolos', 'valores', 'historico')
+
+    def __init__(self, profundidade_historico: int | None = PROFUNDIDADE_HISTORICO,
+                 simbolos: TabelaSimbolos | None = None):
+        self.simbolos = TabelaSimbolos() if simbolos is None else simbolos
+        self.valores = []
+        self.historico = HistoricoResultados(profundidade_historico)
+        self.ajustar()
+
+    @classmethod
+    def de_dicionario(cls, dados: Mapping, profundidade_historico: int | None = None) -> 'Memoria':
+        """Cria a memória a partir de um dicionário no formato antigo (nome -> valor)."""
+        memoria = cls(profundidade_historico)
+        for nome, valor in dados.items():
+            if nome == CHAVE_HISTORICO:
+                memoria.historico = HistoricoResultados(profundidade_historico, valor)
+            else:
+                memoria[nome] = valor
+        return memoria
+
+    def ajustar(self):
+        # Cria os slots de variáveis que o compilador registrou depois da última execução
+        faltam = len(self.simbolos) - len(self.valores)
+        if faltam > 0:
+            self.valores.extend([AUSENTE] * faltam)
+
+    def copiar(self) -> 'Memoria':
+        """Cópia das variáveis; tabela de símbolos e histórico são compartilhados."""
+        copia = Memoria.__new__(Memoria)
+        copia.simbolos = self.simbolos
+        copia.valores = list(self.valores)
+        copia.historico = self.historico
+        return copia
+
+    def como_dicionario(self) -> dict:
+        """Variáveis existentes, por nome."""
+        return {nome: valor for nome, valor in zip(self.simbolos.nomes, self.valores) if valor is not AUSENTE}
+
+    # --- acesso por nome (mesma interface do dicionário usado antes) ---
+
+    def get(self, nome: str, padrao=None):
+        if nome == CHAVE_HISTORICO:
+            return self.historico
+        slot = self.simbolos.slots.get(nome)
+        if slot is None or slot >= len(self.valores):
+            return padrao
+        valor = self.valores[slot]
+        return padrao if valor is AUSENTE else valor
+
+    def __getitem__(self, nome: str):
+        valor = self.get(nome, AUSENTE)
+        if valor is AUSENTE:
+            raise KeyError(nome)
+        return valor
+
+    def __setitem__(self, nome: str, valor):
+        slot = self.simbolos.slot(nome)
+        self.ajustar()
+        self.valores[slot] = valor
+
+    def __delitem__(self, nome: str):
+        if nome not in self:
+            raise KeyError(nome)
+        self.valores[self.simbolos.slots[nome]] = AUSENTE
+
+    def __contains__(self, nome: str) -> bool:
+        return self.get(nome, AUSENTE) is not AUSENTE
+
+    def __repr__(self):
+        return f"Memoria({self.como_dicionario()!r}, historico={len(self.historico)})"
@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+
+# Integrantes do grupo (ordem alfabética):
+# Nome Completo 1 - Breno Rossi Duarte
+# Nome Completo 2 - Francisco Bley Ruthes
+# Nome Completo 3 - Rafael Olivare Piveta
+# Nome Completo 4 - Stefan Benjamim Seixas Lourenço Rodrigues
+#
+# Nome do grupo no Canvas: RA2_1
+
+# Registro central dos operadores da linguagem.
+# Cada operador é descrito uma única vez: lexema, aridade, função de avaliação,
+# terminal da gramática LL(1), a expressão Python equivalente para operandos float
+# (usada por codigo_nativo.py), o trecho Assembly AVR que o executa e o valor que esse
+# trecho calcula com inteiros de 16 bits (usado por semantica_avr.py). Interpretador,
+# máquina virtual, validador, gramática e gerador de Assembly consultam este registro
+# por lexema ou por tipo de token em O(1). Para criar um operador basta dar a ele um
+# tipo em Tipo_de_Token e um lexema em TIPOS_POR_LEXEMA (analisador léxico) e
+# acrescentar sua entrada em OPERADORES.
+
+import math
+from .inteiros_avr import MASCARA, com_sinal, potencia
+from .tokens import Tipo_de_Token, TIPOS_POR_LEXEMA
+
+# Categorias (definem como os operandos são tratados antes da avaliação)
+ARITMETICO = 'aritmetico'   # operandos usados como estão; resultado arredondado
+COMPARACAO = 'comparacao'   # operandos convertidos com float()
+LOGICO = 'logico'           # operandos convertidos com float(); 0.0 é falso
+
+class Operador:
+    __slots__ = ('lexema', 'tipo', 'terminal', 'categoria', 'aridade', 'avaliar', 'erro', 'assembly', 'avr', 'python')
+
+    def __init__(self, lexema: str, terminal: str, categoria: str, aridade: int,
+                 avaliar, erro: str | None, assembly: tuple[str, ...], avr=None, python: str | None = None):
+        self.lexema = lexema
+        self.tipo = TIPOS_POR_LEXEMA[lexema]
+        self.terminal = terminal        # símbolo da gramática LL(1) (configuracaoGramatica)
+        self.categoria = categoria
+        self.aridade = aridade
+        self.avaliar = avaliar          # avaliar(a, b) ou avaliar(a) com operandos já convertidos
+        self.erro = erro                # prefixo da mensagem quando a conversão falha
+        self.assembly = assembly        # linhas Assembly AVR (pilha de inteiros de 16 bits)
+        self.avr = avr                  # avr(a, b) ou avr(a): o que `assembly` calcula, de 0 a 0xFFFF
+        # Expressão com {a} e {b} que dá, para operandos float, o mesmo valor que a máquina
+        # virtual (já arredondado, nos aritméticos); None se pode levantar exceção
+        self.python = python
+
+    def __repr__(self):
+        return f"Operador({self.lexema!r})"
+
+    def __reduce__(self):
+        # Enviado a outro processo pelo lexema: o registro tem funções lambda
+        return (_operador_por_lexema, (self.lexema,))
+
+    def gerar_assembly(self) -> list[str]:
+        return list(self.assembly)
+
+    def mensagem_insuficiente(self) -> str:
+        if self.aridade == 1:
+            return f"ERRO -> Token insuficiente para o operador '{self.lexema}'"
+        return f"ERRO -> Tokens insuficientes para o operador '{self.lexema}'"
+
+
+OPERADORES = (
+    Operador('+', 'SOMA', ARITMETICO, 2, lambda a, b: a + b, None, (
+        "    ; Operação de soma",
+        "    rcall stack_pop_int      ; Remove segundo operando",
+        "    mov r18, r16             ; guarda segundo operando",
+        "    mov r19, r17",
+        "    rcall stack_pop_int      ; Remove primeiro operando",
+        "",
+        "    ; Soma 16-bit",
+        "    add r16, r18",
+        "    adc r17, r19",
+        "",
+        "    rcall stack_push_int",
+        "",
+    ), avr=lambda a, b: (a + b) & MASCARA, python="round({a} + {b}, 2)"),
+    Operador('-', 'SUBTRACAO', ARITMETICO, 2, lambda a, b: a - b, None, (
+        "    ; Operação de subtração",
+        "    rcall stack_pop_int      ; Remove segundo operando",
+        "    mov r18, r16             ; guarda segundo operando",
+        "    mov r19, r17",
+        "    rcall stack_pop_int      ; Remove primeiro operando",
+        "",
+        "    ; Subtração 16-bit",
+        "    sub r16, r18",
+        "    sbc r17, r19",
+        "",
+        "    rcall stack_push_int",
+        "",
+    ), avr=lambda a, b: (a - b) & MASCARA, python="round({a} - {b}, 2)"),
+    Operador('*', 'MULTIPLICACAO', ARITMETICO, 2, lambda a, b: a * b, None, (
+        "    ; Operação de multiplicação",
+        "    rcall stack_pop_int      ; Remove segundo operando",
+        "    mov r18, r16             ; guarda segundo operando",
+        "    mov r19, r17",
+        "    rcall stack_pop_int      ; Remove primeiro operando",
+        "",
+        "    ; Multiplicação 16-bit",
+        "    rcall multiply_int",
+        "",
+        "    rcall stack_push_int",
+        "",
+    ), avr=lambda a, b: (a * b) & MASCARA, python="round({a} * {b}, 2)"),
+    Operador('/', 'DIVISAO_INTEIRA', ARITMETICO, 2, lambda a, b: int(a / b) if b != 0 else 0.0, None, (
+        "    ; Operação de divisão",
+        "    rcall stack_pop_int      ; Remove divisor",
+        "    mov r18, r16             ; guarda divisor",
+        "    mov r19, r17",
+        "    rcall stack_pop_int      ; Remove dividendo",
+        "",
+        "    ; Divisão 16-bit",
+        "    rcall divide_int",
+        "",
+        "    rcall stack_push_int",
+        "",
+    ), avr=lambda a, b: a // b if b else MASCARA),
+    Operador('|', 'DIVISAO_REAL', ARITMETICO, 2, lambda a, b: a / b if b != 0 else 0.0, None, (
+        "    ; Operação de divisão real",
+        "    rcall stack_pop_int      ; Remove divisor",
+        "    mov r18, r16             ; guarda divisor",
+        "    mov r19, r17",
+        "    rcall stack_pop_int      ; Remove dividendo",
+        "",
+        "    ; Divisão 16-bit (no alvo de 16 bits a divisão real também é inteira)",
+        "    rcall divide_int",
+        "",
+        "    rcall stack_push_int",
+        "",
+    ), avr=lambda a, b: a // b if b else MASCARA),
+    Operador('%', 'RESTO', ARITMETICO, 2, lambda a, b: a % b if b != 0 else 0.0, None, (
+        "    ; Operação de módulo",
+        "    rcall stack_pop_int      ; Remove divisor",
+        "    mov r18, r16             ; guarda divisor",
+        "    mov r19, r17",
+        "    rcall stack_pop_int      ; Remove dividendo",
+        "",
+        "    ; Módulo 16-bit",
+        "    rcall modulo_int",
+        "",
+        "    rcall stack_push_int",
+        "",
+    ), avr=lambda a, b: a % b if b else a),
+    Operador('^', 'POTENCIA', ARITMETICO, 2, math.pow, None, (
+        "    ; Operação de potência",
+        "    rcall stack_pop_int      ; Remove expoente",
+        "    mov r18, r16             ; guarda expoente",
+        "    mov r19, r17",
+        "    rcall stack_pop_int      ; Remove base",
+        "",
+        "    ; Potência 16-bit",
+        "    rcall power_int",
+        "",
+        "    rcall stack_push_int",
+        "",
+    ), avr=potencia),
+    Operador('<', 'MENOR', COMPARACAO, 2, lambda a, b: 1.0 if a < b else 0.0, "ERRO na comparação <", (
+        "    ; Operação menor que",
+        "    rcall stack_pop_int      ; Remove segundo operando",
+        "    mov r18, r16             ; guarda segundo operando",
+        "    mov r19, r17",
+        "    rcall stack_pop_int      ; Remove primeiro operando",
+        "",
+        "    ; Comparação menor que",
+        "    cp r16, r18              ; Compara low bytes",
+        "    cpc r17, r19             ; Compara high bytes com carry",
+        "    brlt _menor_true         ; Branch if less than",
+        "    ldi r16, 0               ; False",
+        "    ldi r17, 0",
+        "    rjmp _menor_fim",
+        "_menor_true:",
+        "    ldi r16, 1               ; True",
+        "    ldi r17, 0",
+        "_menor_fim:",
+        "    rcall stack_push_int",
+        "",
+    ), avr=lambda a, b: int(com_sinal(a) < com_sinal(b)), python="1.0 if {a} < {b} else 0.0"),
+    Operador('>', 'MAIOR', COMPARACAO, 2, lambda a, b: 1.0 if a > b else 0.0, "ERRO na comparação >", (
+        "    ; Operação maior que",
+        "    rcall stack_pop_int      ; Remove segundo operando",
+        "    mov r18, r16             ; guarda segundo operando",
+        "    mov r19, r17",
+        "    rcall stack_pop_int      ; Remove primeiro operando",
+        "",
+        "    ; Comparação maior que",
+        "    cp r16, r18              ; Compara low bytes",
+        "    cpc r17, r19             ; Compara high bytes com carry",
+        "    brgt _maior_true         ; Branch if greater than",
+        "    ldi r16, 0               ; False",
+        "    ldi r17, 0",
+        "    rjmp _maior_fim",
+        "_maior_true:",
+        "    ldi r16, 1               ; True",
+        "    ldi r17, 0",
+        "_maior_fim:",
+        "    rcall stack_push_int",
+        "",
+    ), avr=lambda a, b: int(com_sinal(a) > com_sinal(b)), python="1.0 if {a} > {b} else 0.0"),
+    Operador('==', 'IGUAL', COMPARACAO, 2, lambda a, b: 1.0 if abs(a - b) < 1e-10 else 0.0, "ERRO na comparação ==", (
+        "    ; Operação igual a",
+        "    rcall stack_pop_int      ; Remove segundo operando",
+        "    mov r18, r16             ; guarda segundo operando",
+        "    mov r19, r17",
+        "    rcall stack_pop_int      ; Remove primeiro operando",
+        "",
+        "    ; Comparação de igualdade",
+        "    cp r16, r18              ; Compara low bytes",
+        "    brne _igual_false        ; Se diferentes, é falso",
+        "    cp r17, r19              ; Compara high bytes",
+        "    brne _igual_false        ; Se diferentes, é falso",
+        "    ldi r16, 1               ; True",
+        "    ldi r17, 0",
+        "    rjmp _igual_fim",
+        "_igual_false:",
+        "    ldi r16, 0               ; False",
+        "    ldi r17, 0",
+        "_igual_fim:",
+        "    rcall stack_push_int",
+        "",
+    ), avr=lambda a, b: int(a == b), python="1.0 if abs({a} - {b}) < 1e-10 else 0.0"),
+    Operador('<=', 'MENOR_IGUAL', COMPARACAO, 2, lambda a, b: 1.0 if a <= b else 0.0, "ERRO na comparação <=", (
+        "    ; Operação menor ou igual a",
+        "    rcall stack_pop_int      ; Remove segundo operando",
+        "    mov r18, r16             ; guarda segundo operando",
+        "    mov r19, r17",
+        "    rcall stack_pop_int      ; Remove primeiro operando",
+        "",
+        "    ; Comparação menor ou igual",
+        "    cp r16, r18              ; Compara low bytes",
+        "    cpc r17, r19             ; Compara high bytes com carry",
+        "    brle _menor_igual_true   ; Branch if less or equal",
+        "    ldi r16, 0               ; False",
+        "    ldi r17, 0",
+        "    rjmp _menor_igual_fim",
+        "_menor_igual_true:",
+        "    ldi r16, 1               ; True",
+        "    ldi r17, 0",
+        "_menor_igual_fim:",
+        "    rcall stack_push_int",
+        "",
+    ), avr=lambda a, b: int(com_sinal(a) <= com_sinal(b)), python="1.0 if {a} <= {b} else 0.0"),
+    Operador('>=', 'MAIOR_IGUAL', COMPARACAO, 2, lambda a, b: 1.0 if a >= b else 0.0, "ERRO na comparação >=", (
+        "    ; Operação maior ou igual a",
+        "    rcall stack_pop_int      ; Remove segundo operando",
+        "    mov r18, r16             ; guarda segundo operando",
+        "    mov r19, r17",
+        "    rcall stack_pop_int      ; Remove primeiro operando",
+        "",
+        "    ; Comparação maior ou igual",
+        "    cp r16, r18              ; Compara low bytes",
+        "    cpc r17, r19             ; Compara high bytes com carry",
+        "    brge _maior_igual_true   ; Branch if greater or equal",
+        "    ldi r16, 0               ; False",
+        "    ldi r17, 0",
+        "    rjmp _maior_igual_fim",
+        "_maior_igual_true:",
+        "    ldi r16, 1               ; True",
+        "    ldi r17, 0",
+        "_maior_igual_fim:",
+        "    rcall stack_push_int",
+        "",
+    ), avr=lambda a, b: int(com_sinal(a) >= com_sinal(b)), python="1.0 if {a} >= {b} else 0.0"),
+    Operador('!=', 'DIFERENTE', COMPARACAO, 2, lambda a, b: 1.0 if abs(a - b) >= 1e-10 else 0.0, "ERRO na comparação !=", (
+        "    ; Operação diferente de",
+        "    rcall stack_pop_int      ; Remove segundo operando",
+        "    mov r18, r16             ; guarda segundo operando",
+        "    mov r19, r17",
+        "    rcall stack_pop_int      ; Remove primeiro operando",
+        "",
+        "    ; Comparação de diferença",
+        "    cp r16, r18              ; Compara low bytes",
+        "    brne _diferente_true     ; Se diferentes, é verdadeiro",
+        "    cp r17, r19              ; Compara high bytes",
+        "    brne _diferente_true     ; Se diferentes, é verdadeiro",
+        "    ldi r16, 0               ; False",
+        "    ldi r17, 0",
+        "    rjmp _diferente_fim",
+        "_diferente_true:",
+        "    ldi r16, 1               ; True",
+        "    ldi r17, 0",
+        "_diferente_fim:",
+        "    rcall stack_push_int",
+        "",
+    ), avr=lambda a, b: int(a != b), python="1.0 if abs({a} - {b}) >= 1e-10 else 0.0"),
+    Operador('&&', 'AND', LOGICO, 2, lambda a, b: 1.0 if a != 0.0 and b != 0.0 else 0.0, "ERRO na operação lógica &&", (
+        "    ; Operação AND",
+        "    rcall stack_pop_int      ; Remove segundo operando",
+        "    mov r18, r16             ; guarda segundo operando",
+        "    mov r19, r17",
+        "    rcall stack_pop_int      ; Remove primeiro operando",
+        "",
+        "    ; AND lógico",
+        "    cp r16, __zero_reg__     ; Verifica primeiro operando",
+        "    cpc r17, __zero_reg__",
+        "    breq _and_false          ; Se é zero, resultado é 0",
+        "    cp r18, __zero_reg__     ; Verifica segundo operando",
+        "    cpc r19, __zero_reg__",
+        "    breq _and_false          ; Se é zero, resultado é 0",
+        "    ldi r16, 1               ; Ambos não são zero",
+        "    ldi r17, 0",
+        "    rjmp _and_fim",
+        "_and_false:",
+        "    ldi r16, 0               ; Pelo menos um é zero",
+        "    ldi r17, 0",
+        "_and_fim:",
+        "    rcall stack_push_int",
+        "",
+    ), avr=lambda a, b: int(a != 0 and b != 0), python="1.0 if {a} != 0.0 and {b} != 0.0 else 0.0"),
+    Operador('||', 'OR', LOGICO, 2, lambda a, b: 1.0 if a != 0.0 or b != 0.0 else 0.0, "ERRO na operação lógica ||", (
+        "    ; Operação OR",
+        "    rcall stack_pop_int      ; Remove segundo operando",
+        "    mov r18, r16             ; guarda segundo operando",
+        "    mov r19, r17",
+        "    rcall stack_pop_int      ; Remove primeiro operando",
+        "",
+        "    ; OR lógico",
+        "    cp r16, __zero_reg__     ; Verifica primeiro operando",
+        "    cpc r17, __zero_reg__",
+        "    brne _or_true            ; Se não é zero, resultado é 1",
+        "    cp r18, __zero_reg__     ; Verifica segundo operando",
+        "    cpc r19, __zero_reg__",
+        "    brne _or_true            ; Se não é zero, resultado é 1",
+        "    ldi r16, 0               ; Ambos são zero, resultado é 0",
+        "    ldi r17, 0",
+        "    rjmp _or_fim",
+        "_or_true:",
+        "    ldi r16, 1               ; Pelo menos um não é zero",
+        "    ldi r17, 0",
+        "_or_fim:",
+        "    rcall stack_push_int",
+        "",
+    ), avr=lambda a, b: int(a != 0 or b != 0), python="1.0 if {a} != 0.0 or {b} != 0.0 else 0.0"),
+    Operador('!', 'NOT', LOGICO, 1, lambda a: 1.0 if a == 0.0 else 0.0, "ERRO na operação NOT", (
+        "    ; Operação NOT",
+        "    rcall stack_pop_int      ; Remove operando",
+        "",
+        "    ; NOT lógico",
+        "    cp r16, __zero_reg__     ; Compara com zero",
+        "    cpc r17, __zero_reg__",
+        "    breq _not_true           ; Se zero, resultado é 1",
+        "    ldi r16, 0               ; Não é zero, resultado é 0",
+        "    ldi r17, 0",
+        "    rjmp _not_fim",
+        "_not_true:",
+        "    ldi r16, 1               ; É zero, resultado é 1",
+        "    ldi r17, 0",
+        "_not_fim:",
+        "    rcall stack_push_int",
+        "",
+    ), avr=lambda a: int(a == 0), python="1.0 if {a} == 0.0 else 0.0"),
+)
+
+OPERADORES_POR_LEXEMA = {operador.lexema: operador for operador in OPERADORES}
+
+def _operador_por_lexema(lexema: str) -> Operador:
+    return OPERADORES_POR_LEXEMA[lexema]
+
+# Indexado pelo código do tipo do token; None para tipos que não são operadores
+OPERADORES_POR_TIPO = tuple(
+    next((operador for operador in OPERADORES if operador.tipo == tipo), None)
+    for tipo in range(len(Tipo_de_Token.NOMES))
+)
+
+LEXEMAS_OPERADORES = frozenset(OPERADORES_POR_LEXEMA)
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+
+# Integrantes do grupo (ordem alfabética):
+# Nome Completo 1 - Breno Rossi Duarte
+# Nome Completo 2 - Francisco Bley Ruthes
+# Nome Completo 3 - Rafael Olivare Piveta
+# Nome Completo 4 - Stefan Benjamim Seixas Lourenço Rodrigues
+#
+# Nome do grupo no Canvas: RA2_1
+
+# Orçamento de execução: limites de iterações por laço, de operações e de tempo
+# por linha e por execução (arquivo inteiro). Ao passar de um limite, a execução
+# para com OrcamentoExcedido em vez de cortar o laço em silêncio.
+#
+# Operações são medidas em instruções do bytecode (compilador.py): cada linha custa
+# o seu número de instruções e cada volta de um laço custa o tamanho do seu corpo.
+# No interpretador de referência (rpn_calc), que não tem bytecode, as operações são
+# tokens, com a mesma regra.
+# O tempo é conferido a cada INTERVALO_VERIFICACAO operações.
+
+import time
+
+# Iterações por laço WHILE/FOR quando nada é configurado
+MAX_ITERACOES = 1000
+# Operações entre duas consultas ao relógio
+INTERVALO_VERIFICACAO = 10000
+
+# Escopos e recursos de OrcamentoExcedido
+LACO = 'laco'
+LINHA = 'linha'
+EXECUCAO = 'execucao'
+ITERACOES = 'iteracoes'
+OPERACOES = 'operacoes'
+TEMPO = 'tempo'
+
+_DESCRICOES = {
+    (ITERACOES, LACO): "iterações de um laço",
+    (OPERACOES, LINHA): "operações da linha",
+    (OPERACOES, EXECUCAO): "operações da execução",
+    (TEMPO, LINHA): "tempo da linha (s)",
+    (TEMPO, EXECUCAO): "tempo da execução (s)",
+}
+
+
+class OrcamentoExcedido(Exception):
+    """Um limite do orçamento foi ultrapassado; a linha é interrompida."""
+
+    def __init__(self, recurso: str, escopo: str, limite, consumido):
+        self.recurso = recurso
+        self.escopo = escopo
+        self.limite = limite
+        self.consumido = consumido
+        super().__init__(f"Orçamento excedido: {_DESCRICOES[recurso, escopo]} "
+                         f"(limite: {limite}, consumido: {consumido})")
+
+    @classmethod
+    def iteracoes(cls, limite: int) -> 'OrcamentoExcedido':
+        # O laço ainda ia executar mais uma volta depois de `limite`
+        return cls(ITERACOES, LACO, limite, limite + 1)
+
+
+def _positivo(valor, nome: str):
+    if valor is not None and valor <= 0:
+        raise ValueError(f"ERRO -> O limite {nome} deve ser positivo")
+    return valor
+
+
+class Orcamento:
+    """
+    Limites de uma execução (None = sem limite) e o consumo acumulado entre linhas.
+    Uma mesma instância deve ser usada para todas as linhas de uma execução.
+    """
+    __slots__ = ('max_iteracoes', 'operacoes_linha', 'tempo_linha', 'operacoes_execucao',
+                 'tempo_execucao', 'operacoes_usadas', 'inicio_execucao')
+
+    def __init__(self, max_iteracoes: int | None = MAX_ITERACOES, operacoes_linha: int | None = None,
+                 tempo_linha: float | None = None, operacoes_execucao: int | None = None,
+                 tempo_execucao: float | None = None):
+        self.max_iteracoes = _positivo(max_iteracoes, "de iterações")
+        self.operacoes_linha = _positivo(operacoes_linha, "de operações por linha")
+        self.tempo_linha = _positivo(tempo_linha, "de tempo por linha")
+        self.operacoes_execucao = _positivo(operacoes_execucao, "de operações da execução")
+        self.tempo_execucao = _positivo(tempo_execucao, "de tempo da execução")
+        self.iniciar()
+
+    def iniciar(self):
+        """Zera o consumo da execução (operações e relógio)."""
+        self.operacoes_usadas = 0
+        self.inicio_execucao = time.perf_counter()
+
+    @property
+    def por_execucao(self) -> bool:
+        """True se há limites para a execução inteira (além dos por linha)."""
+        return self.operacoes_execucao is not None or self.tempo_execucao is not None
+
+    @property
+    def limite_iteracoes(self) -> float:
+        return float('inf') if self.max_iteracoes is None else self.max_iteracoes
+
+    def verificar(self, gasto: int, inicio_linha: float) -> float:
+        """
+        Confere os limites com `gasto` operações feitas na linha atual (que começou
+        em `inicio_linha`) e devolve o gasto em que a próxima verificação deve ocorrer.
+        """
+        if self.operacoes_linha is not None and gasto > self.operacoes_linha:
+            raise OrcamentoExcedido(OPERACOES, LINHA, self.operacoes_linha, gasto)
+        total = self.operacoes_usadas + gasto
+        if self.operacoes_execucao is not None and total > self.operacoes_execucao:
+            raise OrcamentoExcedido(OPERACOES, EXECUCAO, self.operacoes_execucao, total)
+
+        if self.tempo_linha is None and self.tempo_execucao is None:
+            proxima = float('inf')
+        else:
+            agora = time.perf_counter()
+            if self.tempo_linha is not None and agora - inicio_linha > self.tempo_linha:
+                raise OrcamentoExcedido(TEMPO, LINHA, self.tempo_linha, round(agora - inicio_linha, 3))
+            if self.tempo_execucao is not None and agora - self.inicio_execucao > self.tempo_execucao:
+                raise OrcamentoExcedido(TEMPO, EXECUCAO, self.tempo_execucao,
+                                        round(agora - self.inicio_execucao, 3))
+            proxima = gasto + INTERVALO_VERIFICACAO
+
+        # A próxima verificação não pode passar do primeiro limite de operações
+        if self.operacoes_linha is not None:
+            proxima = min(proxima, self.operacoes_linha + 1)
+        if self.operacoes_execucao is not None:
+            proxima = min(proxima, self.operacoes_execucao - self.operacoes_usadas + 1)
+        return proxima
+
+    def registrar(self, gasto: int):
+        """Soma ao consumo da execução as operações de uma linha terminada."""
+        self.operacoes_usadas += gasto
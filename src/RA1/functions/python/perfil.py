@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+
+# Integrantes do grupo (ordem alfabética):
+# Nome Completo 1 - Breno Rossi Duarte
+# Nome Completo 2 - Francisco Bley Ruthes
+# Nome Completo 3 - Rafael Olivare Piveta
+# Nome Completo 4 - Stefan Benjamim Seixas Lourenço Rodrigues
+#
+# Nome do grupo no Canvas: RA2_1
+
+# Perfil da execução de um programa, medido no código que de fato roda. Com um
+# PerfilExecucao, exibirResultados mede o tempo da chamada que executa cada linha
+# (máquina virtual ou função nativa) e a linha roda com contadores (ContadoresLinha):
+# o bytecode ganha instruções CONTAR antes de cada operador e nas entradas e voltas de
+# cada WHILE/FOR (instrumentarBytecode), e a função de --nativo é gerada com os mesmos
+# contadores (codigo_nativo.compilarLinhaNativa(..., perfilado=True)). As vezes em que
+# um limite do orçamento interrompeu cada laço também são contadas. Sem perfil, o
+# bytecode não tem CONTAR e a máquina virtual roda exatamente como antes.
+#
+# O relatório ordena as linhas pelo tempo gasto; o JSON tem os mesmos dados, para
+# comparar execuções ou alimentar outras ferramentas.
+
+import json
+from pathlib import Path
+
+from .maquina_virtual import Opcode, CodigoCompilado
+
+# Contadores de cada laço: entradas, voltas do corpo e limites atingidos
+ENTRADAS, VOLTAS, LIMITES = 0, 1, 2
+
+# Operadores no bytecode: instrução -> Operador do argumento
+_OPERADORES = {
+    Opcode.SOMA: lambda arg: arg,
+    Opcode.SUBTRACAO: lambda arg: arg,
+    Opcode.MULTIPLICACAO: lambda arg: arg,
+    Opcode.ARITMETICO: lambda arg: arg,
+    Opcode.RELACIONAL: lambda arg: arg,
+    Opcode.NOT: lambda arg: arg,
+    Opcode.OPERANDOS_INSUFICIENTES: lambda arg: arg,
+    Opcode.OPERAR_VAR_CONST: lambda arg: arg[2],
+    Opcode.OPERAR_VAR_VAR: lambda arg: arg[2],
+    Opcode.OPERADOR_DINAMICO: lambda arg: arg[1],
+}
+
+# Instruções que podem desviar a execução: argumento com o destino trocado por novo(destino)
+_DESVIOS = {
+    Opcode.SALTAR: lambda arg, novo: novo(arg),
+    Opcode.SALTAR_SE_ZERO: lambda arg, novo: novo(arg),
+    Opcode.SALTAR_LOGICO: lambda arg, novo: (novo(arg[0]), arg[1], arg[2]),
+    Opcode.TENTAR: lambda arg, novo: (novo(arg[0]), arg[1]),
+    Opcode.TESTAR_LACO: lambda arg, novo: (novo(arg[0]), arg[1]),
+    Opcode.REPETIR: lambda arg, novo: (novo(arg[0]), arg[1]),
+    Opcode.FOR_ENTRAR: lambda arg, novo: (arg[0], arg[1], novo(arg[2]), arg[3]),
+    Opcode.FOR_PROXIMO: lambda arg, novo: (*arg[:4], novo(arg[4]), arg[5]),
+    Opcode.MEMO_BUSCAR: lambda arg, novo: (arg[0], novo(arg[1])),
+    Opcode.PREPARAR_INVARIANTE: lambda arg, novo: (arg[0], arg[1], novo(arg[2])),
+    Opcode.CARREGAR_INVARIANTE: lambda arg, novo: (arg[0], novo(arg[1])),
+}
+
+
+class ContadoresLinha:
+    """
+    Contadores de uma linha compilada, em uma lista (`valores`) incrementada pelo
+    código executado: três por laço (ENTRADAS, VOLTAS, LIMITES a partir do índice
+    em `lacos`, que tem (tipo, índice) na ordem em que os laços começam na linha) e
+    um por operador (`operadores`: lexema -> índice).
+    No bytecode instrumentado, `origens` dá a posição de cada instrução no bytecode
+    original e `limites` o contador de limites do laço de cada instrução que pode
+    levantar OrcamentoExcedido.
+    """
+    __slots__ = ('lacos', 'operadores', 'valores', 'origens', 'limites')
+
+    def __init__(self):
+        self.lacos = []
+        self.operadores = {}
+        self.valores = []
+        self.origens = None
+        self.limites = {}
+
+    def novoLaco(self, tipo: str) -> int:
+        """Índice do primeiro dos três contadores de um novo laço."""
+        indice = len(self.valores)
+        self.lacos.append((tipo, indice))
+        self.valores.extend((0, 0, 0))
+        return indice
+
+    def operador(self, lexema: str) -> int:
+        indice = self.operadores.get(lexema)
+        if indice is None:
+            indice = self.operadores[lexema] = len(self.valores)
+            self.valores.append(0)
+        return indice
+
+    def limiteAtingido(self, pc: int):
+        # Chamado pela máquina virtual quando OrcamentoExcedido sobe da instrução `pc`
+        indice = self.limites.get(pc)
+        if indice is not None:
+            self.valores[indice] += 1
+
+    def relator(self, relatar):
+        """`relatar` com as posições do bytecode instrumentado trocadas pelas do original."""
+        origens = self.origens
+        def relatar_original(codigo: str, mensagem: str, posicao: int | None = None):
+            relatar(codigo, mensagem, None if posicao is None else origens[posicao])
+        return relatar_original
+
+
+def instrumentarBytecode(codigo: CodigoCompilado) -> CodigoCompilado:
+    """
+    Cópia do bytecode com instruções CONTAR antes de cada operador, na entrada e no
+    início do corpo de cada WHILE/FOR. Os desvios passam a apontar para o CONTAR
+    posto antes do seu destino; o custo cobrado do orçamento não muda.
+    """
+    instrucoes = codigo.instrucoes
+    contadores = ContadoresLinha()
+    antes = {}      # posição no bytecode original -> contadores incrementados antes dela
+    lacos = []      # (início, tipo, posição da entrada, posição do corpo, instruções que levantam limites)
+    for pc, (op, arg) in enumerate(instrucoes):
+        if op == Opcode.TESTAR_LACO:
+            # ZERAR_TEMP das voltas, condição em `inicio`, TESTAR_LACO, corpo e REPETIR
+            repetir = arg[0] - 1
+            inicio = instrucoes[repetir][1][0]
+            lacos.append((inicio, 'WHILE', inicio - 1, pc + 1, (pc, repetir)))
+        elif op == Opcode.FOR_PROXIMO:
+            # FOR_ENTRAR logo antes do corpo, que começa em arg[4]
+            lacos.append((arg[4], 'FOR', arg[4] - 1, arg[4], (pc,)))
+    for _, tipo, entrada, corpo, levantam in sorted(lacos):
+        indice = contadores.novoLaco(tipo)
+        antes.setdefault(entrada, []).append(indice + ENTRADAS)
+        antes.setdefault(corpo, []).append(indice + VOLTAS)
+        for pc in levantam:
+            contadores.limites[pc] = indice + LIMITES
+    for pc, (op, arg) in enumerate(instrucoes):
+        if op in _OPERADORES:
+            antes.setdefault(pc, []).append(contadores.operador(_OPERADORES[op](arg).lexema))
+
+    novas = []
+    origens = []
+    posicoes = []   # posição original -> nova posição (a do primeiro CONTAR antes dela)
+    for pc, instrucao in enumerate(instrucoes):
+        posicoes.append(len(novas))
+        for indice in antes.get(pc, ()):
+            novas.append((Opcode.CONTAR, indice))
+            origens.append(pc)
+        novas.append(instrucao)
+        origens.append(pc)
+    posicoes.append(len(novas))
+    novo = posicoes.__getitem__
+    for pc, (op, arg) in enumerate(novas):
+        if op in _DESVIOS:
+            novas[pc] = (op, _DESVIOS[op](arg, novo))
+    # Instruções que levantam limites, nas novas posições
+    contadores.limites = {posicoes[pc] + len(antes.get(pc, ())): indice
+                          for pc, indice in contadores.limites.items()}
+    contadores.origens = origens
+    return CodigoCompilado(novas, codigo.num_temps, codigo.simbolos, memo=codigo.memo, custo=codigo.custo,
+                           contadores=contadores)
+
+
+class PerfilLinha:
+    """Tempo (s), execuções e operadores executados de uma linha do programa."""
+    __slots__ = ('numero', 'texto', 'tempo', 'execucoes', 'operacoes')
+
+    def __init__(self, numero: int | None, texto: str):
+        self.numero = numero
+        self.texto = texto
+        self.tempo = 0.0
+        self.execucoes = 0
+        self.operacoes = 0
+
+
+class PerfilLaco:
+    """Um WHILE ou FOR: entradas no laço, voltas do corpo e limites do orçamento atingidos."""
+    __slots__ = ('linha', 'ordem', 'tipo', 'entradas', 'voltas', 'limites')
+
+    def __init__(self, linha: int | None, ordem: int, tipo: str):
+        self.linha = linha
+        self.ordem = ordem          # 1 = primeiro laço a começar na linha
+        self.tipo = tipo
+        self.entradas = 0
+        self.voltas = 0
+        self.limites = 0
+
+
+class PerfilExecucao:
+    """
+    Dados das linhas executadas. `operadores` conta as execuções de cada operador
+    por lexema; os laços são identificados por (linha, ordem na linha).
+    """
+    __slots__ = ('linhas', 'lacos', 'operadores')
+
+    def __init__(self):
+        self.linhas = {}
+        self.lacos = {}
+        self.operadores = {}
+
+    def registrar(self, numero: int | None, texto: str, tempo: float, contadores: ContadoresLinha | None):
+        """Acrescenta uma execução da linha: o tempo medido e os contadores do código que rodou."""
+        linha = self.linhas.get(numero)
+        if linha is None:
+            linha = self.linhas[numero] = PerfilLinha(numero, texto)
+        linha.tempo += tempo
+        linha.execucoes += 1
+        if contadores is None:
+            return
+        valores = contadores.valores
+        for ordem, (tipo, indice) in enumerate(contadores.lacos, 1):
+            laco = self.lacos.get((numero, ordem))
+            if laco is None:
+                laco = self.lacos[(numero, ordem)] = PerfilLaco(numero, ordem, tipo)
+            laco.entradas += valores[indice + ENTRADAS]
+            laco.voltas += valores[indice + VOLTAS]
+            laco.limites += valores[indice + LIMITES]
+        for lexema, indice in contadores.operadores.items():
+            self.operadores[lexema] = self.operadores.get(lexema, 0) + valores[indice]
+            linha.operacoes += valores[indice]
+
+    @property
+    def tempo_total(self) -> float:
+        return sum(linha.tempo for linha in self.linhas.values())
+
+    def comoDicionario(self) -> dict:
+        return {
+            'tempo_total': self.tempo_total,
+            'linhas': [{'linha': linha.numero, 'texto': linha.texto, 'tempo': linha.tempo,
+                        'execucoes': linha.execucoes, 'operacoes': linha.operacoes}
+                       for linha in sorted(self.linhas.values(), key=lambda linha: -linha.tempo)],
+            'lacos': [{'linha': laco.linha, 'ordem': laco.ordem, 'tipo': laco.tipo, 'entradas': laco.entradas,
+                       'voltas': laco.voltas, 'limites_atingidos': laco.limites}
+                      for laco in sorted(self.lacos.values(), key=lambda laco: -laco.voltas)],
+            'operadores': dict(sorted(self.operadores.items(), key=lambda item: -item[1])),
+        }
+
+    def salvarJSON(self, caminho: str | Path):
+        caminho = Path(caminho)
+        caminho.parent.mkdir(parents=True, exist_ok=True)
+        with open(caminho, 'w', encoding='utf-8') as arquivo:
+            json.dump(self.comoDicionario(), arquivo, ensure_ascii=False, indent=2)
+
+    def relatorio(self, limite: int | None = 20) -> str:
+        """Linhas mais lentas, laços com mais voltas e operadores mais executados (`limite` de cada)."""
+        dados = self.comoDicionario()
+        total = dados['tempo_total'] or 1.0
+        partes = [f"--- PERFIL DE EXECUÇÃO ({dados['tempo_total'] * 1000:.2f} ms) ---",
+                  "Linha     Tempo (ms)      %   Operações  Expressão"]
+        for linha in dados['linhas'][:limite]:
+            partes.append(f"{linha['linha']:>5}  {linha['tempo'] * 1000:12.3f} {linha['tempo'] / total * 100:6.1f}"
+                          f" {linha['operacoes']:>11}  {linha['texto']}")
+        if dados['lacos']:
+            partes.append("Laços (linha:ordem)       Entradas        Voltas  Limite atingido")
+            for laco in dados['lacos'][:limite]:
+                local = f"{laco['tipo']} {laco['linha']}:{laco['ordem']}"
+                partes.append(f"{local:<22} {laco['entradas']:>11} {laco['voltas']:>13} {laco['limites_atingidos']:>16}")
+        if dados['operadores']:
+            partes.append("Operadores: " + ", ".join(f"{lexema} {contagem}" for lexema, contagem
+                                                    in list(dados['operadores'].items())[:limite]))
+        return "\n".join(partes)
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+
+# Integrantes do grupo (ordem alfabética):
+# Nome Completo 1 - Breno Rossi Duarte
+# Nome Completo 2 - Francisco Bley Ruthes
+# Nome Completo 3 - Rafael Olivare Piveta
+# Nome Completo 4 - Stefan Benjamim Seixas Lourenço Rodrigues
+#
+# Nome do grupo no Canvas: RA2_1
+
+# Pontos de controle de uma execução longa. A cada `intervalo` linhas, exibirResultados
+# grava um instantâneo do estado depois da linha: variáveis, resultados guardados para
+# RES, contadores e operações já gastas do orçamento. Para retomar na linha N, o estado
+# é restaurado do último instantâneo antes de N e só as linhas seguintes são executadas.
+#
+# Cada instantâneo traz um resumo encadeado (blake2b) do texto de todas as linhas até
+# ele: ao retomar, as linhas puladas são resumidas de novo e, se o arquivo mudou antes
+# do ponto de controle, a retomada é recusada (PontoDeControleInvalido). Os instantâneos são acrescentados ao fim
+# do arquivo com pickle (como o estado de incremental.py), um registro por vez, então
+# uma gravação interrompida perde só o último.
+
+import bisect
+import hashlib
+import pickle
+from pathlib import Path
+
+from .memoria import Memoria, HistoricoResultados
+
+# Muda sempre que o formato dos instantâneos ou a semântica da execução mudar
+VERSAO_PONTOS = 1
+
+# Linhas entre dois instantâneos
+INTERVALO_PADRAO = 1000
+
+# Resumo antes da primeira linha
+RESUMO_INICIAL = b''
+
+
+class PontoDeControleInvalido(ValueError):
+    """As linhas até o instantâneo da retomada mudaram desde que ele foi gravado."""
+
+    def __init__(self, linha: int):
+        self.linha = linha
+        super().__init__(f"ERRO -> As linhas até a {linha} mudaram desde o ponto de controle")
+
+
+def encadearResumo(resumo: bytes, linha: str) -> bytes:
+    """Resumo das linhas até `linha`, a partir do resumo das anteriores."""
+    return hashlib.blake2b(resumo + linha.encode('utf-8'), digest_size=16).digest()
+
+
+class Instantaneo:
+    """
+    Estado da execução depois da linha `linha` (numeração de exibirResultados):
+    variáveis, itens do histórico de RES, linhas com erro, linhas processadas e
+    operações gastas do orçamento da execução.
+    """
+    __slots__ = ('linha', 'resumo', 'variaveis', 'historico', 'erros', 'processadas', 'operacoes')
+
+    def __init__(self, linha: int, resumo: bytes, variaveis: dict, historico: list, erros: int,
+                 processadas: int, operacoes: int):
+        self.linha = linha
+        self.resumo = resumo
+        self.variaveis = variaveis
+        self.historico = historico
+        self.erros = erros
+        self.processadas = processadas
+        self.operacoes = operacoes
+
+    def __reduce__(self):
+        return (Instantaneo, (self.linha, self.resumo, self.variaveis, self.historico, self.erros,
+                              self.processadas, self.operacoes))
+
+    @classmethod
+    def capturar(cls, linha: int, resumo: bytes, memoria: Memoria, erros: int, processadas: int,
+                 operacoes: int) -> 'Instantaneo':
+        return cls(linha, resumo, memoria.como_dicionario(), list(memoria.historico), erros, processadas,
+                   operacoes)
+
+    def restaurar(self, memoria: Memoria):
+        """Copia as variáveis e o histórico para `memoria` (recém-criada)."""
+        for nome, valor in self.variaveis.items():
+            memoria[nome] = valor
+        memoria.historico = HistoricoResultados(memoria.historico.profundidade, self.historico)
+
+
+class PontosDeControle:
+    """
+    Instantâneos de uma execução, gravados em `caminho` a cada `intervalo` linhas.
+    Os já gravados são lidos na criação; são descartados se a `assinatura`
+    (configuração que muda os resultados) for outra.
+    """
+    __slots__ = ('caminho', 'intervalo', 'assinatura', 'instantaneos', '_arquivo')
+
+    def __init__(self, caminho: str | Path, intervalo: int = INTERVALO_PADRAO, assinatura: tuple = ()):
+        if intervalo < 1:
+            raise ValueError("ERRO -> O intervalo entre pontos de controle deve ser pelo menos 1 linha")
+        self.caminho = Path(caminho)
+        self.intervalo = intervalo
+        self.assinatura = (VERSAO_PONTOS, *assinatura)
+        self.instantaneos = self._ler()
+        self._arquivo = None
+
+    def _ler(self) -> list[Instantaneo]:
+        instantaneos = []
+        try:
+            with open(self.caminho, 'rb') as arquivo:
+                if pickle.load(arquivo) != self.assinatura:
+                    return []
+                while True:
+                    instantaneos.append(pickle.load(arquivo))
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError, AttributeError):
+            # Fim do arquivo (ou último registro cortado por uma interrupção)
+            pass
+        return instantaneos
+
+    def anterior(self, linha: int) -> Instantaneo | None:
+        """Último instantâneo gravado antes da linha `linha`, ou None."""
+        posicao = bisect.bisect_left([instantaneo.linha for instantaneo in self.instantaneos], linha)
+        return self.instantaneos[posicao - 1] if posicao else None
+
+    def abrir(self, inicio: int = 0):
+        """
+        Começa a gravar uma execução que parte do fim da linha `inicio`: os
+        instantâneos depois dela são descartados.
+        """
+        self.instantaneos = [instantaneo for instantaneo in self.instantaneos if instantaneo.linha <= inicio]
+        self.caminho.parent.mkdir(parents=True, exist_ok=True)
+        self._arquivo = open(self.caminho, 'wb')
+        pickle.dump(self.assinatura, self._arquivo, protocol=pickle.HIGHEST_PROTOCOL)
+        for instantaneo in self.instantaneos:
+            pickle.dump(instantaneo, self._arquivo, protocol=pickle.HIGHEST_PROTOCOL)
+        self._arquivo.flush()
+
+    def gravar(self, instantaneo: Instantaneo):
+        self.instantaneos.append(instantaneo)
+        pickle.dump(instantaneo, self._arquivo, protocol=pickle.HIGHEST_PROTOCOL)
+        self._arquivo.flush()
+
+    def fechar(self):
+        if self._arquivo is not None:
+            self._arquivo.close()
+            self._arquivo = None
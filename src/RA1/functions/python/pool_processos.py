@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+
+# Integrantes do grupo (ordem alfabética):
+# Nome Completo 1 - Breno Rossi Duarte
+# Nome Completo 2 - Francisco Bley Ruthes
+# Nome Completo 3 - Rafael Olivare Piveta
+# Nome Completo 4 - Stefan Benjamim Seixas Lourenço Rodrigues
+#
+# Nome do grupo no Canvas: RA2_1
+
+# Pool de processos com um executor por processo, usado pela execução paralela das
+# linhas (execucao_paralela.py) e pelas varreduras de parâmetros (varredura.py). O
+# executor é criado uma vez em cada processo, na inicialização, a partir da classe e
+# dos argumentos dados ao pool: o que é caro de enviar (opções, programa compilado)
+# atravessa a fronteira entre processos uma vez só, e as tarefas vão em blocos
+# contíguos, cada um executado por executor.executar(bloco).
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable, Iterator
+
+# Blocos de tarefas enviados por processo (equilibra tarefas de custo diferente)
+TAREFAS_POR_PROCESSO = 4
+
+
+def dividir(itens: list, partes: int) -> list[list]:
+    """Até `partes` fatias contíguas de `itens`, de tamanhos parecidos."""
+    tamanho = max(1, -(-len(itens) // max(1, partes)))
+    return [itens[inicio:inicio + tamanho] for inicio in range(0, len(itens), tamanho)]
+
+
+# Executor do processo atual (só nos processos do pool)
+_executor = None
+
+def _iniciarProcesso(classe: type, argumentos: tuple):
+    global _executor
+    _executor = classe(*argumentos)
+
+def _executarBloco(tarefas: list) -> list:
+    return _executor.executar(tarefas)
+
+
+class PoolDeExecutores:
+    """
+    Pool de `processos` processos em que cada processo cria `classe(*argumentos)` ao
+    iniciar. Usado como gerenciador de contexto (with), como ProcessPoolExecutor.
+    """
+    __slots__ = ('pool',)
+
+    def __init__(self, processos: int, classe: type, argumentos: tuple = ()):
+        self.pool = ProcessPoolExecutor(max_workers=processos, initializer=_iniciarProcesso,
+                                        initargs=(classe, argumentos))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.pool.shutdown()
+
+    def executar(self, blocos: Iterable[list]) -> Iterator[list]:
+        """Resultado de executor.executar para cada bloco, na ordem dos blocos."""
+        return self.pool.map(_executarBloco, blocos)
+
+    def mapear(self, funcao: Callable, blocos: Iterable) -> Iterator:
+        """funcao(bloco) para cada bloco, nos processos do pool e na ordem dos blocos."""
+        return self.pool.map(funcao, blocos)
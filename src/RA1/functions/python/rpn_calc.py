@@ -8,14 +8,27 @@
 #
 # Nome do grupo no Canvas: RA2_1
 
-import math
-from .tokens import Token, Tipo_de_Token
-from .analisador_lexico import Analisador_Lexico
+import time
 
-def parseExpressao(linha_operacao: str):
-    analisador_lexico = Analisador_Lexico(linha_operacao)
-    tokens = analisador_lexico.analise()
-    return tokens
+from .tokens import Token, Tipo_de_Token, pares_de
+from .operadores import OPERADORES_POR_TIPO, ARITMETICO
+from .analisador_lexico import Analisador_Lexico, analisar_linha
+from .orcamento import Orcamento, OrcamentoExcedido, MAX_ITERACOES
+from .diagnosticos import (Diagnosticos, relator, OPERANDOS_INSUFICIENTES, OPERACAO_INVALIDA,
+                           HISTORICO_FORA, HISTORICO_VAZIO, ESTRUTURA_INCOMPLETA, ERRO_ESTRUTURA)
+
+def parseExpressao(linha_operacao: str, modo: str = "tabela"):
+    # modo "tabela": varredura única (padrão); modo "estados": analisador caractere a caractere
+    if modo == "estados":
+        analisador_lexico = Analisador_Lexico(linha_operacao)
+        return analisador_lexico.analise()
+    return analisar_linha(linha_operacao)
+
+# Tokens descartados antes da avaliação RPN
+IGNORADOS_NA_EXECUCAO = Tipo_de_Token.PARENTESES | {Tipo_de_Token.FIM}
+
+# Tabela vazia para listas que já foram limpas de parênteses (nunca é consultada)
+SEM_PARENTESES = []
 
 def arredondar_16bit(valor):
     """Simula a precisão de ponto flutuante de 16 bits (duas casas decimais)."""
@@ -24,163 +37,249 @@ def arredondar_16bit(valor):
     except (ValueError, TypeError):
         return valor
 
-def encontrar_blocos_controle(tokens: list[Token], inicio: int, num_blocos: int) -> tuple[list, int]:
+def encontrar_blocos_controle(tokens: list[Token], inicio: int, num_blocos: int,
+                              fim: int | None = None, pares: list[int] | None = None) -> tuple[list, int]:
     """
     Encontra blocos delimitados por parênteses para estruturas de controle.
+    Devolve os intervalos (início, fim) do conteúdo de cada bloco, sem os parênteses,
+    consultando a tabela de pares em vez de recontar a profundidade.
     """
+    if fim is None:
+        fim = len(tokens)
+    if pares is None:
+        pares = pares_de(tokens)
     blocos = []
     idx = inicio
     
-    while idx < len(tokens) and len(blocos) < num_blocos:
+    while idx < fim and len(blocos) < num_blocos:
         # Procura o próximo parêntese de abertura
-        while idx < len(tokens) and tokens[idx].tipo != Tipo_de_Token.ABRE_PARENTESES:
+        while idx < fim and tokens[idx].tipo != Tipo_de_Token.ABRE_PARENTESES:
             idx += 1
         
-        if idx >= len(tokens):
+        if idx >= fim:
             break
             
-        # Encontrou um parêntese de abertura
-        bloco = []
-        contagem = 1
-        idx += 1  # Pula o parêntese de abertura
-        
-        # Coleta tokens até encontrar o parêntese de fechamento correspondente
-        while idx < len(tokens) and contagem > 0:
-            token_atual = tokens[idx]
-            
-            if token_atual.tipo == Tipo_de_Token.ABRE_PARENTESES:
-                bloco.append(token_atual)
-                contagem += 1
-            elif token_atual.tipo == Tipo_de_Token.FECHA_PARENTESES:
-                contagem -= 1
-                if contagem > 0:
-                    bloco.append(token_atual)
-            else:
-                bloco.append(token_atual)
-                
-            idx += 1
+        # Parêntese sem fechamento no intervalo: não forma bloco
+        fecha = pares[idx]
+        if fecha < 0 or fecha >= fim:
+            idx = fim
+            break
         
-        if contagem == 0:
-            blocos.append(bloco)
+        blocos.append((idx + 1, fecha))
+        idx = fecha + 1
             
     return blocos, idx
 
-def processarEstruturaControle(tokens: list[Token], memoria: dict) -> float:
+class _ConsumoLinha:
+    # Operações gastas por uma linha em execução e a próxima verificação do orçamento,
+    # passadas no lugar do Orcamento às funções chamadas dentro da linha
+    __slots__ = ('orcamento', 'gasto', 'proxima', 'inicio', 'limite_iteracoes')
+
+    def __init__(self, orcamento: Orcamento, gasto: int):
+        self.orcamento = orcamento
+        self.gasto = gasto
+        self.inicio = time.perf_counter()
+        self.limite_iteracoes = orcamento.limite_iteracoes
+        self.proxima = orcamento.verificar(gasto, self.inicio)
+
+    def consumir(self, custo: int):
+        self.gasto += custo
+        if self.gasto >= self.proxima:
+            self.proxima = self.orcamento.verificar(self.gasto, self.inicio)
+
+def _executar_linha(funcao, orcamento: Orcamento, custo: int, *argumentos) -> float:
+    # Chamada com um Orcamento: a função executa uma linha inteira, que começa custando
+    # `custo` operações e soma o que gastar ao consumo da execução, mesmo se for interrompida
+    consumo = _ConsumoLinha(orcamento, custo)
+    try:
+        return funcao(*argumentos, consumo)
+    finally:
+        orcamento.registrar(consumo.gasto)
+
+def _limite_iteracoes(orcamento) -> float:
+    return MAX_ITERACOES if orcamento is None else orcamento.limite_iteracoes
+
+def processarEstruturaControle(tokens: list[Token], memoria: dict, inicio: int = 0,
+                               fim: int | None = None, pares: list[int] | None = None,
+                               diagnosticos: Diagnosticos | None = None, curto_circuito: bool = False,
+                               orcamento: Orcamento | None = None) -> float:
     """
     Processa estruturas de controle (IFELSE, WHILE, FOR)
+    Em todas as funções de avaliação, os problemas que fazem uma operação valer 0.0 vão
+    para `diagnosticos` (diagnosticos.Diagnosticos), com a posição do token; sem ele,
+    as mensagens são impressas.
+    Com `curto_circuito`, o operando direito de && e || escrito entre parênteses só é
+    avaliado quando o esquerdo não decide o resultado (ver processarTokens).
+    Com `orcamento` (orcamento.Orcamento), os limites de iterações, operações e tempo
+    são os dele e as operações gastas entram no consumo da execução; sem ele, só vale
+    o limite de MAX_ITERACOES voltas por laço. No interpretador, operações são tokens:
+    o trecho executado custa o seu número de tokens e cada volta de um laço, o da
+    condição e do corpo (WHILE) ou do corpo (FOR). Passar de um limite levanta
+    OrcamentoExcedido.
     """
+    if fim is None:
+        fim = len(tokens)
+    if orcamento.__class__ is Orcamento:
+        return _executar_linha(processarEstruturaControle, orcamento, fim - inicio, tokens, memoria, inicio, fim,
+                               pares, diagnosticos, curto_circuito)
     # Encontra a estrutura de controle
-    for i, token in enumerate(tokens):
-        if token.tipo == Tipo_de_Token.IFELSE:
-            return processarIFELSE(tokens, i, memoria)
-        elif token.tipo == Tipo_de_Token.WHILE:
-            return processarWHILE(tokens, i, memoria)
-        elif token.tipo == Tipo_de_Token.FOR:
-            return processarFOR(tokens, i, memoria)
+    for i in range(inicio, fim):
+        tipo = tokens[i].tipo
+        if tipo == Tipo_de_Token.IFELSE:
+            return processarIFELSE(tokens, i, memoria, fim, pares, diagnosticos, curto_circuito, orcamento)
+        elif tipo == Tipo_de_Token.WHILE:
+            return processarWHILE(tokens, i, memoria, fim, pares, diagnosticos, curto_circuito, orcamento)
+        elif tipo == Tipo_de_Token.FOR:
+            return processarFOR(tokens, i, memoria, fim, pares, diagnosticos, curto_circuito, orcamento)
     
     return 0.0
 
-def processarIFELSE(tokens: list[Token], inicio: int, memoria: dict) -> float:
+def processarIFELSE(tokens: list[Token], inicio: int, memoria: dict,
+                    fim: int | None = None, pares: list[int] | None = None,
+                    diagnosticos: Diagnosticos | None = None, curto_circuito: bool = False,
+                    orcamento: Orcamento | None = None) -> float:
     """
     Processa estrutura IFELSE: (IFELSE (condição)(verdadeiro)(falso))
     """
+    if orcamento.__class__ is Orcamento:
+        return _executar_linha(processarIFELSE, orcamento, (len(tokens) if fim is None else fim) - inicio,
+                               tokens, inicio, memoria, fim, pares, diagnosticos, curto_circuito)
     try:
+        if pares is None:
+            pares = pares_de(tokens)
         # Encontra os 3 blocos necessários
-        blocos, _ = encontrar_blocos_controle(tokens, inicio + 1, 3)
+        blocos, _ = encontrar_blocos_controle(tokens, inicio + 1, 3, fim, pares)
         
         if len(blocos) != 3:
-            print("ERRO -> IFELSE requer 3 blocos: (condição)(verdadeiro)(falso)")
+            relator(diagnosticos)(ESTRUTURA_INCOMPLETA, "ERRO -> IFELSE requer 3 blocos: (condição)(verdadeiro)(falso)", inicio)
             return 0.0
             
         # Processa os blocos diretamente com processarTokens
-        condicao = processarTokens(blocos[0], memoria)
+        condicao = processarTokens(tokens, memoria, *blocos[0], pares, diagnosticos, curto_circuito, orcamento)
 
         
         # Executa o bloco apropriado (verdadeiro se != 0)
         if float(condicao) != 0.0:
-            resultado = processarTokens(blocos[1], memoria)
+            resultado = processarTokens(tokens, memoria, *blocos[1], pares, diagnosticos, curto_circuito, orcamento)
 
             return resultado
         else:
-            resultado = processarTokens(blocos[2], memoria)
+            resultado = processarTokens(tokens, memoria, *blocos[2], pares, diagnosticos, curto_circuito, orcamento)
 
             return resultado
             
+    except OrcamentoExcedido:
+        raise
     except Exception as e:
-        print(f"ERRO no IFELSE: {e}")
+        relator(diagnosticos)(ERRO_ESTRUTURA, f"ERRO no IFELSE: {e}", inicio)
         return 0.0
 
-def processarWHILE(tokens: list[Token], inicio: int, memoria: dict) -> float:
+def processarWHILE(tokens: list[Token], inicio: int, memoria: dict,
+                   fim: int | None = None, pares: list[int] | None = None,
+                   diagnosticos: Diagnosticos | None = None, curto_circuito: bool = False,
+                   orcamento: Orcamento | None = None) -> float:
     """
     Processa estrutura WHILE: (WHILE (condição)(corpo))
     Exemplo: (WHILE (X 5 <)((X X 1 +)(Y X 2 *)))
+    Passar do limite de voltas (MAX_ITERACOES ou o de `orcamento`) interrompe a linha
+    com OrcamentoExcedido.
     """
+    if orcamento.__class__ is Orcamento:
+        return _executar_linha(processarWHILE, orcamento, (len(tokens) if fim is None else fim) - inicio,
+                               tokens, inicio, memoria, fim, pares, diagnosticos, curto_circuito)
     try:
+        if pares is None:
+            pares = pares_de(tokens)
         # Encontra os 2 blocos necessários
-        blocos, _ = encontrar_blocos_controle(tokens, inicio + 1, 2)
+        blocos, _ = encontrar_blocos_controle(tokens, inicio + 1, 2, fim, pares)
         
         if len(blocos) != 2:
-            print("ERRO -> WHILE requer 2 blocos: (condição)(corpo)")
+            relator(diagnosticos)(ESTRUTURA_INCOMPLETA, "ERRO -> WHILE requer 2 blocos: (condição)(corpo)", inicio)
             return 0.0
             
         resultado = 0.0
         iteracoes = 0
-        max_iteracoes = 1000  # Limite de segurança
+        limite = _limite_iteracoes(orcamento)
+        # Cada volta custa os tokens da condição e do corpo
+        custo = blocos[0][1] - blocos[0][0] + blocos[1][1] - blocos[1][0]
         
-        while iteracoes < max_iteracoes:
+        while True:
             # Avalia a condição
-            condicao = processarTokens(blocos[0], memoria)
+            condicao = processarTokens(tokens, memoria, *blocos[0], pares, diagnosticos, curto_circuito, orcamento)
             
             # Se a condição é falsa, sai do loop
             if float(condicao) == 0.0:
                 break
+            if iteracoes >= limite:
+                raise OrcamentoExcedido.iteracoes(limite)
                 
             # Executa o corpo do loop
             # O corpo pode conter múltiplas expressões separadas por parênteses
-            resultado = executarCorpoLoop(blocos[1], memoria)
+            resultado = executarCorpoLoop(tokens, memoria, *blocos[1], pares, diagnosticos, curto_circuito, orcamento)
             iteracoes += 1
+            if orcamento is not None:
+                orcamento.consumir(custo)
             
         return resultado
         
+    except OrcamentoExcedido:
+        raise
     except Exception as e:
-        print(f"ERRO no WHILE: {e}")
+        relator(diagnosticos)(ERRO_ESTRUTURA, f"ERRO no WHILE: {e}", inicio)
         return 0.0
 
-def processarFOR(tokens: list[Token], inicio: int, memoria: dict) -> float:
+def processarFOR(tokens: list[Token], inicio: int, memoria: dict,
+                 fim: int | None = None, pares: list[int] | None = None,
+                 diagnosticos: Diagnosticos | None = None, curto_circuito: bool = False,
+                 orcamento: Orcamento | None = None) -> float:
     """
     Processa estrutura FOR: (FOR (inicial)(final)(incremento)(corpo))
     Exemplo: (FOR (1)(10)(2)((P P 1 +)(Q P 2 *)))
+    Passar do limite de voltas (MAX_ITERACOES ou o de `orcamento`) interrompe a linha
+    com OrcamentoExcedido.
     """
+    if orcamento.__class__ is Orcamento:
+        return _executar_linha(processarFOR, orcamento, (len(tokens) if fim is None else fim) - inicio,
+                               tokens, inicio, memoria, fim, pares, diagnosticos, curto_circuito)
     try:
+        if pares is None:
+            pares = pares_de(tokens)
         # Encontra os 4 blocos necessários
-        blocos, _ = encontrar_blocos_controle(tokens, inicio + 1, 4)
+        blocos, _ = encontrar_blocos_controle(tokens, inicio + 1, 4, fim, pares)
         
         if len(blocos) != 4:
-            print("ERRO -> FOR requer 4 blocos: (inicial)(final)(incremento)(corpo)")
+            relator(diagnosticos)(ESTRUTURA_INCOMPLETA, "ERRO -> FOR requer 4 blocos: (inicial)(final)(incremento)(corpo)", inicio)
             return 0.0
             
         # Avalia os parâmetros do FOR
-        inicial = int(processarTokens(blocos[0], memoria))
-        final = int(processarTokens(blocos[1], memoria))
-        incremento = int(processarTokens(blocos[2], memoria)) or 1
+        inicial = int(processarTokens(tokens, memoria, *blocos[0], pares, diagnosticos, curto_circuito, orcamento))
+        final = int(processarTokens(tokens, memoria, *blocos[1], pares, diagnosticos, curto_circuito, orcamento))
+        incremento = int(processarTokens(tokens, memoria, *blocos[2], pares, diagnosticos, curto_circuito,
+                                         orcamento)) or 1
         
         resultado = 0.0
         contador = inicial
         iteracoes = 0
-        max_iteracoes = 1000  # Limite de segurança
+        limite = _limite_iteracoes(orcamento)
+        # Cada volta custa os tokens do corpo
+        custo = blocos[3][1] - blocos[3][0]
         
         # Cria uma variável de controle implícita para o loop
         memoria['_FOR_COUNTER'] = float(contador)
         
-        while contador < final and iteracoes < max_iteracoes:
+        while contador < final:
+            if iteracoes >= limite:
+                raise OrcamentoExcedido.iteracoes(limite)
             # Atualiza a variável de controle
             memoria['_FOR_COUNTER'] = float(contador)
             
             # Executa o corpo do loop
-            resultado = executarCorpoLoop(blocos[3], memoria)
+            resultado = executarCorpoLoop(tokens, memoria, *blocos[3], pares, diagnosticos, curto_circuito, orcamento)
             
             contador += incremento
             iteracoes += 1
+            if orcamento is not None:
+                orcamento.consumir(custo)
             
             # Debug para acompanhar execução
             # print(f"FOR iteração {iteracoes}: contador={contador-incremento}, resultado={resultado}")
@@ -191,81 +290,87 @@ def processarFOR(tokens: list[Token], inicio: int, memoria: dict) -> float:
             
         return resultado
         
+    except OrcamentoExcedido:
+        raise
     except Exception as e:
-        print(f"ERRO no FOR: {e}")
+        relator(diagnosticos)(ERRO_ESTRUTURA, f"ERRO no FOR: {e}", inicio)
         return 0.0
 
-def executarCorpoLoop(tokens_corpo: list[Token], memoria: dict) -> float:
+def executarCorpoLoop(tokens: list[Token], memoria: dict, inicio: int = 0,
+                      fim: int | None = None, pares: list[int] | None = None,
+                      diagnosticos: Diagnosticos | None = None, curto_circuito: bool = False,
+                      orcamento: Orcamento | None = None) -> float:
     """
     Executa o corpo de um loop, que pode conter múltiplas expressões.
     Exemplo: ((X X 1 +)(Y X 2 *)) -> executa duas expressões sequenciais
+    O corpo é o intervalo [inicio, fim) de tokens.
     """
-    if not tokens_corpo:
+    if fim is None:
+        fim = len(tokens)
+    if inicio >= fim:
         return 0.0
+    if orcamento.__class__ is Orcamento:
+        return _executar_linha(executarCorpoLoop, orcamento, fim - inicio, tokens, memoria, inicio, fim, pares,
+                               diagnosticos, curto_circuito)
+    if pares is None:
+        pares = pares_de(tokens)
     
-    # Separa as expressões individuais
+    # Separa as expressões individuais: guarda o intervalo de cada uma com seus parênteses
     expressoes = []
-    i = 0
+    i = inicio
     
-    while i < len(tokens_corpo):
-        if tokens_corpo[i].tipo == Tipo_de_Token.ABRE_PARENTESES:
-            # Encontra uma expressão delimitada por parênteses
-            contagem = 1
-            j = i + 1
-            expressao = []
+    while i < fim:
+        if tokens[i].tipo == Tipo_de_Token.ABRE_PARENTESES:
+            fecha = pares[i]
+            if fecha < 0 or fecha >= fim:
+                fecha = fim
             
-            while j < len(tokens_corpo) and contagem > 0:
-                token_atual = tokens_corpo[j]
-                
-                if token_atual.tipo == Tipo_de_Token.ABRE_PARENTESES:
-                    contagem += 1
-                elif token_atual.tipo == Tipo_de_Token.FECHA_PARENTESES:
-                    contagem -= 1
-                    
-                if contagem > 0:
-                    expressao.append(token_atual)
-                    
-                j += 1
-            
-            if expressao:
-                expressoes.append(expressao)
+            if fecha > i + 1:
+                expressoes.append((i, fecha))
             
-            i = j
+            i = fecha + 1
         else:
             i += 1
     
     # Executa todas as expressões sequencialmente
     resultado = 0.0
     
-    for expressao in expressoes:
+    for abre, fecha in expressoes:
         # Verifica se é uma atribuição de variável e inicializa se necessário (nova sintaxe: VALOR VARIAVEL)
-        if len(expressao) >= 1 and expressao[-1].tipo == Tipo_de_Token.VARIAVEL:
-            var_nome = expressao[-1].valor
+        ultimo = tokens[fecha - 1]
+        if ultimo.tipo == Tipo_de_Token.VARIAVEL:
+            var_nome = ultimo.valor
             if var_nome not in memoria:
                 memoria[var_nome] = 0.0
         
-        # Adiciona parênteses de volta para processamento correto
-        expressao_completa = [Token(Tipo_de_Token.ABRE_PARENTESES, '(')] + expressao + [Token(Tipo_de_Token.FECHA_PARENTESES, ')')]
-        resultado = executarExpressao(expressao_completa, memoria)
+        # O intervalo inclui os parênteses da expressão
+        resultado = executarExpressao(tokens, memoria, abre, min(fecha + 1, fim), pares, diagnosticos, curto_circuito,
+                                      orcamento)
     
     # Se não encontrou expressões delimitadas, processa todos os tokens como uma única expressão
     if not expressoes:
-        resultado = processarTokens(tokens_corpo, memoria)
+        resultado = processarTokens(tokens, memoria, inicio, fim, pares, diagnosticos, curto_circuito, orcamento)
     
     return resultado
 
-def executarExpressao(tokens: list[Token], memoria: dict) -> float:
+def executarExpressao(tokens: list[Token], memoria: dict, inicio: int = 0,
+                      fim: int | None = None, pares: list[int] | None = None,
+                      diagnosticos: Diagnosticos | None = None, curto_circuito: bool = False,
+                      orcamento: Orcamento | None = None) -> float:
     """
     Executa uma expressão RPN de forma recursiva, lidando corretamente com expressões aninhadas.
+    Com `orcamento`, a linha é executada com os limites dele (ver processarEstruturaControle).
     """
-    if not tokens:
+    if fim is None:
+        fim = len(tokens)
+    if inicio >= fim:
         return 0.0
+    if orcamento.__class__ is Orcamento:
+        return _executar_linha(executarExpressao, orcamento, fim - inicio, tokens, memoria, inicio, fim, pares,
+                               diagnosticos, curto_circuito)
     
     # Remove tokens de parênteses e FIM para simplificar o processamento
-    tokens_limpos = []
-    for token in tokens:
-        if token.tipo not in [Tipo_de_Token.ABRE_PARENTESES, Tipo_de_Token.FECHA_PARENTESES, Tipo_de_Token.FIM]:
-            tokens_limpos.append(token)
+    tokens_limpos = [tokens[i] for i in range(inicio, fim) if tokens[i].tipo not in IGNORADOS_NA_EXECUCAO]
     
     if not tokens_limpos:
         return 0.0
@@ -283,36 +388,42 @@ def executarExpressao(tokens: list[Token], memoria: dict) -> float:
     
     # Verifica se contém estruturas de controle primeiro
     for token in tokens_limpos:
-        if token.tipo in [Tipo_de_Token.IFELSE, Tipo_de_Token.WHILE, Tipo_de_Token.FOR]:
-            return processarEstruturaControle(tokens, memoria)
+        if token.tipo in Tipo_de_Token.CONTROLE:
+            return processarEstruturaControle(tokens, memoria, inicio, fim, pares, diagnosticos, curto_circuito,
+                                              orcamento)
     
     # Verifica se é uma atribuição com expressão aninhada (EXPRESSAO VARIAVEL)
+    # tokens_limpos não tem parênteses, então não precisa de tabela de pares
     if (len(tokens_limpos) >= 2 and 
         tokens_limpos[-1].tipo == Tipo_de_Token.VARIAVEL):
         
         var_nome = tokens_limpos[-1].valor
         # Processa a expressão (todos os tokens exceto o último que é a variável)
-        resultado = processarTokens(tokens_limpos[:-1], memoria)
+        resultado = processarTokens(tokens_limpos, memoria, 0, len(tokens_limpos) - 1, SEM_PARENTESES,
+                                    diagnosticos, curto_circuito, orcamento)
         memoria[var_nome] = resultado
                 
         return resultado
     
     # Caso contrário, processa normalmente
-    resultado = processarTokens(tokens_limpos, memoria)
+    resultado = processarTokens(tokens_limpos, memoria, 0, len(tokens_limpos), SEM_PARENTESES, diagnosticos,
+                                curto_circuito, orcamento)
     
     # Não adiciona ao histórico aqui, pois já foi adicionado nas atribuições
     return resultado
 
-def processarTokens(tokens: list[Token], memoria: dict) -> float:
-    """
-    Processa uma lista de tokens em notação RPN.
-    """
-    if not tokens:
+# Marca de trecho que precisa da pilha RPN (não é um dos casos diretos de _valor_direto)
+_AVALIAR_RPN = object()
+
+def _valor_direto(tokens: list[Token], memoria: dict, inicio: int, fim: int, relatar):
+    # Casos de processarTokens resolvidos sem pilha: trecho vazio, um token e "N RES"
+    tamanho = fim - inicio
+    if tamanho <= 0:
         return 0.0
     
     # Se há apenas um token
-    if len(tokens) == 1:
-        token = tokens[0]
+    if tamanho == 1:
+        token = tokens[inicio]
         if token.tipo == Tipo_de_Token.NUMERO_REAL:
             return float(token.valor)
         elif token.tipo == Tipo_de_Token.VARIAVEL:
@@ -323,59 +434,156 @@ def processarTokens(tokens: list[Token], memoria: dict) -> float:
         return 0.0
     
     # Caso especial: índice + RES (ex: 3 RES)
-    if (len(tokens) == 2 and 
-        tokens[0].tipo == Tipo_de_Token.NUMERO_REAL and 
-        tokens[1].tipo == Tipo_de_Token.RES):
+    if (tamanho == 2 and 
+        tokens[inicio].tipo == Tipo_de_Token.NUMERO_REAL and 
+        tokens[inicio + 1].tipo == Tipo_de_Token.RES):
         
-        idx = int(float(tokens[0].valor))
+        idx = int(float(tokens[inicio].valor))
         hist = memoria.get('historico_resultados', [])
         if hist and 0 < idx <= len(hist):
             resultado = hist[-idx]
 
             return resultado
         else:
-            print(f"ERRO -> Índice {idx} fora do intervalo do histórico (tamanho: {len(hist)})")
+            relatar(HISTORICO_FORA, f"ERRO -> Índice {idx} fora do intervalo do histórico (tamanho: {len(hist)})",
+                    inicio + 1)
             return 0.0
-    
-    # Processa expressões aninhadas primeiro
-    tokens_expandidos = []
-    i = 0
-    while i < len(tokens):
-        token = tokens[i]
-        
-        if token.tipo == Tipo_de_Token.ABRE_PARENTESES:
-            # Encontra o bloco correspondente
-            contagem = 1
-            j = i + 1
-            sub_tokens = []
-            
-            while j < len(tokens) and contagem > 0:
-                if tokens[j].tipo == Tipo_de_Token.ABRE_PARENTESES:
-                    contagem += 1
-                elif tokens[j].tipo == Tipo_de_Token.FECHA_PARENTESES:
-                    contagem -= 1
-                
-                if contagem > 0:
-                    sub_tokens.append(tokens[j])
-                j += 1
-            
+    return _AVALIAR_RPN
+
+# Operadores que podem dispensar o operando direito (curto-circuito)
+LOGICOS = frozenset((Tipo_de_Token.AND, Tipo_de_Token.OR))
+
+# Valor de subexpressão ainda não avaliada, à espera do operando esquerdo
+_ADIADO = object()
+
+def _decidir_logico(pilha: list, tipo: int):
+    # Resultado de "a (b) &&" ou "a (b) ||" quando o topo `a` já o decide (None se não decide)
+    if not pilha:
+        return None
+    try:
+        a = float(pilha[-1])
+    except (ValueError, TypeError):
+        return None
+    if tipo == Tipo_de_Token.AND and a == 0.0:
+        return 0.0
+    if tipo == Tipo_de_Token.OR and a != 0.0:
+        return 1.0
+    return None
+
+def processarTokens(tokens: list[Token], memoria: dict, inicio: int = 0,
+                    fim: int | None = None, pares: list[int] | None = None,
+                    diagnosticos: Diagnosticos | None = None, curto_circuito: bool = False,
+                    orcamento: Orcamento | None = None) -> float:
+    """
+    Processa em notação RPN os tokens do intervalo [inicio, fim).
+    As subexpressões entre parênteses são avaliadas antes da pilha RPN do trecho que
+    as contém, em uma pilha explícita de trechos: qualquer profundidade de parênteses
+    é avaliada em tempo linear, sem recursão e sem copiar tokens.
+    Com `curto_circuito`, a subexpressão entre parênteses logo antes de um && ou ||
+    só é avaliada quando a pilha RPN chega ao operador e o operando esquerdo não
+    decide o resultado (0 em &&, diferente de 0 em ||); as mensagens de erro dela
+    saem nesse ponto, e não saem se ela for pulada.
+    Estruturas de controle não são executadas aqui: com um `orcamento`, o trecho só
+    conta os seus tokens como operações e confere os limites de operações e tempo.
+    """
+    if fim is None:
+        fim = len(tokens)
+    if orcamento.__class__ is Orcamento:
+        return _executar_linha(processarTokens, orcamento, fim - inicio, tokens, memoria, inicio, fim, pares,
+                               diagnosticos, curto_circuito)
+    relatar = relator(diagnosticos)
+    resultado = _valor_direto(tokens, memoria, inicio, fim, relatar)
+    if resultado is not _AVALIAR_RPN:
+        return resultado
+
+    # Trechos em avaliação: [início, fim, próximo token a examinar, valores das
+    # subexpressões, estado da pilha RPN interrompida em um operando adiado ou None]
+    trechos = [[inicio, fim, inicio, [], None]]
+    while True:
+        trecho = trechos[-1]
+        fim_trecho = trecho[1]
+        i = trecho[2]
+        while i < fim_trecho and tokens[i].tipo != Tipo_de_Token.ABRE_PARENTESES:
+            i += 1
+        if i < fim_trecho:
+            # Encontra o bloco correspondente pela tabela de pares
+            if pares is None or pares is SEM_PARENTESES:
+                pares = pares_de(tokens)
+            fecha = pares[i]
+            if fecha < 0 or fecha >= fim_trecho:
+                fecha = fim_trecho
+            trecho[2] = fecha + 1
             # Processa a subexpressão
-            if sub_tokens:
-                resultado = processarTokens(sub_tokens, memoria)
-                # Cria um token com o resultado
-                token_resultado = Token(Tipo_de_Token.NUMERO_REAL, resultado)
-                tokens_expandidos.append(token_resultado)
-            
-            i = j
+            if fecha > i + 1:
+                if curto_circuito and fecha + 1 < fim_trecho and tokens[fecha + 1].tipo in LOGICOS:
+                    trecho[3].append(_ADIADO)
+                    continue
+                resultado = _valor_direto(tokens, memoria, i + 1, fecha, relatar)
+                if resultado is _AVALIAR_RPN:
+                    trechos.append([i + 1, fecha, i + 1, [], None])
+                else:
+                    trecho[3].append(resultado)
+            continue
+
+        # Subexpressões avaliadas: pilha RPN do trecho
+        resultado = _pilha_rpn(tokens, memoria, trecho, pares, relatar)
+        if resultado is _ADIADO:
+            # Avalia o operando adiado e retoma a pilha do trecho
+            pilha, abre, proxima = trecho[4]
+            fecha = pares[abre]
+            resultado = _valor_direto(tokens, memoria, abre + 1, fecha, relatar)
+            if resultado is _AVALIAR_RPN:
+                trechos.append([abre + 1, fecha, abre + 1, [], None])
+            else:
+                trecho[3][proxima] = resultado
+            continue
+        trechos.pop()
+        if not trechos:
+            return resultado
+        pai = trechos[-1]
+        if pai[4] is None:
+            pai[3].append(resultado)
         else:
-            tokens_expandidos.append(token)
-            i += 1
-    
-    # Agora processa com uma pilha RPN tradicional
-    pilha = []
-    
-    for token in tokens_expandidos:
-        if token.tipo == Tipo_de_Token.NUMERO_REAL:
+            pai[3][pai[4][2]] = resultado
+
+def _pilha_rpn(tokens: list[Token], memoria: dict, trecho: list, pares: list[int] | None, relatar) -> float:
+    # Pilha RPN de um trecho; cada subexpressão entre parênteses entra como o seu valor
+    # (na ordem), como um token numérico. Um operando adiado que o operando esquerdo não
+    # dispensa interrompe a pilha: o estado fica no trecho e a função devolve _ADIADO
+    inicio, fim, _, subexpressoes, retomada = trecho
+    if retomada is None:
+        pilha = []
+        proxima = 0
+        i = inicio
+    else:
+        pilha, i, proxima = retomada
+        trecho[4] = None
+    while i < fim:
+        token = tokens[i]
+        posicao = i
+        i += 1
+        if token.tipo == Tipo_de_Token.ABRE_PARENTESES:
+            fecha = pares[posicao]
+            if fecha < 0 or fecha >= fim:
+                fecha = fim
+            i = fecha + 1
+            if fecha == posicao + 1:
+                continue
+            valor = subexpressoes[proxima]
+            if valor is _ADIADO:
+                decidido = _decidir_logico(pilha, tokens[i].tipo)
+                if decidido is None:
+                    trecho[4] = (pilha, posicao, proxima)
+                    return _ADIADO
+                # O operador também é consumido: o operando direito não é avaliado
+                pilha[-1] = decidido
+                proxima += 1
+                i += 1
+                continue
+            pilha.append(float(valor))
+            proxima += 1
+
+        elif token.tipo == Tipo_de_Token.NUMERO_REAL:
             pilha.append(float(token.valor))
             
         elif token.tipo == Tipo_de_Token.VARIAVEL:
@@ -390,7 +598,8 @@ def processarTokens(tokens: list[Token], memoria: dict) -> float:
                 if hist and 0 < idx <= len(hist):
                     pilha.append(hist[-idx])
                 else:
-                    print(f"ERRO -> Índice {idx} fora do intervalo do histórico (tamanho: {len(hist)})")
+                    relatar(HISTORICO_FORA,
+                            f"ERRO -> Índice {idx} fora do intervalo do histórico (tamanho: {len(hist)})", posicao)
                     pilha.append(0.0)
             else:
                 # Sem índice, retorna o último resultado
@@ -398,90 +607,41 @@ def processarTokens(tokens: list[Token], memoria: dict) -> float:
                 if hist:
                     pilha.append(hist[-1])
                 else:
-                    print("ERRO -> Histórico vazio")
+                    relatar(HISTORICO_VAZIO, "ERRO -> Histórico vazio", posicao)
                     pilha.append(0.0)
                 
-        elif str(token.valor) in ['+', '-', '*', '/', '|', '%', '^']:
-            if len(pilha) >= 2:
-                b = pilha.pop()
-                a = pilha.pop()
-                
-                try:
-                    if token.valor == '+': resultado = a + b
-                    elif token.valor == '-': resultado = a - b
-                    elif token.valor == '*': resultado = a * b
-                    elif token.valor == '/': resultado = int(a / b) if b != 0 else 0.0  # Divisão INTEIRA
-                    elif token.valor == '|': resultado = a / b if b != 0 else 0.0  # Divisão REAL
-                    elif token.valor == '%': resultado = a % b if b != 0 else 0.0
-                    elif token.valor == '^': resultado = math.pow(a, b)
-                    
-                    pilha.append(arredondar_16bit(resultado))
-                except (ZeroDivisionError, ValueError, OverflowError):
-                    pilha.append(0.0)
-            else:
-                print(f"ERRO -> Tokens insuficientes para o operador '{token.valor}'")
+        else:
+            # Operadores: despacho pelo registro central (operadores.py)
+            operador = OPERADORES_POR_TIPO[token.tipo]
+            if operador is None:
+                continue
+            if len(pilha) < operador.aridade:
+                relatar(OPERANDOS_INSUFICIENTES, operador.mensagem_insuficiente(), posicao)
                 pilha.append(0.0)
-                
-        elif str(token.valor) in ['<', '>', '==', '<=', '>=', '!=']:
-            if len(pilha) >= 2:
-                b = pilha.pop()
+                continue
+
+            if operador.aridade == 1:
                 a = pilha.pop()
-                
                 try:
-                    # Garante que os valores sejam numéricos
-                    a_num = float(a)
-                    b_num = float(b)
-                    
-                    if token.valor == '<': resultado = 1.0 if a_num < b_num else 0.0
-                    elif token.valor == '>': resultado = 1.0 if a_num > b_num else 0.0
-                    elif token.valor == '==': resultado = 1.0 if abs(a_num - b_num) < 1e-10 else 0.0
-                    elif token.valor == '<=': resultado = 1.0 if a_num <= b_num else 0.0
-                    elif token.valor == '>=': resultado = 1.0 if a_num >= b_num else 0.0
-                    elif token.valor == '!=': resultado = 1.0 if abs(a_num - b_num) >= 1e-10 else 0.0
-                    else: resultado = 0.0
-                    
-                    pilha.append(resultado)
+                    pilha.append(operador.avaliar(float(a)))
                 except (ValueError, TypeError) as e:
-                    print(f"ERRO na comparação {token.valor}: {e}")
+                    relatar(OPERACAO_INVALIDA, f"{operador.erro}: {e}", posicao)
                     pilha.append(0.0)
-            else:
-                print(f"ERRO -> Tokens insuficientes para o operador '{token.valor}'")
-                pilha.append(0.0)
-                
-        elif str(token.valor) in ['&&', '||']:
-            if len(pilha) >= 2:
-                b = pilha.pop()
-                a = pilha.pop()
-                
+                continue
+
+            b = pilha.pop()
+            a = pilha.pop()
+            if operador.categoria == ARITMETICO:
                 try:
-                    # Converte para booleano: 0 = falso, qualquer outro valor = verdadeiro
-                    a_bool = float(a) != 0.0
-                    b_bool = float(b) != 0.0
-                    
-                    if token.valor == '&&': resultado = 1.0 if a_bool and b_bool else 0.0
-                    elif token.valor == '||': resultado = 1.0 if a_bool or b_bool else 0.0
-                    else: resultado = 0.0
-                    
-                    pilha.append(resultado)
-                except (ValueError, TypeError) as e:
-                    print(f"ERRO na operação lógica {token.valor}: {e}")
+                    pilha.append(arredondar_16bit(operador.avaliar(a, b)))
+                except (ZeroDivisionError, ValueError, OverflowError):
                     pilha.append(0.0)
             else:
-                print(f"ERRO -> Tokens insuficientes para o operador '{token.valor}'")
-                pilha.append(0.0)
-                
-        elif str(token.valor) == '!':
-            if len(pilha) >= 1:
-                a = pilha.pop()
                 try:
-                    # NOT lógico: 0 vira 1, qualquer outro valor vira 0
-                    resultado = 1.0 if float(a) == 0.0 else 0.0
-                    pilha.append(resultado)
+                    # Garante que os valores sejam numéricos
+                    pilha.append(operador.avaliar(float(a), float(b)))
                 except (ValueError, TypeError) as e:
-                    print(f"ERRO na operação NOT: {e}")
+                    relatar(OPERACAO_INVALIDA, f"{operador.erro}: {e}", posicao)
                     pilha.append(0.0)
-            else:
-                print("ERRO -> Token insuficiente para o operador '!'")
-                pilha.append(0.0)
     
-    return arredondar_16bit(pilha[-1] if pilha else 0.0)
\ No newline at end of file
+    return arredondar_16bit(pilha[-1] if pilha else 0.0)
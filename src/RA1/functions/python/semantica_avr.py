@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+
+# Integrantes do grupo (ordem alfabética):
+# Nome Completo 1 - Breno Rossi Duarte
+# Nome Completo 2 - Francisco Bley Ruthes
+# Nome Completo 3 - Rafael Olivare Piveta
+# Nome Completo 4 - Stefan Benjamim Seixas Lourenço Rodrigues
+#
+# Nome do grupo no Canvas: RA2_1
+
+# Execução no host, com inteiros do Python, do programa que assembly/ gera para o
+# Arduino: prevê o que a placa envia pela serial sem gravá-la. Reproduz o código gerado,
+# não a linguagem:
+#   - cada linha é a lista de tokens sem parênteses de gerarAssemblyMultiple; números
+#     viram int(float(token)) & 0xFFFF; variáveis, MEM, RES, WHILE, FOR e IFELSE não
+#     geram instruções;
+#   - a pilha RPN fica na SRAM a partir de 0x0200, com ponteiro de 8 bits e endereço
+#     0x0200 + (2 * ponteiro & 0xFF): são 128 posições circulares, desempilhar de uma
+#     pilha vazia lê a posição 127 e o que sobra de uma linha fica para as seguintes
+#     (stack_init só roda uma vez). A SRAM começa zerada, como nos simuladores;
+#   - + - * guardam os 16 bits inferiores; / e | dão o quociente sem sinal (0xFFFF
+#     para divisor 0); % dá o resto sem sinal (o dividendo para divisor 0); < > <= >=
+#     comparam com sinal (complemento de 2) e == != && || ! testam os 16 bits;
+#   - power_int conta as multiplicações em r23:r22 com dec/sbc, e o sbc usa o carry que
+#     sobra de multiply_int: o número de voltas, e portanto o resultado, depende desses
+#     carries, e alguns expoentes nunca zeram o contador (a placa trava na linha).
+# brgt e brle (em > e <=) não são instruções AVR; as linhas com esses operadores são
+# executadas com a comparação pretendida.
+
+from functools import lru_cache
+from typing import Iterable, Sequence
+
+from src.RA1.functions.assembly.operations import is_number
+from .operadores import OPERADORES_POR_LEXEMA
+from .inteiros_avr import MASCARA
+
+# Posições da pilha RPN na SRAM (ponteiro de 8 bits, 2 bytes por valor)
+POSICOES_PILHA = 128
+
+
+@lru_cache(maxsize=4096)
+def compilarOperacaoAVR(tokens: tuple[str, ...]) -> tuple:
+    """
+    Passos de uma linha (tokens sem parênteses, como em gerarAssemblyMultiple): um
+    inteiro é empilhado, um par (aridade, função) é um operador.
+    """
+    passos = []
+    for token in tokens:
+        if is_number(token):
+            passos.append(int(float(token)) & MASCARA)
+        elif token in OPERADORES_POR_LEXEMA:
+            operador = OPERADORES_POR_LEXEMA[token]
+            if operador.avr is None:
+                raise ValueError(f"Operador sem rotina de 16 bits: {token!r}")
+            passos.append((operador.aridade, operador.avr))
+        # Os demais tokens não geram instruções (rotinas vazias ou comentários)
+    return tuple(passos)
+
+
+class MaquinaAVR:
+    """
+    Estado do programa gerado entre as operações: as posições da pilha RPN na SRAM e
+    o ponteiro `stack_ptr`.
+    """
+    __slots__ = ('pilha', 'ponteiro')
+
+    def __init__(self):
+        self.pilha = [0] * POSICOES_PILHA
+        self.ponteiro = 0
+
+    def executar(self, tokens: Sequence[str]) -> int | None:
+        """
+        Executa processar_rpn_opN e send_result para a linha: devolve o valor enviado pela
+        serial (0 a 65535), ou None se a placa trava na linha.
+        """
+        pilha = self.pilha
+        ponteiro = self.ponteiro
+        for passo in compilarOperacaoAVR(tuple(tokens)):
+            if passo.__class__ is int:
+                pilha[ponteiro & 0x7F] = passo
+                ponteiro = (ponteiro + 1) & 0xFF
+                continue
+            aridade, funcao = passo
+            ponteiro = (ponteiro - 1) & 0xFF
+            if aridade == 1:
+                valor = funcao(pilha[ponteiro & 0x7F])
+            else:
+                b = pilha[ponteiro & 0x7F]
+                ponteiro = (ponteiro - 1) & 0xFF
+                valor = funcao(pilha[ponteiro & 0x7F], b)
+                if valor is None:
+                    self.ponteiro = ponteiro
+                    return None
+            pilha[ponteiro & 0x7F] = valor
+            ponteiro = (ponteiro + 1) & 0xFF
+        # send_result
+        ponteiro = (ponteiro - 1) & 0xFF
+        self.ponteiro = ponteiro
+        return pilha[ponteiro & 0x7F]
+
+
+def executarProgramaAVR(operacoes: Iterable[Sequence[str]]) -> list[int | None]:
+    """
+    Valores enviados pela placa para cada operação, na ordem. Se uma operação trava, o
+    último item é None e as seguintes não são executadas.
+    """
+    maquina = MaquinaAVR()
+    resultados = []
+    for tokens in operacoes:
+        resultado = maquina.executar(tokens)
+        resultados.append(resultado)
+        if resultado is None:
+            break
+    return resultados
+
+
+def saidaSerialAVR(operacoes: Sequence[Sequence[str]]) -> str:
+    """Texto completo enviado pela serial (cabeçalhos, expressões e resultados)."""
+    partes = []
+    for numero, (tokens, resultado) in enumerate(zip(operacoes, executarProgramaAVR(operacoes)), 1):
+        # O código gerado só sabe escrever um dígito; a partir de 10 envia "10"
+        partes.append(f"\r\n==== OPERACAO {numero if numero < 10 else 10} ====\r\n")
+        expressao = ''.join(caractere for caractere in " ".join(tokens)
+                            if caractere == ' ' or caractere.isalnum() or caractere in "+-*/%^()")
+        partes.append(f"Expressao: {expressao}\r\n")
+        if resultado is None:
+            break
+        partes.append(f"Resultado: {resultado}\r\n\r\n")
+    return ''.join(partes)
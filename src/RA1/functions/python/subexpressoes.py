@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+
+# Integrantes do grupo (ordem alfabética):
+# Nome Completo 1 - Breno Rossi Duarte
+# Nome Completo 2 - Francisco Bley Ruthes
+# Nome Completo 3 - Rafael Olivare Piveta
+# Nome Completo 4 - Stefan Benjamim Seixas Lourenço Rodrigues
+#
+# Nome do grupo no Canvas: RA2_1
+
+# Subexpressões compartilhadas entre as linhas de uma execução. As árvores das linhas
+# (compilador.py) são consolidadas em um DAG: nós estruturalmente iguais viram o mesmo
+# objeto, então (A B +) escrito em várias linhas é um nó só. Os quadros RPN puros (só
+# constantes, variáveis e operadores com operandos suficientes, sem RES) têm o valor
+# memorizado na tabela, um por nó do DAG. Como construirArvore achata a RPN aninhada
+# em um só quadro, os trechos puros de um quadro (itens que formam uma subexpressão
+# completa) também são memorizados: o Memorizado entra como item do quadro, no lugar
+# do trecho, e é avaliado ali mesmo, então a ordem das operações e dos diagnósticos
+# não muda.
+#
+# O valor memorizado vale para a versão atual das variáveis que o quadro lê: cada
+# linha só consulta quadros que não leem variáveis escritas por ela mesma (os valores
+# lidos não mudam durante a linha, nem dentro de laços) e, ao fim da linha, as
+# variáveis que ela escreve invalidam os quadros que as leem. Um valor só é guardado
+# se as variáveis lidas são números: com None (resultado de linha com erro) o quadro
+# pode relatar diagnósticos, que não seriam repetidos ao reaproveitar o valor.
+# Os percursos são geradores executados por compilador.percorrer (sem recursão) e a
+# pureza de cada nó é calculada quando ele entra no DAG, a partir da dos filhos.
+
+from .memoria import TabelaSimbolos, AUSENTE
+from .compilador import No, Constante, Variavel, Grupo, Operacao, ResPilha, Quadro, Memorizado, \
+    escritas_dos_lacos, trechos_puros, percorrer
+
+
+def _chave(valor):
+    # Filhos já consolidados são comparados pela identidade; repr distingue 0.0 de -0.0
+    if isinstance(valor, No):
+        return id(valor)
+    if isinstance(valor, (list, tuple)):
+        return tuple(map(_chave, valor))
+    return (valor.__class__, repr(valor))
+
+
+class TabelaSubexpressoes:
+    """
+    DAG das subexpressões e valores memorizados dos quadros puros de uma execução.
+    O código compilado com a tabela (compilarLinha com `subexpressoes`) só roda sobre
+    a memória dessa execução, e as variáveis escritas por cada linha (executada ou
+    reaproveitada) devem ser informadas em invalidar().
+    """
+    __slots__ = ('nos', 'ocorrencias', 'indices', 'valores', 'leituras', 'dependentes',
+                 'consultas', 'acertos', 'invalidacoes', '_puras')
+
+    def __init__(self):
+        self.nos = {}            # chave estrutural -> nó do DAG
+        self.ocorrencias = 0     # nós consolidados, com repetições
+        self.indices = {}        # id do quadro puro no DAG -> posição em valores
+        self.valores = []        # valor memorizado de cada quadro puro (AUSENTE = nenhum)
+        self.leituras = []       # variáveis lidas por cada quadro puro
+        self.dependentes = {}    # variável -> posições dos quadros que a leem
+        self.consultas = 0
+        self.acertos = 0
+        self.invalidacoes = 0
+        self._puras = {}         # id do nó no DAG -> variáveis lidas, ou None se não é puro
+
+    def consolidar(self, arvore: No, simbolos: TabelaSimbolos) -> No:
+        """
+        Árvore da linha com os nós do DAG; os quadros puros que não leem variáveis
+        escritas pela linha ficam dentro de nós Memorizado (slots de `simbolos`).
+        """
+        arvore = percorrer(self._internar(arvore))
+        escritas, _ = escritas_dos_lacos(arvore)
+        return percorrer(self._memorizar(arvore, escritas, simbolos))
+
+    def invalidar(self, nomes):
+        """Descarta os valores memorizados que dependem das variáveis `nomes`."""
+        for nome in nomes:
+            for indice in self.dependentes.get(nome, ()):
+                if self.valores[indice] is not AUSENTE:
+                    self.valores[indice] = AUSENTE
+                    self.invalidacoes += 1
+
+    def relatorio(self) -> str:
+        taxa = 100.0 * self.acertos / self.consultas if self.consultas else 0.0
+        return (f"Subexpressões: {self.ocorrencias} nó(s) nas linhas, {len(self.nos)} distinto(s) no DAG, "
+                f"{len(self.valores)} memorizável(is)\n"
+                f"Memorização: {self.consultas} consulta(s), {self.acertos} acerto(s) ({taxa:.1f}%), "
+                f"{self.invalidacoes} invalidação(ões)")
+
+    # --- DAG ---
+
+    def _internar(self, no: No):
+        classe = type(no)
+        valores = []
+        for campo in classe.__slots__:
+            valores.append((yield self._canonico(getattr(no, campo))))
+        self.ocorrencias += 1
+        return self._no(classe, valores)
+
+    def _no(self, classe: type, valores: list) -> No:
+        # Nó do DAG com os campos `valores` (já consolidados)
+        chave = (classe, *map(_chave, valores))
+        no = self.nos.get(chave)
+        if no is None:
+            no = self.nos[chave] = classe.__new__(classe)
+            for campo, valor in zip(classe.__slots__, valores):
+                setattr(no, campo, valor)
+            self._puras[id(no)] = self._calcular_leituras(no)
+        return no
+
+    def _canonico(self, valor):
+        if isinstance(valor, No):
+            return (yield self._internar(valor))
+        if isinstance(valor, (list, tuple)):
+            itens = []
+            for item in valor:
+                itens.append((yield self._canonico(item)))
+            return itens if isinstance(valor, list) else tuple(itens)
+        return valor
+
+    # --- memorização ---
+
+    def _leituras_puras(self, no: No) -> frozenset | None:
+        # Variáveis lidas por um nó do DAG sem efeitos nem diagnósticos com operandos numéricos
+        return self._puras[id(no)]
+
+    def _calcular_leituras(self, no: No) -> frozenset | None:
+        # Os filhos entram no DAG antes do pai: a pureza deles já está calculada
+        if isinstance(no, Constante):
+            return frozenset()
+        if isinstance(no, Variavel):
+            return frozenset((no.nome,))
+        if isinstance(no, Quadro):
+            return self._quadro_puro(no)
+        return None
+
+    def _quadro_puro(self, quadro: Quadro) -> frozenset | None:
+        leituras = set()
+        profundidade = 0
+        for item in quadro.itens:
+            if isinstance(item, Operacao):
+                if profundidade < item.operador.aridade:
+                    # OPERANDOS_INSUFICIENTES
+                    return None
+                profundidade -= item.operador.aridade - 1
+                continue
+            if isinstance(item, ResPilha):
+                return None
+            lidas = self._leituras_puras(item.no if isinstance(item, Grupo) else item)
+            if lidas is None:
+                return None
+            leituras |= lidas
+            profundidade += 1
+        return frozenset(leituras)
+
+    def _indice(self, quadro: Quadro, leituras: frozenset) -> int:
+        indice = self.indices.get(id(quadro))
+        if indice is None:
+            indice = self.indices[id(quadro)] = len(self.valores)
+            self.valores.append(AUSENTE)
+            self.leituras.append(leituras)
+            for nome in leituras:
+                self.dependentes.setdefault(nome, []).append(indice)
+        return indice
+
+    def _memorizar(self, no: No, escritas: frozenset, simbolos: TabelaSimbolos):
+        # Cópia do caminho até os quadros memorizados; o resto continua sendo o DAG
+        classe = type(no)
+        campos = [getattr(no, campo) for campo in classe.__slots__]
+        novos = []
+        for valor in campos:
+            novos.append((yield self._vista(valor, escritas, simbolos)))
+        if all(novo is antigo for novo, antigo in zip(novos, campos)):
+            vista = no
+        else:
+            vista = classe.__new__(classe)
+            for campo, valor in zip(classe.__slots__, novos):
+                setattr(vista, campo, valor)
+        if isinstance(no, Quadro):
+            leituras = self._leituras_puras(no)
+            if leituras and not leituras & escritas and any(isinstance(item, Operacao) for item in no.itens):
+                return self._memorizado(no, vista, leituras, simbolos)
+            return self._trechos(no, vista, escritas, simbolos)
+        return vista
+
+    def _memorizado(self, quadro: Quadro, vista: No, leituras: frozenset, simbolos: TabelaSimbolos) -> Memorizado:
+        slots = tuple(sorted(simbolos.slot(nome) for nome in leituras))
+        return Memorizado(self._indice(quadro, leituras), vista, slots)
+
+    def _trechos(self, quadro: Quadro, vista: Quadro, escritas: frozenset, simbolos: TabelaSimbolos) -> Quadro:
+        # Os maiores trechos puros com operador que não leem variáveis escritas pela linha
+        trechos = trechos_puros(
+            quadro, lambda item: self._leituras_puras(item.no if isinstance(item, Grupo) else item),
+            lambda inicio, fim, leituras: leituras if leituras and not leituras & escritas else None)
+        if not trechos:
+            return vista
+
+        itens = list(vista.itens)
+        for inicio, fim, leituras in sorted(trechos, reverse=True):
+            trecho = self._no(Quadro, [quadro.itens[inicio:fim + 1]])
+            itens[inicio:fim + 1] = [self._memorizado(trecho, Quadro(itens[inicio:fim + 1]), leituras, simbolos)]
+        return Quadro(itens)
+
+    def _vista(self, valor, escritas: frozenset, simbolos: TabelaSimbolos):
+        if isinstance(valor, No):
+            return (yield self._memorizar(valor, escritas, simbolos))
+        if isinstance(valor, (list, tuple)):
+            itens = []
+            for item in valor:
+                itens.append((yield self._vista(item, escritas, simbolos)))
+            if all(novo is antigo for novo, antigo in zip(itens, valor)):
+                return valor
+            return itens if isinstance(valor, list) else tuple(itens)
+        return valor
@@ -9,54 +9,219 @@
 # Nome do grupo no Canvas: RA2_1
 
 class Tipo_de_Token:
+    # Os tipos são códigos inteiros: comparar tipos é uma comparação de inteiros
+    # e o código serve de índice direto em tabelas (ver NOMES).
+
     # Números
-    NUMERO_REAL = "NUMERO_REAL"
+    NUMERO_REAL = 0
 
     # Operadores Aritméticos
-    SOMA = "SOMA"              # +
-    SUBTRACAO = "SUBTRACAO"    # -
-    MULTIPLICACAO = "MULT"     # *
-    DIVISAO_INTEIRA = "DIV_INT"    # /
-    DIVISAO_REAL = "DIV_REAL"      # |
-    RESTO = "RESTO"            # %
-    POTENCIA = "POT"           # ^
+    SOMA = 1              # +
+    SUBTRACAO = 2         # -
+    MULTIPLICACAO = 3     # *
+    DIVISAO_INTEIRA = 4   # /
+    DIVISAO_REAL = 5      # |
+    RESTO = 6             # %
+    POTENCIA = 7          # ^
 
     # Operadores de Comparação
-    MENOR = "MENOR"            # <
-    MAIOR = "MAIOR"           # >
-    IGUAL = "IGUAL"           # ==
-    MENOR_IGUAL = "MENOR_IGUAL" # <=
-    MAIOR_IGUAL = "MAIOR_IGUAL" # >=
-    DIFERENTE = "DIFERENTE"    # !=
+    MENOR = 8             # <
+    MAIOR = 9             # >
+    IGUAL = 10            # ==
+    MENOR_IGUAL = 11      # <=
+    MAIOR_IGUAL = 12      # >=
+    DIFERENTE = 13        # !=
 
     # Operadores Lógicos
-    NOT = "NOT"               # !
-    OR = "OR"                 # ||
-    AND = "AND"              # &&
+    NOT = 14              # !
+    OR = 15               # ||
+    AND = 16              # &&
 
     # Estruturas de Controle
-    WHILE = "WHILE"           # Estrutura de repetição WHILE
-    FOR = "FOR"               # Estrutura de repetição FOR
-    IFELSE = "IFELSE"         # Estrutura condicional IF-ELSE
+    WHILE = 17            # Estrutura de repetição WHILE
+    FOR = 18              # Estrutura de repetição FOR
+    IFELSE = 19           # Estrutura condicional IF-ELSE
 
     # Símbolos de Agrupamento
-    ABRE_PARENTESES = "ABRE_PARENTESES"    # (
-    FECHA_PARENTESES = "FECHA_PARENTESES"   # )
+    ABRE_PARENTESES = 20  # (
+    FECHA_PARENTESES = 21 # )
 
     # Comandos Especiais
-    RES = "RES"               # Comando especial RES
+    RES = 22              # Comando especial RES
 
     # Variáveis
-    VARIAVEL = "VARIAVEL"       # Identificador de variável
+    VARIAVEL = 23         # Identificador de variável
 
     # Marcador de fim de arquivo
-    FIM = "FIM"
+    FIM = 24
+
+    # Nome legível de cada código (índice = código do tipo)
+    NOMES = (
+        "NUMERO_REAL",
+        "SOMA", "SUBTRACAO", "MULT", "DIV_INT", "DIV_REAL", "RESTO", "POT",
+        "MENOR", "MAIOR", "IGUAL", "MENOR_IGUAL", "MAIOR_IGUAL", "DIFERENTE",
+        "NOT", "OR", "AND",
+        "WHILE", "FOR", "IFELSE",
+        "ABRE_PARENTESES", "FECHA_PARENTESES",
+        "RES",
+        "VARIAVEL",
+        "FIM",
+    )
+
+    # Agrupamentos usados pelo interpretador
+    ARITMETICOS = frozenset((SOMA, SUBTRACAO, MULTIPLICACAO, DIVISAO_INTEIRA, DIVISAO_REAL, RESTO, POTENCIA))
+    COMPARACAO = frozenset((MENOR, MAIOR, IGUAL, MENOR_IGUAL, MAIOR_IGUAL, DIFERENTE))
+    LOGICOS_BINARIOS = frozenset((AND, OR))
+    CONTROLE = frozenset((IFELSE, WHILE, FOR))
+    PARENTESES = frozenset((ABRE_PARENTESES, FECHA_PARENTESES))
 
 
 class Token:
-    def __init__(self, tipo: str, valor):
+    # Sem __dict__ por instância: cada token ocupa apenas dois ponteiros.
+    # Tokens de lexema fixo são compartilhados (ver TOKENS_FIXOS) e não devem ser alterados.
+    __slots__ = ('tipo', 'valor')
+
+    def __init__(self, tipo: int, valor):
+        self.tipo = tipo
+        self.valor = valor
+
+    def __repr__(self):
+        return f"Token({Tipo_de_Token.NOMES[self.tipo]}, {self.valor})"
+
+    def __reduce__(self):
+        # Ao passar entre processos (pickle), tokens compartilhados voltam como as
+        # instâncias únicas do processo que os recebe
+        if self is TOKEN_FIM:
+            return 'TOKEN_FIM'
+        if self.tipo == Tipo_de_Token.VARIAVEL:
+            if _VARIAVEIS.get(self.valor) is self:
+                return (token_variavel, (self.valor,))
+        elif self.tipo != Tipo_de_Token.NUMERO_REAL and TOKENS_FIXOS.get(self.valor) is self:
+            return (_token_fixo, (self.valor,))
+        return (Token, (self.tipo, self.valor))
+
+
+# Lexemas de texto fixo -> tipo do token
+TIPOS_POR_LEXEMA = {
+    '(': Tipo_de_Token.ABRE_PARENTESES,
+    ')': Tipo_de_Token.FECHA_PARENTESES,
+    '+': Tipo_de_Token.SOMA,
+    '-': Tipo_de_Token.SUBTRACAO,
+    '*': Tipo_de_Token.MULTIPLICACAO,
+    '/': Tipo_de_Token.DIVISAO_INTEIRA,
+    '|': Tipo_de_Token.DIVISAO_REAL,
+    '%': Tipo_de_Token.RESTO,
+    '^': Tipo_de_Token.POTENCIA,
+    '<': Tipo_de_Token.MENOR,
+    '>': Tipo_de_Token.MAIOR,
+    '<=': Tipo_de_Token.MENOR_IGUAL,
+    '>=': Tipo_de_Token.MAIOR_IGUAL,
+    '==': Tipo_de_Token.IGUAL,
+    '!=': Tipo_de_Token.DIFERENTE,
+    '!': Tipo_de_Token.NOT,
+    '||': Tipo_de_Token.OR,
+    '&&': Tipo_de_Token.AND,
+    'RES': Tipo_de_Token.RES,
+    'WHILE': Tipo_de_Token.WHILE,
+    'FOR': Tipo_de_Token.FOR,
+    'IFELSE': Tipo_de_Token.IFELSE,
+}
+
+# Instância única para cada lexema fixo (parênteses, operadores e palavras-chave)
+TOKENS_FIXOS = {lexema: Token(tipo, lexema) for lexema, tipo in TIPOS_POR_LEXEMA.items()}
+
+def _token_fixo(lexema: str) -> Token:
+    return TOKENS_FIXOS[lexema]
+
+# Marcador de fim de linha produzido pelo analisador léxico
+TOKEN_FIM = Token(Tipo_de_Token.FIM, None)
+
+_VARIAVEIS = {}
+
+def token_variavel(nome: str) -> Token:
+    """Retorna o token compartilhado da variável `nome` (um por identificador distinto)."""
+    token = _VARIAVEIS.get(nome)
+    if token is None:
+        token = _VARIAVEIS[nome] = Token(Tipo_de_Token.VARIAVEL, nome)
+    return token
+
+
+class TokenPosicionado(Token):
+    # Token com a posição real no arquivo de origem (linha e coluna começando em 1).
+    # Usado na leitura em fluxo do arquivo de tokens (RA2, lerTokens.iterarTokens); as
+    # instâncias não são compartilhadas.
+    __slots__ = ('linha', 'coluna')
+
+    def __init__(self, tipo: int, valor, linha: int, coluna: int):
         self.tipo = tipo
         self.valor = valor
+        self.linha = linha
+        self.coluna = coluna
 
     def __repr__(self):
-        return f"Token({self.tipo}, {self.valor})"
+        return f"Token({Tipo_de_Token.NOMES[self.tipo]}, {self.valor}, {self.linha}:{self.coluna})"
+
+    def __reduce__(self):
+        return (TokenPosicionado, (self.tipo, self.valor, self.linha, self.coluna))
+
+
+# Valores especiais da tabela de pares de parênteses
+SEM_PAR = -1          # parêntese sem correspondente
+NAO_PARENTESE = -2    # token que não é parêntese
+
+
+class ListaTokens(list):
+    # Lista de tokens de uma linha acompanhada da tabela `pares`, calculada uma única
+    # vez pelo analisador léxico: pares[i] é o índice do parêntese correspondente ao
+    # token i (nos dois sentidos), SEM_PAR se não houver, ou NAO_PARENTESE.
+    # A tabela vale para a lista como foi produzida; fatias são listas comuns.
+    # `resumo` (analisador_lexico.ResumoLinha) traz os dados da validação da linha,
+    # quando a lista vem de analisar_linha.
+    __slots__ = ('pares', 'resumo')
+
+
+def indexar_parenteses(tokens: list[Token]) -> list[int]:
+    """Calcula a tabela de pares de parênteses de uma lista de tokens em uma passada."""
+    pares = []
+    abertos = []
+    for token in tokens:
+        tipo = token.tipo
+        if tipo == Tipo_de_Token.ABRE_PARENTESES:
+            abertos.append(len(pares))
+            pares.append(SEM_PAR)
+        elif tipo == Tipo_de_Token.FECHA_PARENTESES:
+            if abertos:
+                par = abertos.pop()
+                pares[par] = len(pares)
+                pares.append(par)
+            else:
+                pares.append(SEM_PAR)
+        else:
+            pares.append(NAO_PARENTESE)
+    return pares
+
+
+def pares_de(tokens: list[Token]) -> list[int]:
+    """Tabela de pares da lista: a do analisador léxico, se houver, ou calculada agora."""
+    pares = getattr(tokens, 'pares', None)
+    if pares is None or len(pares) != len(tokens):
+        pares = indexar_parenteses(tokens)
+    return pares
+
+
+def juntar_listas_tokens(listas: list[list[Token]]) -> ListaTokens:
+    """Concatena listas de tokens reaproveitando as tabelas de pares de cada uma."""
+    juntos = ListaTokens()
+    pares = []
+    for tokens in listas:
+        tabela = pares_de(tokens)
+        if SEM_PAR in tabela:
+            # Parênteses abertos em uma linha podem fechar em outra: recalcula tudo
+            juntos.extend(token for lista in listas for token in lista)
+            juntos.pares = indexar_parenteses(juntos)
+            return juntos
+        deslocamento = len(pares)
+        pares.extend(par + deslocamento if par >= 0 else par for par in tabela)
+        juntos.extend(tokens)
+    juntos.pares = pares
+    return juntos
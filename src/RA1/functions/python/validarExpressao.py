@@ -9,6 +9,21 @@
 # Nome do grupo no Canvas: RA2_1
 
 import re
+from .tokens import ListaTokens
+from .analisador_lexico import analisar_linha
+from .operadores import LEXEMAS_OPERADORES
+
+# Padrões estruturais das verificações 6 a 8 (múltiplas expressões e parênteses excessivos)
+_PADRAO_DUAS_EXPRESSOES = re.compile(r'^\(\([^)]+\)\s*\([^)]+\)\)$')
+_PADRAO_TRES_EXPRESSOES = re.compile(r'^\(\([^)]+\)\s*\([^)]+\)\s*\([^)]+\)\)$')
+_PADRAO_PARENTESES_EXCESSIVOS = re.compile(r'^\(\(\([^)]+\)\)\s*\(\([^)]+\)\)\)$')
+
+# Formatos completos das estruturas de controle (verificação 2); um grupo pode ter
+# um nível de parênteses aninhados
+_GRUPO = r'\([^()]*(?:\([^()]*\)[^()]*)*\)'
+_PADRAO_IFELSE = re.compile(r'^\(IFELSE\s*' + _GRUPO + r'\s*' + _GRUPO + r'\s*' + _GRUPO + r'\)$')
+_PADRAO_WHILE = re.compile(r'^\(WHILE\s*' + _GRUPO + r'\s*' + _GRUPO + r'\)$')
+_PADRAO_FOR = re.compile(r'^\(FOR\s*' + _GRUPO + r'\s*' + _GRUPO + r'\s*' + _GRUPO + r'\s*' + _GRUPO + r'\)$')
 
 def validarExpressao(linha: str, numero_linha: int) -> tuple[bool, str]:
     
@@ -32,15 +47,14 @@ def validarExpressao(linha: str, numero_linha: int) -> tuple[bool, str]:
     
     # Remove parênteses e divide em tokens para análise
     tokens_para_analise = linha.replace('(', ' ').replace(')', ' ').split()
-    operadores = ['+', '-', '*', '/', '%', '^', '<', '>', '==', '<=', '>=', '!=', '&&', '||', '!']
+    operadores = LEXEMAS_OPERADORES
     comandos_especiais = ['WHILE', 'FOR', 'IFELSE', 'MEM', 'RES']
     
     # 2. Validação específica para estruturas de controle incompletas
     if 'IFELSE' in tokens_para_analise:
         # IFELSE pode ter parênteses aninhados, então usamos uma validação mais flexível
         # Verifica se há pelo menos 3 grupos de parênteses após IFELSE
-        ifelse_pattern = r'^\(IFELSE\s*\([^()]*(?:\([^()]*\)[^()]*)*\)\s*\([^()]*(?:\([^()]*\)[^()]*)*\)\s*\([^()]*(?:\([^()]*\)[^()]*)*\)\)$'
-        if not re.match(ifelse_pattern, linha):
+        if not _PADRAO_IFELSE.match(linha):
             # Validação mais simples: contar grupos de parênteses após IFELSE
             resto_linha = linha[linha.find('IFELSE')+6:].strip()
             if resto_linha.count('(') < 3 or resto_linha.count(')') < 3:
@@ -50,8 +64,7 @@ def validarExpressao(linha: str, numero_linha: int) -> tuple[bool, str]:
     
     if 'WHILE' in tokens_para_analise:
         # WHILE pode ter parênteses aninhados
-        while_pattern = r'^\(WHILE\s*\([^()]*(?:\([^()]*\)[^()]*)*\)\s*\([^()]*(?:\([^()]*\)[^()]*)*\)\)$'
-        if not re.match(while_pattern, linha):
+        if not _PADRAO_WHILE.match(linha):
             # Validação mais simples: contar grupos de parênteses após WHILE  
             resto_linha = linha[linha.find('WHILE')+5:].strip()
             if resto_linha.count('(') < 2 or resto_linha.count(')') < 2:
@@ -61,8 +74,7 @@ def validarExpressao(linha: str, numero_linha: int) -> tuple[bool, str]:
     
     if 'FOR' in tokens_para_analise:
         # FOR pode ter parênteses aninhados
-        for_pattern = r'^\(FOR\s*\([^()]*(?:\([^()]*\)[^()]*)*\)\s*\([^()]*(?:\([^()]*\)[^()]*)*\)\s*\([^()]*(?:\([^()]*\)[^()]*)*\)\s*\([^()]*(?:\([^()]*\)[^()]*)*\)\)$'
-        if not re.match(for_pattern, linha):
+        if not _PADRAO_FOR.match(linha):
             # Validação mais simples: contar grupos de parênteses após FOR
             resto_linha = linha[linha.find('FOR')+3:].strip()
             if resto_linha.count('(') < 4 or resto_linha.count(')') < 4:
@@ -103,19 +115,19 @@ def validarExpressao(linha: str, numero_linha: int) -> tuple[bool, str]:
             return False, erro
     
     # 6. Múltiplas expressões sem conexão
-    if re.match(r'^\(\([^)]+\)\s*\([^)]+\)\)$', linha) and not any(cmd in linha for cmd in ['WHILE', 'FOR', 'IFELSE']):
+    if _PADRAO_DUAS_EXPRESSOES.match(linha) and not any(cmd in linha for cmd in ['WHILE', 'FOR', 'IFELSE']):
         erro = f"Linha {numero_linha:02d}: Expressão '{linha}'\n"
         erro += f"    ERRO DE SINTAXE: Múltiplas expressões sem conexão - falta operador entre subexpressões"
         return False, erro
     
     # Padrão: ((expr1) (expr2) (expr3)) - três ou mais subexpressões sem lógica clara
-    if re.match(r'^\(\([^)]+\)\s*\([^)]+\)\s*\([^)]+\)\)$', linha) and not any(cmd in linha for cmd in ['WHILE', 'FOR', 'IFELSE']):
+    if _PADRAO_TRES_EXPRESSOES.match(linha) and not any(cmd in linha for cmd in ['WHILE', 'FOR', 'IFELSE']):
         erro = f"Linha {numero_linha:02d}: Expressão '{linha}'\n"
         erro += f"    ERRO DE SINTAXE: Múltiplas expressões sem conexão - estrutura ambígua"
         return False, erro
     
     # Padrão: (((expr1)) ((expr2))) - parênteses excessivos
-    if re.match(r'^\(\(\([^)]+\)\)\s*\(\([^)]+\)\)\)$', linha) and not any(cmd in linha for cmd in ['WHILE', 'FOR', 'IFELSE']):
+    if _PADRAO_PARENTESES_EXCESSIVOS.match(linha) and not any(cmd in linha for cmd in ['WHILE', 'FOR', 'IFELSE']):
         erro = f"Linha {numero_linha:02d}: Expressão '{linha}'\n"
         erro += f"    ERRO DE SINTAXE: Parênteses excessivos - estrutura mal formada"
         return False, erro
@@ -124,6 +136,91 @@ def validarExpressao(linha: str, numero_linha: int) -> tuple[bool, str]:
     return True, ""
 
 
+# ============================================================================
+# VALIDAÇÃO DURANTE A ANÁLISE LÉXICA
+# ============================================================================
+
+# Número mínimo de grupos '(' ')' depois de cada palavra-chave de controle
+_GRUPOS_CONTROLE = {'IFELSE': 3, 'WHILE': 2, 'FOR': 4}
+
+def analisarEValidar(linha: str) -> tuple[bool, ListaTokens | None, str | None]:
+    """
+    Tokeniza a linha e decide, a partir dos tokens e do ResumoLinha coletado por
+    analisar_linha, se validarExpressao a aceitaria.
+    Retorna (valida, tokens, erro_lexico): `tokens` é o resultado de analisar_linha,
+    ou None com a mensagem do analisador léxico em `erro_lexico`.
+    """
+    linha = linha.strip()
+    if not linha or linha.startswith('#'):
+        return True, None, None
+
+    # Fora do caso simples (caracteres não ASCII), usa a validação por texto
+    if not linha.isascii():
+        return _validarPorTexto(linha)
+
+    try:
+        tokens = analisar_linha(linha)
+    except ValueError:
+        return _validarPorTexto(linha)
+
+    # Dados da validação coletados pelo analisador léxico na mesma passada
+    resumo = tokens.resumo
+
+    # Lexemas colados formam um único elemento para validarExpressao
+    if resumo.colados:
+        return validarExpressao(linha, 0)[0], tokens, None
+
+    # 1. Parênteses balanceados
+    num_abre = resumo.abre
+    if num_abre != resumo.fecha:
+        return False, tokens, None
+
+    # 2. Estruturas de controle: grupos suficientes depois da palavra-chave
+    for palavra, (abre, fecha) in resumo.grupos.items():
+        minimo = _GRUPOS_CONTROLE[palavra]
+        if abre < minimo or fecha < minimo:
+            return False, tokens, None
+
+    # 3. e 4. Expressão vazia ou operador isolado (o token FIM não conta)
+    nao_parenteses = len(tokens) - 1 - 2 * num_abre
+    tem_operador = resumo.operadores > 0
+    if nao_parenteses == 0 or (nao_parenteses == 1 and tem_operador):
+        return False, tokens, None
+
+    # 5. Operandos sem operador ou parênteses desnecessários
+    if not tem_operador and not resumo.comandos:
+        operandos = resumo.operandos
+        if operandos > 2 or (operandos >= 1 and num_abre > 1):
+            return False, tokens, None
+
+    # 6. a 8. Padrões estruturais: todos começam com '((' e terminam com '))'
+    if (linha.startswith('((') and linha.endswith('))')
+            and 'WHILE' not in linha and 'FOR' not in linha and 'IFELSE' not in linha):
+        if (_PADRAO_DUAS_EXPRESSOES.match(linha) or _PADRAO_TRES_EXPRESSOES.match(linha)
+                or _PADRAO_PARENTESES_EXCESSIVOS.match(linha)):
+            return False, tokens, None
+
+    return True, tokens, None
+
+def _validarPorTexto(linha: str) -> tuple[bool, ListaTokens | None, str | None]:
+    """Caminho lento de analisarEValidar: validarExpressao e analisar_linha separados."""
+    valida = validarExpressao(linha, 0)[0]
+    try:
+        return valida, analisar_linha(linha), None
+    except ValueError as e:
+        return valida, None, str(e)
+
+def validarETokenizar(linha: str, numero_linha: int) -> tuple[bool, str, ListaTokens | None, str | None]:
+    """
+    Versão de validarExpressao que também devolve os tokens da linha.
+    Retorna (valida, mensagem_erro, tokens, erro_lexico); a mensagem é a mesma de validarExpressao.
+    """
+    valida, tokens, erro_lexico = analisarEValidar(linha)
+    if not valida:
+        return False, validarExpressao(linha, numero_linha)[1], None, None
+    return True, "", tokens, erro_lexico
+
+
 def criarMensagemErro(linha: str, numero_linha: int, tipo_erro: str, detalhes: str = "") -> str:
     
     erro = f"Linha {numero_linha:02d}: Expressão '{linha}'\n"
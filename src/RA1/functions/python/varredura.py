@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+
+# Integrantes do grupo (ordem alfabética):
+# Nome Completo 1 - Breno Rossi Duarte
+# Nome Completo 2 - Francisco Bley Ruthes
+# Nome Completo 3 - Rafael Olivare Piveta
+# Nome Completo 4 - Stefan Benjamim Seixas Lourenço Rodrigues
+#
+# Nome do grupo no Canvas: RA2_1
+
+# Varreduras de parâmetros sobre programas inteiros (com WHILE/FOR/IFELSE, que a
+# avaliação em lote não vetoriza). O programa é validado e compilado uma única vez no
+# processo principal, com uma tabela de símbolos comum a todas as linhas, e enviado a
+# cada processo do pool na inicialização; as tarefas levam só os valores iniciais das
+# variáveis de algumas rodadas. Cada rodada executa o programa desde a primeira linha
+# sobre uma memória nova, com as regras de exibirResultados (linha com erro vale None
+# no histórico, limite da execução inteira interrompe a rodada), e devolve o desfecho
+# de cada linha e as variáveis no fim.
+#
+# Funções geradas por codigo_nativo.py não podem ser enviadas a outro processo: vai o
+# código-fonte delas, e cada processo as compila de novo uma vez (funcaoNativa).
+
+import os
+from typing import Iterable, Iterator, Mapping, Sequence
+
+from .compilador import prepararArvore, gerarBytecode
+from .codigo_nativo import fonteNativa, funcaoNativa
+from .pool_processos import PoolDeExecutores, TAREFAS_POR_PROCESSO, dividir
+from .avaliacao_lote import tamanho_das_colunas
+from .incremental import Desfecho, obterDesfecho
+from .maquina_virtual import CodigoCompilado
+from .memoria import Memoria, TabelaSimbolos, PROFUNDIDADE_HISTORICO
+from .orcamento import Orcamento, EXECUCAO
+from .validarExpressao import analisarEValidar, validarExpressao
+
+# Rodadas por tarefa enviada ao pool (no máximo; limita a memória das respostas)
+RODADAS_POR_TAREFA = 256
+
+
+class ProgramaCompilado:
+    """
+    Linhas de um programa (sem linhas vazias e comentários) compiladas com a tabela
+    `simbolos`. Cada passo é (código sem função nativa, fonte da função nativa ou
+    None) ou, para as linhas que não compilam, o Desfecho com o erro.
+    """
+    __slots__ = ('linhas', 'passos', 'simbolos')
+
+    def __init__(self, linhas: list[str], passos: list, simbolos: TabelaSimbolos):
+        self.linhas = linhas
+        self.passos = passos
+        self.simbolos = simbolos
+
+
+class Rodada:
+    """
+    Uma execução da varredura: posição na tabela de valores, valores iniciais, o
+    desfecho de cada linha (incremental.Desfecho, na ordem do programa; só até a
+    interrupção pelo orçamento da execução) e as variáveis no fim.
+    """
+    __slots__ = ('indice', 'iniciais', 'desfechos', 'variaveis')
+
+    def __init__(self, indice: int, iniciais: dict, desfechos: tuple, variaveis: dict):
+        self.indice = indice
+        self.iniciais = iniciais
+        self.desfechos = desfechos
+        self.variaveis = variaveis
+
+    def __reduce__(self):
+        return (Rodada, (self.indice, self.iniciais, self.desfechos, self.variaveis))
+
+    @property
+    def resultados(self) -> list:
+        """Resultado de cada linha executada, como no histórico de RES (None = erro)."""
+        return [desfecho.resultado if desfecho.erro is None else None for desfecho in self.desfechos]
+
+
+def _erroValidacao(linha: str) -> tuple:
+    # (tipo, detalhes) da mensagem de validarExpressao: "Linha NN: ...\n    ERRO DE <tipo>: <detalhes>"
+    _, mensagem = validarExpressao(linha, 0)
+    tipo, _, detalhes = mensagem.rpartition("ERRO DE ")[2].partition(": ")
+    return tipo, detalhes
+
+
+def compilarPrograma(linhas: Iterable[str], nativo: bool = False) -> ProgramaCompilado:
+    """
+    Valida e compila as linhas do programa uma vez, para várias rodadas. Com `nativo`,
+    guarda também o fonte da função Python de cada linha (codigo_nativo.py).
+    """
+    simbolos = TabelaSimbolos()
+    processadas = []
+    passos = []
+    for linha in linhas:
+        if not linha.strip() or linha.strip().startswith('#'):
+            continue
+        processadas.append(linha)
+        valida, tokens, erro_lexico = analisarEValidar(linha)
+        if not valida:
+            passos.append(Desfecho(None, (), _erroValidacao(linha)))
+            continue
+        # Mesmas categorias de erro de exibirResultados
+        try:
+            if erro_lexico is not None:
+                raise ValueError(erro_lexico)
+            arvore = prepararArvore(tokens, None, simbolos)
+            codigo = gerarBytecode(arvore, simbolos)
+        except ValueError as e:
+            passos.append(Desfecho(None, (), ("SINTAXE", str(e))))
+        except ZeroDivisionError:
+            passos.append(Desfecho(None, (), ("MATEMÁTICO", "Divisão por zero")))
+        except Exception as e:
+            passos.append(Desfecho(None, (), ("INESPERADO", f"{type(e).__name__}: {e}")))
+        else:
+            passos.append((codigo, fonteNativa(arvore, codigo) if nativo else None))
+    return ProgramaCompilado(processadas, passos, simbolos)
+
+
+class _Executor:
+    # Executa rodadas de um programa compilado; cada tarefa traz (índice, valores
+    # iniciais na ordem de `nomes`) de cada rodada
+    __slots__ = ('nomes', 'slots', 'passos', 'simbolos', 'profundidade', 'orcamento')
+
+    def __init__(self, programa: ProgramaCompilado, nomes: tuple, profundidade: int | None,
+                 orcamento: Orcamento | None):
+        self.nomes = nomes
+        self.slots = [programa.simbolos.slot(nome) for nome in nomes]
+        self.simbolos = programa.simbolos
+        self.profundidade = profundidade
+        self.orcamento = Orcamento() if orcamento is None else orcamento
+        # Cópias dos códigos com a função nativa deste processo
+        self.passos = []
+        for passo in programa.passos:
+            if isinstance(passo, tuple):
+                codigo, fonte = passo
+                if fonte is not None:
+                    codigo = CodigoCompilado(codigo.instrucoes, codigo.num_temps, codigo.simbolos,
+                                             funcaoNativa(fonte), custo=codigo.custo)
+                passo = codigo
+            self.passos.append(passo)
+
+    def executar(self, tarefas: list[tuple]) -> list[Rodada]:
+        rodadas = []
+        for indice, valores in tarefas:
+            memoria = Memoria(self.profundidade, self.simbolos)
+            for slot, valor in zip(self.slots, valores):
+                memoria.valores[slot] = valor
+            rodadas.append(self.rodar(indice, memoria, valores))
+        return rodadas
+
+    def rodar(self, indice: int, memoria: Memoria, valores: tuple) -> Rodada:
+        orcamento = self.orcamento
+        orcamento.iniciar()
+        historico = memoria.historico
+        desfechos = []
+        for passo in self.passos:
+            if isinstance(passo, Desfecho):
+                desfecho = passo
+            else:
+                desfecho, interrupcao = obterDesfecho(passo, memoria, orcamento)
+                if interrupcao is not None and interrupcao.escopo == EXECUCAO:
+                    desfechos.append(desfecho)
+                    break
+            desfechos.append(desfecho)
+            historico.adicionar(desfecho.resultado if desfecho.erro is None else None)
+        return Rodada(indice, dict(zip(self.nomes, valores)), tuple(desfechos), memoria.como_dicionario())
+
+
+def varrerPrograma(programa: Iterable[str] | ProgramaCompilado, colunas: Mapping[str, Sequence],
+                   processos: int | None = None,
+                   profundidade_historico: int | None = PROFUNDIDADE_HISTORICO,
+                   orcamento: Orcamento | None = None, nativo: bool = False) -> Iterator[Rodada]:
+    """
+    Executa o programa (linhas de texto ou compilarPrograma) uma vez para cada posição
+    das colunas de `colunas` (nome da variável -> valores iniciais), cada vez sobre uma
+    memória nova, em `processos` processos (None ou 0 = todos os núcleos). As rodadas
+    (Rodada) são entregues na ordem das posições, à medida que ficam prontas.
+    `orcamento` vale para cada rodada (padrão: só MAX_ITERACOES voltas por laço).
+    """
+    if not isinstance(programa, ProgramaCompilado):
+        programa = compilarPrograma(programa, nativo)
+    tamanho = tamanho_das_colunas(colunas)
+    nomes = tuple(colunas)
+    valores = [[float(valor) for valor in coluna] for coluna in colunas.values()]
+    tarefas = [(posicao, tuple(coluna[posicao] for coluna in valores)) for posicao in range(tamanho)]
+
+    processos = processos or os.cpu_count() or 1
+    if processos <= 1 or tamanho <= 1:
+        executor = _Executor(programa, nomes, profundidade_historico, orcamento)
+        for tarefa in tarefas:
+            yield from executor.executar([tarefa])
+        return
+
+    partes = max(processos * TAREFAS_POR_PROCESSO, -(-tamanho // RODADAS_POR_TAREFA))
+    with PoolDeExecutores(processos, _Executor, (programa, nomes, profundidade_historico, orcamento)) as pool:
+        for rodadas in pool.executar(dividir(tarefas, partes)):
+            yield from rodadas
@@ -8,6 +8,12 @@
 #
 # Nome do grupo no Canvas: RA2_1
 
+from src.RA1.functions.python.operadores import OPERADORES, ARITMETICO, COMPARACAO, LOGICO
+
+def _producoes_operadores(categoria: str) -> list[list[str]]:
+    # Uma produção por operador da categoria, na ordem do registro central
+    return [[operador.terminal] for operador in OPERADORES if operador.categoria == categoria]
+
 # Símbolo inicial da gramática corrigida
 SIMBOLO_INICIAL = 'PROGRAM'
 
@@ -74,10 +80,11 @@ GRAMATICA_RPN = {
     ],
     
     # Hierarquia de operadores
+    # (terminais dos operadores vêm do registro central, operadores.py)
     'OPERATOR': [['ARITH_OP'], ['COMP_OP'], ['LOGIC_OP']],
-        'ARITH_OP': [['SOMA'], ['SUBTRACAO'], ['MULTIPLICACAO'], ['DIVISAO_INTEIRA'], ['DIVISAO_REAL'], ['RESTO'], ['POTENCIA']],
-    'COMP_OP': [['MENOR'], ['MAIOR'], ['IGUAL'], ['MENOR_IGUAL'], ['MAIOR_IGUAL'], ['DIFERENTE']],
-    'LOGIC_OP': [['AND'], ['OR'], ['NOT']],
+    'ARITH_OP': _producoes_operadores(ARITMETICO),
+    'COMP_OP': _producoes_operadores(COMPARACAO),
+    'LOGIC_OP': _producoes_operadores(LOGICO),
     
     # Estruturas de controle
     'FOR_STRUCT': [['ABRE_PARENTESES', 'NUMERO_REAL', 'FECHA_PARENTESES', 
@@ -93,22 +100,7 @@ MAPEAMENTO_TOKENS = {
     'VARIAVEL': 'IDENTIFIER', 
     'ABRE_PARENTESES': '(',
     'FECHA_PARENTESES': ')',
-    'SOMA': '+',
-    'SUBTRACAO': '-',
-    'MULTIPLICACAO': '*',
-    'DIVISAO_INTEIRA': '/',
-    'DIVISAO_REAL': '|',
-    'RESTO': '%',
-    'POTENCIA': '^',
-    'MENOR': '<',
-    'MAIOR': '>',
-    'IGUAL': '==',
-    'MENOR_IGUAL': '<=',
-    'MAIOR_IGUAL': '>=',
-    'DIFERENTE': '!=',
-    'AND': '&&',
-    'OR': '||',
-    'NOT': '!',
+    **{operador.terminal: operador.lexema for operador in OPERADORES},
     'FOR': 'FOR',
     'WHILE': 'WHILE',
     'IFELSE': 'IFELSE',
@@ -12,6 +12,13 @@ from typing import List, Dict, Tuple, Optional
 from src.RA1.functions.python.tokens import Token
 from .configuracaoGramatica import SIMBOLO_INICIAL, MAPEAMENTO_TOKENS
 
+# Tokens reais conhecidos e mapeamento real -> teórico (o primeiro teórico de cada real),
+# montados uma vez em vez de percorrer MAPEAMENTO_TOKENS a cada token
+_TOKENS_REAIS = frozenset(MAPEAMENTO_TOKENS.values())
+_TEORICO_POR_REAL = {}
+for _teorico, _real in MAPEAMENTO_TOKENS.items():
+    _TEORICO_POR_REAL.setdefault(_real, _teorico)
+
 def parsear(tabela_ll1: Dict, tokens_linha: List[Token]) -> List[str]:
     
     if not tokens_linha:
@@ -31,12 +38,7 @@ def parsear(tabela_ll1: Dict, tokens_linha: List[Token]) -> List[str]:
             # Usar mapeamento existente para outros tokens
             else:
                 # Buscar no mapeamento reverso
-                token_mapeado = None
-                for teorico, real in MAPEAMENTO_TOKENS.items():
-                    if real == token.valor:
-                        token_mapeado = real
-                        break
-                entrada.append(token_mapeado if token_mapeado else MAPEAMENTO_TOKENS['VARIAVEL'])
+                entrada.append(token.valor if token.valor in _TOKENS_REAIS else MAPEAMENTO_TOKENS['VARIAVEL'])
     entrada.append('$')  # Símbolo de fim de cadeia
     
     # Inicializa pilha e índice de entrada
@@ -78,12 +80,7 @@ def parsear(tabela_ll1: Dict, tokens_linha: List[Token]) -> List[str]:
                 producao_teorica = []
                 for simbolo in producao:
                     # Buscar mapeamento reverso
-                    simbolo_teorico = None
-                    for teorico, real in MAPEAMENTO_TOKENS.items():
-                        if real == simbolo:
-                            simbolo_teorico = teorico
-                            break
-                    producao_teorica.append(simbolo_teorico if simbolo_teorico else simbolo)
+                    producao_teorica.append(_TEORICO_POR_REAL.get(simbolo, simbolo))
                         
                 derivacao.append(f"{topo} → {' '.join(producao_teorica)}")
                 